@@ -0,0 +1,29 @@
+"""add pre-rendered summary sections to grammar_topics
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-03-09 10:00:00.000000
+
+Existing summaries are rendered on the next API start (see TopicCatalogue.load).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('grammar_topics', sa.Column('summary_sections', JSONB(), nullable=True))
+    op.add_column('grammar_topics', sa.Column('summary_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('grammar_topics', 'summary_hash')
+    op.drop_column('grammar_topics', 'summary_sections')
@@ -0,0 +1,31 @@
+"""add source_key and content_hash to question_bank
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-03-11 09:00:00.000000
+
+Existing seeded rows are adopted (matched by question text) on the next
+run of seed_question_bank.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('question_bank', sa.Column('source_key', sa.String(length=64), nullable=True))
+    op.add_column('question_bank', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_unique_constraint('question_bank_source_key_key', 'question_bank', ['source_key'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('question_bank_source_key_key', 'question_bank', type_='unique')
+    op.drop_column('question_bank', 'content_hash')
+    op.drop_column('question_bank', 'source_key')
@@ -0,0 +1,35 @@
+"""add precomputed option explanations and bank link on questions
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-03-02 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON
+
+
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('question_bank', sa.Column('option_explanations', JSON(), nullable=True))
+    op.add_column('question_bank', sa.Column('explanations_hash', sa.String(length=64), nullable=True))
+    op.add_column('questions', sa.Column('bank_question_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_questions_bank_question_id', 'questions', 'question_bank',
+        ['bank_question_id'], ['id'], ondelete='SET NULL',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_questions_bank_question_id', 'questions', type_='foreignkey')
+    op.drop_column('questions', 'bank_question_id')
+    op.drop_column('question_bank', 'explanations_hash')
+    op.drop_column('question_bank', 'option_explanations')
@@ -0,0 +1,37 @@
+"""add topic_performance rollup table
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-03-06 14:00:00.000000
+
+Backfill existing history afterwards with: python rebuild_performance_rollup.py
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'topic_performance',
+        sa.Column('topic_id', sa.Integer(), nullable=False),
+        sa.Column('sessions_completed', sa.Integer(), nullable=False),
+        sa.Column('total_questions', sa.Integer(), nullable=False),
+        sa.Column('total_correct', sa.Integer(), nullable=False),
+        sa.Column('recent_scores', JSONB(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['topic_id'], ['grammar_topics.id']),
+        sa.PrimaryKeyConstraint('topic_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('topic_performance')
@@ -1,12 +1,13 @@
 """Analytics API: topic performance stats and AI coaching insights."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.schemas.analytics import PerformanceInsight, PerformanceResponse
 from app.services.analytics_service import AnalyticsService
-from app.services.groq_service import groq_service
+from app.services.insights_cache import insights_cache, performance_fingerprint
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -19,8 +20,12 @@ async def get_performance(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/insights", response_model=PerformanceInsight)
-async def get_insights(db: AsyncSession = Depends(get_db)):
-    """Generate AI coaching feedback based on current performance data."""
+async def get_insights(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """AI coaching feedback for the current performance data, cached per data fingerprint."""
     service = AnalyticsService(db)
     perf = await service.get_performance()
 
@@ -38,32 +43,16 @@ async def get_insights(db: AsyncSession = Depends(get_db)):
             study_plan="Làm bài thi trên nhiều chủ đề khác nhau để hệ thống có thể phân tích điểm mạnh và điểm yếu của bạn.",
         )
 
-    # Build topic summary text for AI prompt
-    lines = []
-    for t in perf.topics:
-        if t.sessions_completed == 0:
-            lines.append(f"- {t.topic_name}: chưa làm bài")
-        else:
-            lines.append(
-                f"- {t.topic_name}: {t.sessions_completed} bài, "
-                f"độ chính xác {t.accuracy_pct}% ({t.level}), "
-                f"xu hướng: {t.trend}"
-            )
-    topic_breakdown = "\n".join(lines)
+    fingerprint = performance_fingerprint(perf)
+    cached = insights_cache.get(fingerprint)
+    if cached is not None:
+        return cached
 
-    raw = await groq_service.generate_insights(
-        overall_accuracy=perf.overall_accuracy,
-        total_sessions=perf.total_sessions,
-        total_questions=perf.total_questions_answered,
-        topic_breakdown=topic_breakdown,
-    )
+    stale = insights_cache.latest()
+    if settings.INSIGHTS_STALE_WHILE_REVALIDATE and stale is not None:
+        # Serve the previous insight now; the fresh one is ready for the next page view
+        background_tasks.add_task(insights_cache.refresh_quietly, fingerprint, perf)
+        response.headers["X-Insights-Stale"] = "1"
+        return stale
 
-    return PerformanceInsight(
-        overall_level=raw.get("overall_level", "Trung bình"),
-        overall_accuracy=perf.overall_accuracy,
-        summary=raw.get("summary", ""),
-        weak_topics=raw.get("weak_topics", []),
-        strong_topics=raw.get("strong_topics", []),
-        recommendations=raw.get("recommendations", []),
-        study_plan=raw.get("study_plan", ""),
-    )
+    return await insights_cache.refresh(fingerprint, perf)
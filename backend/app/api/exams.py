@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+import json
+from collections.abc import AsyncIterator
+from dataclasses import asdict
 
-from app.core.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import get_db, get_session_factory
 from app.schemas.exam import (
     ExamGenerateRequest,
     ExamHistoryResponse,
@@ -9,7 +15,7 @@ from app.schemas.exam import (
     ExamSubmitRequest,
     QuestionResponse,
 )
-from app.services.exam_service import ExamService
+from app.services.exam_service import ExamService, explain_answers_in_background
 
 router = APIRouter(tags=["exams"])
 
@@ -21,13 +27,27 @@ def _hide_answers(session_response: ExamSessionResponse) -> ExamSessionResponse:
     return session_response
 
 
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _explanation_events(
+    response: ExamSessionResponse, session_factory: async_sessionmaker
+) -> AsyncIterator[str]:
+    """Score first, then one event per explanation as it is persisted, then done."""
+    yield _sse_event("score", response.model_dump_json())
+    async with session_factory() as db:
+        async for resolved in ExamService(db).stream_explanations(response.id):
+            yield _sse_event("explanation", json.dumps(asdict(resolved), ensure_ascii=False))
+    yield _sse_event("done", "{}")
+
+
 @router.post("/exams/generate", response_model=ExamSessionResponse)
 async def generate_exam(req: ExamGenerateRequest, db: AsyncSession = Depends(get_db)):
     """Generate a new exam session using ChatGPT."""
     try:
         service = ExamService(db)
-        session = await service.generate_exam(req.topic_id, req.num_questions)
-        response = ExamSessionResponse.model_validate(session)
+        response = await service.generate_exam(req.topic_id, req.num_questions)
         # Don't reveal answers during the exam
         return _hide_answers(response)
     except ValueError as exc:
@@ -40,19 +60,52 @@ async def generate_exam(req: ExamGenerateRequest, db: AsyncSession = Depends(get
 async def submit_exam(
     session_id: int,
     req: ExamSubmitRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
 ):
-    """Submit answers, grade via ChatGPT, return results with explanations."""
+    """Submit answers and return locally scored results; missing explanations follow later."""
     try:
         service = ExamService(db)
         session = await service.submit_exam(session_id, req.answers)
-        return ExamSessionResponse.model_validate(session)
     except LookupError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
-    except RuntimeError as exc:
-        raise HTTPException(status_code=502, detail=str(exc))
+
+    response = ExamSessionResponse.model_validate(session)
+    if settings.EXPLAIN_ON_SUBMIT and any(q.explanation is None for q in response.questions):
+        background_tasks.add_task(explain_answers_in_background, session_factory, session_id)
+    return response
+
+
+@router.post("/exams/{session_id}/submit/stream")
+async def submit_exam_stream(
+    session_id: int,
+    req: ExamSubmitRequest,
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+):
+    """Submit answers and stream results as Server-Sent Events.
+
+    Events: `score` (the scored session), `explanation` ({question_id, explanation, source})
+    for each question that had none, and a final `done`.
+    """
+    try:
+        service = ExamService(db)
+        session = await service.submit_exam(session_id, req.answers)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    response = ExamSessionResponse.model_validate(session)
+    return StreamingResponse(
+        _explanation_events(response, session_factory),
+        media_type="text/event-stream",
+        # X-Accel-Buffering: stop the nginx frontend proxy from holding events back
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/exams/history", response_model=list[ExamHistoryResponse])
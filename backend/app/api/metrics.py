@@ -0,0 +1,25 @@
+"""Metrics API: in-process counters for caches and outbound LLM traffic."""
+
+from fastapi import APIRouter
+
+from app.services.ai_providers import provider_registry
+from app.services.explanation_batcher import explanation_batcher
+from app.services.explanation_cache import explanation_cache
+from app.services.insights_cache import insights_cache
+from app.services.llm_policy import policy_stats
+from app.services.topup_coalescer import topup_coalescer
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics():
+    """Return counters for this worker process (not aggregated across workers)."""
+    return {
+        "ai_topups": topup_coalescer.stats(),
+        "explanation_batcher": explanation_batcher.stats(),
+        "explanation_cache": explanation_cache.stats(),
+        "insights_cache": insights_cache.stats(),
+        "llm_providers": provider_registry.get("router").stats(),
+        "llm_responses": policy_stats.stats(),
+    }
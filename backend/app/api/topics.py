@@ -1,16 +1,71 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.models.grammar_topic import GrammarTopic
-from app.schemas.topic import TopicResponse
+from app.schemas.topic import TopicDetailResponse, TopicResponse, TopicSection
+from app.services.topic_catalogue import CachedBody, etag_matches, topic_catalogue
 
 router = APIRouter(tags=["topics"])
 
+# Clients may reuse the body but must check the ETag first
+REVALIDATE = "public, no-cache"
+
+
+def _cached_response(cached: CachedBody, if_none_match: str | None) -> Response:
+    headers = {"ETag": cached.etag, "Cache-Control": REVALIDATE}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def _loaded_catalogue(db: AsyncSession = Depends(get_db)):
+    # The session only connects if the catalogue has to be built here
+    if not topic_catalogue.is_loaded():
+        await topic_catalogue.load(db)
+    return topic_catalogue
+
 
 @router.get("/topics", response_model=list[TopicResponse])
-async def list_topics(db: AsyncSession = Depends(get_db)):
-    """Return all available grammar topics."""
-    result = await db.execute(select(GrammarTopic).order_by(GrammarTopic.name))
-    return result.scalars().all()
+async def list_topics(
+    if_none_match: str | None = Header(default=None),
+    catalogue=Depends(_loaded_catalogue),
+):
+    """Return all available grammar topics (without summaries).
+
+    Served from memory with a strong ETag; a matching If-None-Match gets a 304
+    without a database round trip.
+    """
+    return _cached_response(catalogue.listing, if_none_match)
+
+
+@router.get("/topics/{slug}", response_model=TopicDetailResponse)
+async def get_topic(
+    slug: str,
+    if_none_match: str | None = Header(default=None),
+    catalogue=Depends(_loaded_catalogue),
+):
+    """Topic with the summary's table of contents and its first section inline."""
+    cached = catalogue.details.get(slug)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Topic not found")
+    return _cached_response(cached, if_none_match)
+
+
+@router.get(
+    "/topics/{slug}/sections/{index}",
+    response_model=TopicSection,
+    response_description="The section's title and pre-rendered HTML",
+)
+async def get_topic_section(
+    slug: str,
+    index: int,
+    if_none_match: str | None = Header(default=None),
+    catalogue=Depends(_loaded_catalogue),
+):
+    """One `##` section of the topic summary, as HTML rendered on the server."""
+    sections = catalogue.sections.get(slug)
+    if sections is None:
+        raise HTTPException(status_code=404, detail="Topic not found")
+    if not 0 <= index < len(sections):
+        raise HTTPException(status_code=404, detail="Section not found")
+    return _cached_response(sections[index], if_none_match)
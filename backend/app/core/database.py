@@ -32,3 +32,7 @@ async def get_db() -> AsyncSession:
             await session.rollback()
             raise
 
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """FastAPI dependency: session factory for work that outlives the request session."""
+    return AsyncSessionLocal
@@ -0,0 +1,121 @@
+"""
+Compact prompt encoding shared by the LLM providers (Groq, Gemini).
+
+Payloads are written as terse pipe-separated rows instead of indented JSON:
+options become one `A;B;C;D` cell (the position is the letter), keys are implied
+by a header line in the template, and fields the model does not need are left
+out. Each builder returns (system prompt, user prompt).
+
+Token counts use tiktoken when it is installed and a heuristic otherwise; see
+benchmarks/bench_prompt_tokens.py for before/after numbers per prompt type.
+"""
+
+import re
+from collections.abc import Iterable
+
+from app.core.prompts import (
+    BANK_GENERATION_SYSTEM_PROMPT,
+    GENERATION_SYSTEM_PROMPT,
+    GENERATION_USER_PROMPT,
+    GRADING_SYSTEM_PROMPT,
+    GRADING_USER_PROMPT,
+    INSIGHTS_SYSTEM_PROMPT,
+    INSIGHTS_USER_PROMPT,
+    OPTION_EXPLANATIONS_SYSTEM_PROMPT,
+    OPTION_EXPLANATIONS_USER_PROMPT,
+)
+
+OPTION_KEYS = ("A", "B", "C", "D")
+_SEPARATORS = re.compile(r"\s*[|\r\n]+\s*")
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+    TOKENIZER = "tiktoken cl100k_base"
+except ImportError:
+    _encoding = None
+    TOKENIZER = "heuristic estimate"
+
+
+def count_tokens(text: str) -> int:
+    """Prompt tokens for text: exact with tiktoken, else ~1 per word piece of up to 4 characters."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return sum(-(-len(piece) // 4) for piece in _TOKEN.findall(text))
+
+
+def _cell(value) -> str:
+    """One row cell: separators and line breaks collapsed to a space."""
+    return _SEPARATORS.sub(" ", str(value)).strip()
+
+
+def encode_options(options: dict[str, str]) -> str:
+    """{"A": "completed", ...} -> "completed;has completed;had completed;completes"."""
+    return ";".join(_cell(options.get(key, "")).replace(";", ",") for key in OPTION_KEYS)
+
+
+def encode_grading_row(item: dict) -> str:
+    answer = item.get("user_answer")
+    return "|".join((
+        str(item["question_id"]),
+        _cell(item["question_text"]),
+        encode_options(item["options"]),
+        item["correct_answer"],
+        answer if answer in OPTION_KEYS else "-",
+    ))
+
+
+def encode_topic_rows(topics: Iterable) -> str:
+    """Per-topic performance rows for the insights prompt (TopicPerformance-like objects)."""
+    rows = []
+    for t in topics:
+        if t.sessions_completed == 0:
+            rows.append(f"{_cell(t.topic_name)}|0|-|-|-")
+        else:
+            rows.append(f"{_cell(t.topic_name)}|{t.sessions_completed}|{t.accuracy_pct}|{t.level}|{t.trend}")
+    return "\n".join(rows)
+
+
+def generation_prompt(topic: str, num_questions: int, with_explanations: bool = False) -> tuple[str, str]:
+    system = BANK_GENERATION_SYSTEM_PROMPT if with_explanations else GENERATION_SYSTEM_PROMPT
+    return system, GENERATION_USER_PROMPT.format(num_questions=num_questions, topic=_cell(topic))
+
+
+def grading_prompt(questions_with_answers: list[dict]) -> tuple[str, str]:
+    rows = "\n".join(encode_grading_row(item) for item in questions_with_answers)
+    return GRADING_SYSTEM_PROMPT, GRADING_USER_PROMPT.format(rows=rows)
+
+
+def option_explanations_prompt(
+    question_text: str, options: dict[str, str], correct_answer: str, explanation: str
+) -> tuple[str, str, list[str]]:
+    """Also returns the wrong options the model is asked about."""
+    wrong_options = [key for key in sorted(options) if key != correct_answer]
+    user = OPTION_EXPLANATIONS_USER_PROMPT.format(
+        question_text=_cell(question_text),
+        options=encode_options(options),
+        correct_answer=correct_answer,
+        explanation=_cell(explanation),
+        wrong_options=",".join(wrong_options),
+    )
+    return OPTION_EXPLANATIONS_SYSTEM_PROMPT, user, wrong_options
+
+
+def insights_prompt(
+    overall_accuracy: float, total_sessions: int, total_questions: int, topic_breakdown: str
+) -> tuple[str, str]:
+    user = INSIGHTS_USER_PROMPT.format(
+        overall_accuracy=overall_accuracy,
+        total_sessions=total_sessions,
+        total_questions=total_questions,
+        topic_breakdown=topic_breakdown,
+    )
+    return INSIGHTS_SYSTEM_PROMPT, user
+
+
+def payload_tokens(item: dict) -> int:
+    """Tokens one question adds to a grading prompt; used for batch token budgets."""
+    return count_tokens(encode_grading_row(item)) + 1
+
@@ -1,75 +1,38 @@
-"""Prompt templates for question generation, grading, and performance insights."""
+"""Prompt templates for question generation, grading, and performance insights.
 
-GENERATION_SYSTEM_PROMPT = """You are a TOEIC grammar expert. Generate multiple-choice questions for TOEIC exam preparation.
+Kept terse: input tokens dominate the LLM bill. Payloads are filled in by
+app/core/prompt_encoding.py, which also documents the row formats used below.
+"""
 
-Return ONLY valid JSON in this exact format:
-{
-  "questions": [
-    {
-      "question_text": "The manager _____ the report before the meeting started.",
-      "options": {"A": "completed", "B": "has completed", "C": "had completed", "D": "completes"},
-      "correct_answer": "C"
-    }
-  ]
-}"""
+GENERATION_SYSTEM_PROMPT = """TOEIC grammar item writer. Reply with JSON only, in this shape:
+{"questions":[{"question_text":"The manager _____ the report before the meeting started.","options":{"A":"completed","B":"has completed","C":"had completed","D":"completes"},"correct_answer":"C"}]}"""
 
-GENERATION_USER_PROMPT = """Generate {num_questions} multiple-choice questions for the grammar topic: "{topic}".
+# Same task, but each item carries what a question_bank row needs (explanation, difficulty)
+BANK_GENERATION_SYSTEM_PROMPT = """TOEIC grammar item writer. Reply with JSON only, in this shape:
+{"questions":[{"question_text":"The manager _____ the report before the meeting started.","options":{"A":"completed","B":"has completed","C":"had completed","D":"completes"},"correct_answer":"C","explanation":"Past perfect marks an action finished before another past action.","difficulty":"medium"}]}
+difficulty: easy|medium|hard"""
 
-Each question must:
-- Test TOEIC-level English grammar for this specific topic
-- Have exactly 4 options labeled A, B, C, D
-- Have exactly one correct answer
-- Use sentence completion or error identification format
-- Be at intermediate to upper-intermediate difficulty level"""
+GENERATION_USER_PROMPT = """{num_questions} questions on "{topic}": TOEIC level, intermediate to upper-intermediate, sentence completion or error identification, options A-D, exactly one correct."""
 
 
-GRADING_SYSTEM_PROMPT = """You are a TOEIC grammar expert. Grade answers and provide clear explanations.
+GRADING_SYSTEM_PROMPT = """TOEIC grammar tutor. For each row explain concisely why the key is right and, if the learner's answer differs, why that choice is wrong. Reply with JSON only, in this shape:
+{"results":[{"question_id":1,"explanation":"..."}]}"""
 
-Return ONLY valid JSON in this exact format:
-{
-  "results": [
-    {
-      "question_id": 1,
-      "is_correct": true,
-      "explanation": "..."
-    }
-  ]
-}"""
+GRADING_USER_PROMPT = """Rows are id|question|options A;B;C;D|key|learner answer (- = none):
+{rows}"""
 
-GRADING_USER_PROMPT = """Grade the following answers and explain each one:
+OPTION_EXPLANATIONS_SYSTEM_PROMPT = """TOEIC grammar tutor. For each listed wrong option, say in one or two sentences what grammar mistake it makes and why it does not fit the sentence. Reply with JSON only, in this shape:
+{"option_explanations":{"A":"...","B":"..."}}"""
 
-{questions_with_answers}
+OPTION_EXPLANATIONS_USER_PROMPT = """Q: {question_text}
+Options A;B;C;D: {options}
+Key: {correct_answer}. {explanation}
+Explain: {wrong_options}"""
 
-For each question, provide:
-- Whether the user's answer is correct (true/false)
-- A concise explanation of why the correct answer is right
-- If the user was wrong, briefly explain why their choice is incorrect"""
+INSIGHTS_SYSTEM_PROMPT = """TOEIC grammar coach. Honest, actionable, encouraging feedback, written in Vietnamese. Reply with JSON only, in this shape:
+{"overall_level":"Mới bắt đầu|Cơ bản|Trung bình|Khá|Giỏi","summary":"2-3 sentences","weak_topics":["topic"],"strong_topics":["topic"],"recommendations":["3-5 specific tips"],"study_plan":"study order and strategy, 2-3 sentences"}"""
 
-INSIGHTS_SYSTEM_PROMPT = """You are an experienced TOEIC grammar coach analyzing a student's performance data.
-Provide honest, actionable, and encouraging feedback in Vietnamese.
-
-Return ONLY valid JSON in this exact format:
-{
-  "overall_level": "string (one of: Mới bắt đầu / Cơ bản / Trung bình / Khá / Giỏi)",
-  "summary": "string (2-3 sentences overall assessment in Vietnamese)",
-  "weak_topics": ["topic name", ...],
-  "strong_topics": ["topic name", ...],
-  "recommendations": ["actionable tip 1", "tip 2", "tip 3", ...],
-  "study_plan": "string (suggested study order and strategy in Vietnamese, 2-3 sentences)"
-}"""
-
-INSIGHTS_USER_PROMPT = """Analyze this student's TOEIC grammar performance and provide coaching feedback in Vietnamese.
-
-Overall accuracy: {overall_accuracy}%
-Total sessions completed: {total_sessions}
-Total questions answered: {total_questions}
-
-Per-topic breakdown:
+INSIGHTS_USER_PROMPT = """Accuracy {overall_accuracy}%, {total_sessions} sessions, {total_questions} questions.
+Topics as name|sessions|accuracy %|level|trend (- = not practiced):
 {topic_breakdown}
-
-Based on this data:
-1. Assess the student's overall level
-2. Identify weak topics (accuracy < 60%) that need immediate focus
-3. Identify strong topics (accuracy ≥ 80%) to acknowledge
-4. Give 3-5 specific, actionable study recommendations
-5. Suggest a practical study plan/order"""
+Weak: accuracy < 60%. Strong: >= 80%."""
@@ -0,0 +1,88 @@
+"""
+Server-side markdown-to-HTML rendering of topic summaries.
+
+A port of the frontend's former utils/markdown-renderer.ts, kept rule-for-rule so the
+pre-rendered HTML matches what the client used to produce: headings, bold/italic,
+inline code, blockquotes, tables, lists, hr and the :::tip/:::example/:::warning boxes.
+"""
+
+import hashlib
+import re
+
+from app.core.topic_sections import split_sections
+
+_BOXES = [
+    (re.compile(r":::tip\n([\s\S]*?):::", re.M), '<div class="tip-box"><strong>💡 Mẹo:</strong> {}</div>'),
+    (re.compile(r":::example\n([\s\S]*?):::", re.M), '<div class="example-box"><strong>📝 Ví dụ:</strong><br>{}</div>'),
+    (re.compile(r":::warning\n([\s\S]*?):::", re.M), '<div class="warning-box"><strong>⚠️ Lưu ý:</strong> {}</div>'),
+]
+
+_SUBSTITUTIONS = [
+    # Headings
+    (re.compile(r"^#### (.+)$", re.M), r"<h4>\1</h4>"),
+    (re.compile(r"^### (.+)$", re.M), r"<h3>\1</h3>"),
+    (re.compile(r"^## (.+)$", re.M), r"<h2>\1</h2>"),
+    # Horizontal rule (before list processing)
+    (re.compile(r"^---$", re.M), "<hr>"),
+    # Bold and italic
+    (re.compile(r"\*\*\*(.+?)\*\*\*"), r"<strong><em>\1</em></strong>"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"\*(.+?)\*"), r"<em>\1</em>"),
+    # Inline code
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    # Blockquotes
+    (re.compile(r"^> (.+)$", re.M), r"<blockquote>\1</blockquote>"),
+]
+
+_TABLE_ROW = re.compile(r"^\|(.+)\|$", re.M)
+_TABLE_BLOCK = re.compile(r"(<tr>[\s\S]*?</tr>\n?)+")
+_SEPARATOR_ROW = re.compile(r"<td>-+</td>")
+_LIST_ITEM = re.compile(r"^- (.+)$", re.M)
+_LIST_BLOCK = re.compile(r"(<li>[\s\S]*?</li>\n?)+")
+_TEXT_LINE = re.compile(r"^(?!<[a-z/])(.+)$", re.M)
+_BLANK_LINES = re.compile(r"\n{2,}")
+
+
+def _table_row(match: re.Match) -> str:
+    cells = [c.strip() for c in match.group(0)[1:-1].split("|")]
+    return "<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>"
+
+
+def _table_block(match: re.Match) -> str:
+    block = match.group(0)
+    rows = [r for r in block.strip().split("\n") if r.startswith("<tr>")]
+    if not rows:
+        return block
+    # Second row is the |---|---| separator
+    head, body = rows[0], rows[2:]
+    thead = head.replace("<td>", "<th>").replace("</td>", "</th>")
+    body_rows = [r for r in body if not _SEPARATOR_ROW.search(r)]
+    return (
+        f'<div class="table-wrapper"><table><thead>{thead}</thead>'
+        f'<tbody>{chr(10).join(body_rows)}</tbody></table></div>'
+    )
+
+
+def render_markdown(text: str) -> str:
+    for pattern, template in _BOXES:
+        text = pattern.sub(lambda m, t=template: t.format(m.group(1).strip()), text)
+    for pattern, replacement in _SUBSTITUTIONS:
+        text = pattern.sub(replacement, text)
+    text = _TABLE_ROW.sub(_table_row, text)
+    text = _TABLE_BLOCK.sub(_table_block, text)
+    text = _LIST_ITEM.sub(r"<li>\1</li>", text)
+    text = _LIST_BLOCK.sub(lambda m: f"<ul>{m.group(0)}</ul>", text)
+    text = _TEXT_LINE.sub(lambda m: f"<p>{m.group(1)}</p>" if m.group(1).strip() else "", text)
+    return _BLANK_LINES.sub("\n", text)
+
+
+def summary_hash(summary: str | None) -> str | None:
+    return hashlib.sha256(summary.encode()).hexdigest() if summary else None
+
+
+def render_summary(summary: str | None, fallback_title: str) -> list[dict]:
+    """Render each `##` section on its own: [{"title": ..., "html": ...}, ...]."""
+    return [
+        {"title": section.title, "html": render_markdown(section.markdown)}
+        for section in split_sections(summary, fallback_title)
+    ]
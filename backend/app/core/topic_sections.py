@@ -0,0 +1,39 @@
+"""Split a topic summary into `##` sections for the table of contents and lazy loading."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class MarkdownSection:
+    index: int
+    title: str
+    markdown: str
+
+
+def split_sections(summary: str | None, fallback_title: str) -> list[MarkdownSection]:
+    """One section per level-2 heading; text before the first heading becomes its own section.
+
+    Headings inside fenced code blocks are ignored. Section markdown keeps its heading line,
+    so every section renders on its own.
+    """
+    if not summary or not summary.strip():
+        return []
+
+    chunks: list[tuple[str, list[str]]] = []
+    title, lines = fallback_title, []
+    in_fence = False
+    for line in summary.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            if any(l.strip() for l in lines):
+                chunks.append((title, lines))
+            title, lines = line[3:].strip(), []
+        lines.append(line)
+    if any(l.strip() for l in lines):
+        chunks.append((title, lines))
+
+    return [
+        MarkdownSection(index=i, title=title, markdown="\n".join(lines).strip())
+        for i, (title, lines) in enumerate(chunks)
+    ]
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,13 +8,56 @@ from fastapi.responses import JSONResponse
 
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.bank_refill_worker import build_worker
+from app.services.question_bank_index import question_bank_index
+from app.services.topic_catalogue import topic_catalogue
 
 logger = logging.getLogger(__name__)
 
+
+async def _warm_up() -> None:
+    try:
+        async with AsyncSessionLocal() as db:
+            await question_bank_index.load(db)
+            await topic_catalogue.load(db)
+    except Exception:
+        # Both are loaded lazily on first use if the warm-up fails
+        logger.exception("Warm-up of in-memory indexes failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the in-memory indexes, keep them fresh and (optionally) keep banks topped up."""
+    background = []
+    if question_bank_index.open_pack():
+        # Exams sample the prebuilt bank pack until the warm-up has loaded the index
+        background.append(asyncio.create_task(_warm_up()))
+    else:
+        await _warm_up()
+
+    background += [
+        asyncio.create_task(
+            question_bank_index.run_refresh_loop(settings.QUESTION_BANK_REFRESH_SECONDS)
+        ),
+        asyncio.create_task(
+            topic_catalogue.run_refresh_loop(settings.TOPIC_CATALOGUE_REFRESH_SECONDS)
+        ),
+    ]
+    if settings.BANK_REFILL_ENABLED:
+        background.append(asyncio.create_task(build_worker().run_forever()))
+    try:
+        yield
+    finally:
+        for task in background:
+            task.cancel()
+
+
 app = FastAPI(
     title="TOEIC Grammar Practice API",
     description="AI-powered TOEIC grammar practice with ChatGPT",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
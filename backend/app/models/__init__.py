@@ -2,5 +2,14 @@ from app.models.grammar_topic import GrammarTopic
 from app.models.exam_session import ExamSession
 from app.models.question import Question
 from app.models.question_bank import QuestionBank
+from app.models.explanation_cache import ExplanationCacheEntry
+from app.models.topic_performance import TopicPerformanceRollup
 
-__all__ = ["GrammarTopic", "ExamSession", "Question", "QuestionBank"]
+__all__ = [
+    "GrammarTopic",
+    "ExamSession",
+    "Question",
+    "QuestionBank",
+    "ExplanationCacheEntry",
+    "TopicPerformanceRollup",
+]
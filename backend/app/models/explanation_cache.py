@@ -0,0 +1,17 @@
+"""Persistent tier of the content-addressed explanation cache."""
+
+from datetime import datetime
+
+from sqlalchemy import String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ExplanationCacheEntry(Base):
+    __tablename__ = "explanation_cache"
+
+    # sha256 of the normalized question, options, correct answer and user answer
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    explanation: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
@@ -1,7 +1,12 @@
 from sqlalchemy import String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
+from app.core.summary_renderer import render_summary, summary_hash
+
+# Default for refresh_rendered_summary: re-render the topic's current summary
+_CURRENT = object()
 
 
 class GrammarTopic(Base):
@@ -12,5 +17,33 @@ class GrammarTopic(Base):
     slug: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Pre-rendered summary, one {"title", "html"} per `##` section; see render_summary
+    summary_sections: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    # sha256 of the summary summary_sections was rendered from
+    summary_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     sessions: Mapped[list["ExamSession"]] = relationship(back_populates="topic_rel")
+
+    @validates("summary")
+    def _render_summary(self, key: str, summary: str | None) -> str | None:
+        """Re-render whenever the summary is assigned through the ORM."""
+        self.refresh_rendered_summary(summary)
+        return summary
+
+    def refresh_rendered_summary(self, summary: str | None = _CURRENT) -> bool:
+        """Render `summary` (default: the current one) unless its hash is unchanged.
+
+        An explicit None clears the rendered sections and the hash.
+        """
+        if summary is _CURRENT:
+            summary = self.summary
+        digest = summary_hash(summary)
+        if digest is None:
+            changed = self.summary_sections is not None or self.summary_hash is not None
+            self.summary_sections = self.summary_hash = None
+            return changed
+        if digest == self.summary_hash and self.summary_sections is not None:
+            return False
+        self.summary_sections = render_summary(summary, self.name or "")
+        self.summary_hash = digest
+        return True
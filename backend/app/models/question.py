@@ -9,6 +9,10 @@ class Question(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     session_id: Mapped[int] = mapped_column(ForeignKey("exam_sessions.id"), nullable=False)
+    # Source bank item; null for AI-generated questions
+    bank_question_id: Mapped[int | None] = mapped_column(
+        ForeignKey("question_bank.id", ondelete="SET NULL"), nullable=True
+    )
     question_number: Mapped[int] = mapped_column(nullable=False)
     question_text: Mapped[str] = mapped_column(Text, nullable=False)
     # {"A": "...", "B": "...", "C": "...", "D": "..."}
@@ -17,5 +17,13 @@ class QuestionBank(Base):
     correct_answer: Mapped[str] = mapped_column(String(1), nullable=False)
     explanation: Mapped[str] = mapped_column(Text, nullable=False)
     difficulty: Mapped[str] = mapped_column(String(10), nullable=False, default="medium")
+    # Stable id of the item in data/question_bank.json; NULL for AI-harvested rows
+    source_key: Mapped[str | None] = mapped_column(String(64), unique=True, nullable=True)
+    # sha256 of the question content (see bank_content_hash); lets the loader skip unchanged rows
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # {"B": "why B is wrong", ...} for every wrong option; filled by precompute_explanations.py
+    option_explanations: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Content hash the option explanations were generated from; lets the job skip unchanged items
+    explanations_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     topic: Mapped["GrammarTopic"] = relationship("GrammarTopic")  # noqa: F821
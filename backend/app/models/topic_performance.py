@@ -0,0 +1,24 @@
+"""Per-topic performance rollup, maintained incrementally by ExamService.submit_exam."""
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+# Length of the recent_scores ring
+RECENT_SCORES = 5
+
+
+class TopicPerformanceRollup(Base):
+    __tablename__ = "topic_performance"
+
+    topic_id: Mapped[int] = mapped_column(ForeignKey("grammar_topics.id"), primary_key=True)
+    sessions_completed: Mapped[int] = mapped_column(nullable=False, default=0)
+    total_questions: Mapped[int] = mapped_column(nullable=False, default=0)
+    total_correct: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Score percentages of the last RECENT_SCORES completed sessions, oldest first
+    recent_scores: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
@@ -0,0 +1,43 @@
+"""Shapes the LLM must return; items that fail validation are dropped and re-requested."""
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+OptionKey = Literal["A", "B", "C", "D"]
+
+
+class GeneratedQuestion(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    question_text: str = Field(min_length=1)
+    options: dict[OptionKey, str]
+    correct_answer: OptionKey
+    explanation: str | None = None
+    difficulty: Literal["easy", "medium", "hard"] = "medium"
+
+    @field_validator("options")
+    @classmethod
+    def _all_options_filled(cls, options: dict[str, str]) -> dict[str, str]:
+        if len(options) != 4 or not all(text.strip() for text in options.values()):
+            raise ValueError("expected non-empty options A-D")
+        return options
+
+    @field_validator("correct_answer", mode="before")
+    @classmethod
+    def _normalize_answer(cls, value):
+        # "b" and "B." are common near misses
+        return value.strip().rstrip(".").upper() if isinstance(value, str) else value
+
+    @field_validator("difficulty", mode="before")
+    @classmethod
+    def _default_unknown_difficulty(cls, value):
+        return value if value in ("easy", "medium", "hard") else "medium"
+
+
+class GradedResult(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    question_id: int
+    is_correct: bool | None = None
+    explanation: str = Field(min_length=1)
@@ -2,10 +2,28 @@ from pydantic import BaseModel, ConfigDict
 
 
 class TopicResponse(BaseModel):
+    """List item: everything the topic grid needs, without the summary body."""
+
     model_config = ConfigDict(from_attributes=True)
 
     id: int
     name: str
     slug: str
     description: str
-    summary: str | None = None
+
+
+class TopicSectionHeading(BaseModel):
+    index: int
+    title: str
+
+
+class TopicSection(TopicSectionHeading):
+    # Pre-rendered on the server; see app/core/summary_renderer.py
+    html: str
+
+
+class TopicDetailResponse(TopicResponse):
+    # Table of contents of the summary, one entry per `##` section
+    toc: list[TopicSectionHeading]
+    # Sent inline so the page can render above-the-fold content without a second request
+    first_section: TopicSection | None = None
@@ -0,0 +1,63 @@
+"""
+Registry of LLM providers, imported and constructed on first use.
+
+Provider SDKs are slow to import (groq, google.generativeai), so nothing here touches
+them until a request actually needs a model. Services call the LLM router (which picks
+among the configured providers) through `ai_service`:
+
+    from app.services.ai_providers import ai_service
+    await ai_service.generate_questions(...)
+"""
+
+import importlib
+import threading
+
+# name -> "module:ClassName"
+PROVIDERS = {
+    "groq": "app.services.groq_service:GroqService",
+    "gemini": "app.services.gemini_service:GeminiService",
+    "router": "app.services.llm_router:LLMRouter",
+}
+
+
+class ProviderRegistry:
+    def __init__(self, providers: dict[str, str]):
+        self._providers = providers
+        self._instances: dict[str, object] = {}
+        # Re-entrant: constructing the router looks up the providers it wraps
+        self._lock = threading.RLock()
+
+    def names(self) -> list[str]:
+        return list(self._providers)
+
+    def loaded(self) -> list[str]:
+        """Providers that have been constructed so far in this process."""
+        return list(self._instances)
+
+    def get(self, name: str):
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        if name not in self._providers:
+            raise ValueError(f"Unknown AI provider {name!r}; expected one of {self.names()}")
+        with self._lock:
+            if name not in self._instances:
+                module_name, class_name = self._providers[name].split(":")
+                provider_class = getattr(importlib.import_module(module_name), class_name)
+                self._instances[name] = provider_class()
+            return self._instances[name]
+
+
+class _RoutedProvider:
+    """Stands in for the LLM router until first attribute access.
+
+    Attributes set on it directly (e.g. by unittest.mock.patch) take precedence.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(provider_registry.get("router"), name)
+
+
+# Singleton instances
+provider_registry = ProviderRegistry(PROVIDERS)
+ai_service = _RoutedProvider()
@@ -1,11 +1,13 @@
 """Analytics service: aggregate user performance stats per topic."""
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, case, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.exam_session import ExamSession
 from app.models.grammar_topic import GrammarTopic
 from app.models.question import Question
+from app.models.topic_performance import RECENT_SCORES, TopicPerformanceRollup
 from app.schemas.analytics import PerformanceResponse, TopicPerformance
 
 
@@ -14,59 +16,28 @@ class AnalyticsService:
         self.db = db
 
     async def get_performance(self) -> PerformanceResponse:
-        """Aggregate per-topic performance stats from completed exam sessions."""
-        # Fetch all topics for full coverage (including untested ones)
-        topics_result = await self.db.execute(select(GrammarTopic).order_by(GrammarTopic.name))
-        all_topics = list(topics_result.scalars().all())
-
-        # Fetch all completed sessions
-        sessions_result = await self.db.execute(
-            select(ExamSession)
-            .where(ExamSession.status == "completed")
-            .order_by(ExamSession.topic_id, ExamSession.completed_at)
+        """Per-topic performance stats read from the rollup table: one query, O(topics)."""
+        result = await self.db.execute(
+            select(GrammarTopic.id, GrammarTopic.name, GrammarTopic.slug, TopicPerformanceRollup)
+            .outerjoin(TopicPerformanceRollup, TopicPerformanceRollup.topic_id == GrammarTopic.id)
+            .order_by(GrammarTopic.name)
         )
-        sessions = list(sessions_result.scalars().all())
-
-        # Group sessions by topic_id
-        sessions_by_topic: dict[int, list[ExamSession]] = {}
-        for s in sessions:
-            sessions_by_topic.setdefault(s.topic_id, []).append(s)
-
-        # Aggregate per-topic correct answer counts from questions table
-        correct_counts_result = await self.db.execute(
-            select(
-                ExamSession.topic_id,
-                func.count(Question.id).label("total"),
-                func.sum(func.cast(Question.is_correct, type_=__import__("sqlalchemy").Integer)).label("correct"),
-            )
-            .join(Question, Question.session_id == ExamSession.id)
-            .where(ExamSession.status == "completed", Question.is_correct.isnot(None))
-            .group_by(ExamSession.topic_id)
-        )
-        question_stats = {row.topic_id: row for row in correct_counts_result}
 
         topic_performances: list[TopicPerformance] = []
         total_sessions = 0
         total_questions_answered = 0
         total_correct_global = 0
 
-        for topic in all_topics:
-            topic_sessions = sessions_by_topic.get(topic.id, [])
-            n = len(topic_sessions)
-            total_sessions += n
+        for topic_id, topic_name, slug, rollup in result.tuples():
+            n = rollup.sessions_completed if rollup else 0
+            total_q = rollup.total_questions if rollup else 0
+            total_c = rollup.total_correct if rollup else 0
+            recent_scores = list(rollup.recent_scores) if rollup else []
 
-            q_stats = question_stats.get(topic.id)
-            total_q = int(q_stats.total) if q_stats else 0
-            total_c = int(q_stats.correct or 0) if q_stats else 0
+            total_sessions += n
             total_questions_answered += total_q
             total_correct_global += total_c
 
-            # Recent score percentages (last 5 sessions)
-            recent_scores = [
-                round((s.score / s.total * 100) if s.total else 0, 1)
-                for s in topic_sessions[-5:]
-            ]
-
             # Average score % per session
             avg_score_pct = round(sum(recent_scores) / len(recent_scores), 1) if recent_scores else 0.0
 
@@ -80,9 +51,9 @@ class AnalyticsService:
             trend = _compute_trend(recent_scores)
 
             topic_performances.append(TopicPerformance(
-                topic_id=topic.id,
-                topic_name=topic.name,
-                slug=topic.slug,
+                topic_id=topic_id,
+                topic_name=topic_name,
+                slug=slug,
                 sessions_completed=n,
                 total_questions=total_q,
                 total_correct=total_c,
@@ -106,6 +77,85 @@ class AnalyticsService:
             has_data=total_sessions > 0,
         )
 
+    async def record_session(self, session: ExamSession, num_answered: int) -> None:
+        """Fold one completed session into its topic's rollup row, in the caller's transaction.
+
+        A single upsert, so concurrent submits for the same topic can't lose updates.
+        """
+        stmt = insert(TopicPerformanceRollup).values(
+            topic_id=session.topic_id,
+            sessions_completed=1,
+            total_questions=num_answered,
+            total_correct=session.score,
+            recent_scores=[_score_pct(session)],
+        )
+        merged = TopicPerformanceRollup.recent_scores.op("||", return_type=JSONB)(stmt.excluded.recent_scores)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TopicPerformanceRollup.topic_id],
+                set_={
+                    "sessions_completed": TopicPerformanceRollup.sessions_completed + 1,
+                    "total_questions": TopicPerformanceRollup.total_questions + stmt.excluded.total_questions,
+                    "total_correct": TopicPerformanceRollup.total_correct + stmt.excluded.total_correct,
+                    # The ring holds at most RECENT_SCORES, so one append drops at most one entry
+                    "recent_scores": case(
+                        (
+                            func.jsonb_array_length(merged) > RECENT_SCORES,
+                            merged.op("-", return_type=JSONB)(literal(0)),
+                        ),
+                        else_=merged,
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def rebuild_rollup(self) -> int:
+        """Recompute every rollup row from full session history; return topics written.
+
+        For backfills and repairs only. Runs in the caller's transaction.
+        """
+        sessions_result = await self.db.execute(
+            select(ExamSession)
+            .where(ExamSession.status == "completed")
+            .order_by(ExamSession.topic_id, ExamSession.completed_at)
+        )
+        sessions_by_topic: dict[int, list[ExamSession]] = {}
+        for s in sessions_result.scalars():
+            sessions_by_topic.setdefault(s.topic_id, []).append(s)
+
+        counts_result = await self.db.execute(
+            select(
+                ExamSession.topic_id,
+                func.count(Question.id).label("total"),
+                func.sum(func.cast(Question.is_correct, Integer)).label("correct"),
+            )
+            .join(Question, Question.session_id == ExamSession.id)
+            .where(ExamSession.status == "completed", Question.is_correct.isnot(None))
+            .group_by(ExamSession.topic_id)
+        )
+        question_stats = {row.topic_id: row for row in counts_result}
+
+        rows = [
+            {
+                "topic_id": topic_id,
+                "sessions_completed": len(topic_sessions),
+                "total_questions": int(question_stats[topic_id].total) if topic_id in question_stats else 0,
+                "total_correct": int(question_stats[topic_id].correct or 0) if topic_id in question_stats else 0,
+                "recent_scores": [_score_pct(s) for s in topic_sessions[-RECENT_SCORES:]],
+            }
+            for topic_id, topic_sessions in sessions_by_topic.items()
+        ]
+
+        await self.db.execute(delete(TopicPerformanceRollup))
+        if rows:
+            await self.db.execute(insert(TopicPerformanceRollup), rows)
+        return len(rows)
+
+
+def _score_pct(session: ExamSession) -> float:
+    return round((session.score / session.total * 100) if session.total else 0, 1)
+
 
 def _classify_level(accuracy_pct: float, session_count: int) -> str:
     if session_count == 0:
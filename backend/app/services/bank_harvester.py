@@ -0,0 +1,120 @@
+"""Promote validated AI-generated questions into the question bank, skipping near-duplicates."""
+
+import hashlib
+import json
+import logging
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.question_bank import QuestionBank
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.question_bank_index import question_bank_index
+
+logger = logging.getLogger(__name__)
+
+OPTION_KEYS = {"A", "B", "C", "D"}
+DIFFICULTIES = {"easy", "medium", "hard"}
+
+
+def bank_content_hash(row: dict) -> str:
+    """sha256 over the content columns of a question_bank row (option order is irrelevant)."""
+    payload = json.dumps(
+        [row["question_text"], row["options"], row["correct_answer"], row["explanation"], row["difficulty"]],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def to_bank_row(topic_id: int, q: dict) -> dict | None:
+    """Validate one generated question; return question_bank column values or None."""
+    options = q.get("options")
+    if (
+        not isinstance(q.get("question_text"), str)
+        or not q["question_text"].strip()
+        or not isinstance(options, dict)
+        or set(options) != OPTION_KEYS
+        or not all(isinstance(v, str) and v.strip() for v in options.values())
+        or q.get("correct_answer") not in OPTION_KEYS
+        or not isinstance(q.get("explanation"), str)
+        or not q["explanation"].strip()
+    ):
+        return None
+    row = {
+        "topic_id": topic_id,
+        "question_text": q["question_text"].strip(),
+        "options": {key: options[key].strip() for key in sorted(options)},
+        "correct_answer": q["correct_answer"],
+        "explanation": q["explanation"].strip(),
+        "difficulty": q.get("difficulty") if q.get("difficulty") in DIFFICULTIES else "medium",
+    }
+    row["content_hash"] = bank_content_hash(row)
+    return row
+
+
+class BankHarvester:
+    """Per-topic near-duplicate indexes, fed incrementally from the question bank index."""
+
+    def __init__(self):
+        # topic_id -> (index, highest bank id already added to it)
+        self._indexes: dict[int, tuple[NearDuplicateIndex, int]] = {}
+
+    def _synced_index(self, topic_id: int) -> NearDuplicateIndex:
+        dedup, seen_id = self._indexes.get(topic_id) or (NearDuplicateIndex(), 0)
+        for payload in question_bank_index.payloads_since(topic_id, seen_id):
+            dedup.add(payload["bank_question_id"], payload["question_text"])
+            seen_id = payload["bank_question_id"]
+        self._indexes[topic_id] = (dedup, seen_id)
+        return dedup
+
+    async def promote(self, db: AsyncSession, topic_id: int, questions: list[dict]) -> list[int | None]:
+        """Insert the valid, novel questions into the bank in one statement.
+
+        Returns, parallel to `questions`, the bank id each one was stored under, or
+        None for invalid questions and near-duplicates of existing or earlier ones.
+        The caller commits, then refreshes question_bank_index for the topic; doing it
+        before the commit would let exams sample rows that might still roll back. The
+        shared dedup index picks the new rows up from there as well, so a batch that
+        rolls back leaves nothing behind in it.
+        """
+        await question_bank_index.ensure_topic(db, topic_id)
+        dedup = self._synced_index(topic_id)
+        # Earlier questions of this batch, keyed by position; same hashing as `dedup`
+        batch = NearDuplicateIndex(dedup.num_perm, dedup.bands, dedup.threshold)
+
+        accepted: list[tuple[int, dict]] = []
+        for pos, q in enumerate(questions):
+            row = to_bank_row(topic_id, q)
+            if not row:
+                continue
+            signature = dedup.signature(row["question_text"])
+            if (
+                dedup.find_duplicate(row["question_text"], signature) is not None
+                or batch.find_duplicate(row["question_text"], signature) is not None
+            ):
+                continue
+            batch.add(pos, row["question_text"], signature)
+            accepted.append((pos, row))
+
+        bank_ids: list[int | None] = [None] * len(questions)
+        if not accepted:
+            return bank_ids
+
+        result = await db.execute(
+            insert(QuestionBank).returning(QuestionBank.id, sort_by_parameter_order=True),
+            [row for _, row in accepted],
+        )
+        new_ids = list(result.scalars())
+        for (pos, _), bank_id in zip(accepted, new_ids):
+            bank_ids[pos] = bank_id
+
+        logger.info(
+            "Harvested %d of %d generated questions into bank for topic %d",
+            len(new_ids), len(questions), topic_id,
+        )
+        return bank_ids
+
+
+# Singleton instance
+bank_harvester = BankHarvester()
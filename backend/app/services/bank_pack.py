@@ -0,0 +1,170 @@
+"""
+Compact binary pack of the question bank, read zero-copy through mmap.
+
+Lets processes that need the bank without the database skip parsing the JSON
+data file: opening a pack maps it and reads a fixed-size header, and pages are
+shared between every process on the host. The API samples exams from it while
+question_bank_index is still warming up (see QuestionBankIndex.open_pack).
+
+Layout (little-endian):
+
+    header      magic "QBPK", version u16, reserved u16, topic count u32,
+                question count u32, topics/questions/strings offsets u64
+    topics      per topic: slug string ref, first question u32, question count u32
+    questions   fixed 60-byte records: question text, options A-D, explanation and
+                source key string refs, correct answer u8, difficulty u8, 2 pad bytes
+    strings     UTF-8 string table; a string ref is (offset u32, length u32) into it,
+                identical strings are stored once
+
+Build from data/question_bank.json:
+
+    python -m app.services.bank_pack [--data data/question_bank.json] [--out data/question_bank.pack]
+"""
+
+import argparse
+import json
+import mmap
+import random
+import struct
+from pathlib import Path
+
+MAGIC = b"QBPK"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIQQQ")
+_TOPIC = struct.Struct("<IIII")
+_QUESTION = struct.Struct("<" + "II" * 7 + "BBxx")
+
+OPTION_KEYS = ("A", "B", "C", "D")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+DEFAULT_DATA = Path(__file__).resolve().parents[2] / "data" / "question_bank.json"
+DEFAULT_PACK = DEFAULT_DATA.with_suffix(".pack")
+
+
+class _StringTable:
+    def __init__(self):
+        self._buffer = bytearray()
+        self._refs: dict[str, tuple[int, int]] = {}
+
+    def ref(self, text: str) -> tuple[int, int]:
+        found = self._refs.get(text)
+        if found is None:
+            data = text.encode()
+            found = self._refs[text] = (len(self._buffer), len(data))
+            self._buffer += data
+        return found
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+
+def build_pack(topics: dict[str, list[dict]], path: Path) -> int:
+    """Write the pack for {slug: [question dict, ...]}; return its size in bytes."""
+    strings = _StringTable()
+    topic_records, question_records = [], []
+    for slug, questions in topics.items():
+        topic_records.append(_TOPIC.pack(*strings.ref(slug), len(question_records), len(questions)))
+        for q in questions:
+            refs = [
+                strings.ref(q["question_text"]),
+                *(strings.ref(q["options"][key]) for key in OPTION_KEYS),
+                strings.ref(q["explanation"]),
+                strings.ref(q.get("source_key") or ""),
+            ]
+            question_records.append(_QUESTION.pack(
+                *(n for ref in refs for n in ref),
+                OPTION_KEYS.index(q["correct_answer"]),
+                DIFFICULTIES.index(q.get("difficulty", "medium")),
+            ))
+
+    topics_off = _HEADER.size
+    questions_off = topics_off + _TOPIC.size * len(topic_records)
+    strings_off = questions_off + _QUESTION.size * len(question_records)
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(topic_records), len(question_records),
+        topics_off, questions_off, strings_off,
+    )
+    data = header + b"".join(topic_records) + b"".join(question_records) + strings.getvalue()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    # Atomic swap: processes that already mapped the old pack keep reading it
+    tmp.replace(path)
+    return len(data)
+
+
+class BankPack:
+    """Read-only view over a mapped pack; questions are decoded only when accessed."""
+
+    def __init__(self, path: Path = DEFAULT_PACK):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is too short to be a question bank pack")
+        self._view = memoryview(self._mmap)
+        magic, version, _, topic_count, self.question_count, topics_off, self._questions_off, self._strings_off = (
+            _HEADER.unpack_from(self._view, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} question bank pack")
+
+        # slug -> (first question, count); a handful of entries, read eagerly
+        self._topics: dict[str, tuple[int, int]] = {}
+        for i in range(topic_count):
+            slug_off, slug_len, first, count = _TOPIC.unpack_from(self._view, topics_off + i * _TOPIC.size)
+            self._topics[self._string(slug_off, slug_len)] = (first, count)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "BankPack":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def topics(self) -> list[str]:
+        return list(self._topics)
+
+    def count(self, slug: str) -> int:
+        return self._topics.get(slug, (0, 0))[1]
+
+    def question(self, slug: str, index: int) -> dict:
+        first, count = self._topics[slug]
+        if not 0 <= index < count:
+            raise IndexError(index)
+        fields = _QUESTION.unpack_from(self._view, self._questions_off + (first + index) * _QUESTION.size)
+        text, a, b, c, d, explanation, source_key = (
+            self._string(fields[i], fields[i + 1]) for i in range(0, 14, 2)
+        )
+        return {
+            "source_key": source_key or None,
+            "question_text": text,
+            "options": dict(zip(OPTION_KEYS, (a, b, c, d))),
+            "correct_answer": OPTION_KEYS[fields[14]],
+            "explanation": explanation,
+            "difficulty": DIFFICULTIES[fields[15]],
+        }
+
+    def sample(self, slug: str, k: int) -> list[dict]:
+        """Up to k random questions of a topic; decodes only the picked records."""
+        picks = random.sample(range(self.count(slug)), min(k, self.count(slug)))
+        return [self.question(slug, i) for i in picks]
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_off + offset
+        return str(self._view[start:start + length], "utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the question bank data file into a binary pack.")
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA, help="question data file (JSON)")
+    parser.add_argument("--out", type=Path, default=DEFAULT_PACK, help="pack to write")
+    args = parser.parse_args()
+
+    topics = json.loads(args.data.read_text(encoding="utf-8"))["topics"]
+    size = build_pack(topics, args.out)
+    print(f"Wrote {args.out} ({size:,} bytes, {sum(len(q) for q in topics.values())} questions)")
@@ -0,0 +1,135 @@
+"""
+Background worker that keeps every topic's question bank above a low watermark,
+so generate_exam's synchronous LLM fallback is only needed in emergencies.
+
+Runs inside the FastAPI lifespan when BANK_REFILL_ENABLED is set, or standalone:
+
+    python -m app.services.bank_refill_worker [--once]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.grammar_topic import GrammarTopic
+from app.models.question_bank import QuestionBank
+from app.services.ai_providers import ai_service
+from app.services.bank_harvester import bank_harvester
+from app.services.question_bank_index import question_bank_index
+
+logger = logging.getLogger(__name__)
+
+
+class BankRefillWorker:
+    def __init__(
+        self,
+        low_watermark: int,
+        batch_size: int,
+        scan_interval: float,
+        min_call_interval: float,
+        max_backoff: float,
+    ):
+        self.low_watermark = low_watermark
+        self.batch_size = batch_size
+        self.scan_interval = scan_interval
+        self.min_call_interval = min_call_interval
+        self.max_backoff = max_backoff
+        self._last_call = 0.0
+        # topic_id -> (consecutive failures, monotonic time before which the topic is skipped)
+        self._backoff: dict[int, tuple[int, float]] = {}
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                added = await self.run_once()
+            except Exception:
+                logger.exception("Question bank refill scan failed")
+                added = 0
+            # Keep going straight away while topics are still being filled
+            await asyncio.sleep(self.min_call_interval if added else self.scan_interval)
+
+    async def run_once(self) -> int:
+        """Make one refill call per topic below the watermark; return questions added."""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(GrammarTopic.id, GrammarTopic.name, func.count(QuestionBank.id))
+                .outerjoin(QuestionBank, QuestionBank.topic_id == GrammarTopic.id)
+                .group_by(GrammarTopic.id, GrammarTopic.name)
+                .order_by(func.count(QuestionBank.id))
+            )
+            short = [(tid, name, count) for tid, name, count in result if count < self.low_watermark]
+
+        added = 0
+        now = time.monotonic()
+        for topic_id, topic_name, count in short:
+            if self._backoff.get(topic_id, (0, 0.0))[1] > now:
+                continue
+            added += await self._refill_topic(topic_id, topic_name, count)
+        return added
+
+    async def _refill_topic(self, topic_id: int, topic_name: str, count: int) -> int:
+        wanted = min(self.batch_size, self.low_watermark - count)
+        await self._pace()
+        try:
+            generated = await ai_service.refill_questions(topic_name, wanted)
+        except (RuntimeError, ValueError) as exc:
+            self._fail(topic_id, exc)
+            return 0
+
+        async with AsyncSessionLocal() as db:
+            bank_ids = await bank_harvester.promote(db, topic_id, generated)
+            await db.commit()
+            await question_bank_index.refresh_topic(db, topic_id)
+
+        added = sum(1 for bank_id in bank_ids if bank_id)
+        if not added:
+            self._fail(topic_id, ValueError("no valid, non-duplicate questions in response"))
+            return 0
+
+        self._backoff.pop(topic_id, None)
+        logger.info("Refilled %d questions for topic %s (%d -> %d)", added, topic_name, count, count + added)
+        return added
+
+    async def _pace(self) -> None:
+        """Simple rate limit: at least min_call_interval between LLM calls."""
+        wait = self._last_call + self.min_call_interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._last_call = time.monotonic()
+
+    def _fail(self, topic_id: int, exc: Exception) -> None:
+        failures = self._backoff.get(topic_id, (0, 0.0))[0] + 1
+        delay = min(self.max_backoff, self.min_call_interval * 2 ** failures)
+        # Jitter so topics that failed together don't retry together
+        delay = random.uniform(delay / 2, delay)
+        self._backoff[topic_id] = (failures, time.monotonic() + delay)
+        logger.warning("Refill for topic %d failed (%s); retrying in %.0fs", topic_id, exc, delay)
+
+
+def build_worker() -> BankRefillWorker:
+    return BankRefillWorker(
+        low_watermark=settings.BANK_REFILL_LOW_WATERMARK,
+        batch_size=settings.BANK_REFILL_BATCH_SIZE,
+        scan_interval=settings.BANK_REFILL_INTERVAL_SECONDS,
+        min_call_interval=settings.BANK_REFILL_MIN_CALL_INTERVAL_SECONDS,
+        max_backoff=settings.BANK_REFILL_MAX_BACKOFF_SECONDS,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep question banks above the low watermark.")
+    parser.add_argument("--once", action="store_true", help="run a single scan and exit")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    worker = build_worker()
+    if args.once:
+        print(f"Added {asyncio.run(worker.run_once())} questions.")
+    else:
+        asyncio.run(worker.run_forever())
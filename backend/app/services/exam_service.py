@@ -1,102 +1,158 @@
 """Exam business logic: generate, submit, history, review."""
 
-import random
+import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from app.models.exam_session import ExamSession
 from app.models.grammar_topic import GrammarTopic
 from app.models.question import Question
-from app.models.question_bank import QuestionBank
-from app.services.groq_service import groq_service as ai_service
+from app.schemas.exam import ExamSessionResponse, QuestionResponse
+from app.services.analytics_service import AnalyticsService
+from app.services.bank_harvester import bank_harvester
+from app.services.explanation_service import ExplanationService, ResolvedExplanation
+from app.services.question_bank_index import question_bank_index
+from app.services.topup_coalescer import topup_coalescer
+
+logger = logging.getLogger(__name__)
 
 
 class ExamService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _get_bank_questions(self, topic_id: int, num_questions: int) -> list[dict]:
-        """Pull random questions from the question bank for a topic."""
-        # Get total available
-        count_result = await self.db.execute(
-            select(func.count()).where(QuestionBank.topic_id == topic_id)
-        )
-        total = count_result.scalar_one()
-        if total == 0:
-            return []
-
-        # Fetch all for the topic, then sample randomly in Python
-        result = await self.db.execute(
-            select(QuestionBank).where(QuestionBank.topic_id == topic_id)
-        )
-        bank_items = list(result.scalars().all())
-        sample = random.sample(bank_items, min(num_questions, len(bank_items)))
-        random.shuffle(sample)
-
-        return [
-            {
-                "question_text": q.question_text,
-                "options": q.options,
-                "correct_answer": q.correct_answer,
-                "explanation": q.explanation,
-            }
-            for q in sample
-        ]
+    async def _get_bank_questions(self, topic: GrammarTopic, num_questions: int) -> list[dict]:
+        """Pull random questions for a topic from the in-memory bank index."""
+        if question_bank_index.warming_up and not question_bank_index.is_loaded(topic.id):
+            # Startup load still running: sample the bank pack rather than query per topic
+            return question_bank_index.sample_pack(topic.slug, num_questions)
+        await question_bank_index.ensure_topic(self.db, topic.id)
+        return question_bank_index.sample(topic.id, num_questions)
 
-    async def generate_exam(self, topic_id: int, num_questions: int) -> ExamSession:
+    async def generate_exam(self, topic_id: int, num_questions: int) -> ExamSessionResponse:
         """Generate exam from question bank (instant); fall back to AI if bank is short."""
         topic = await self.db.get(GrammarTopic, topic_id)
         if not topic:
             raise ValueError(f"Topic {topic_id} not found")
 
         # Try question bank first
-        raw_questions = await self._get_bank_questions(topic_id, num_questions)
+        raw_questions = await self._get_bank_questions(topic, num_questions)
 
         # If bank doesn't have enough, top up with AI-generated questions
         if len(raw_questions) < num_questions:
-            ai_count = num_questions - len(raw_questions)
-            ai_questions = await ai_service.generate_questions(topic.name, ai_count)
+            ai_questions = []
+            # Concurrent exams for this topic share one generation; each gets its own questions
+            stream = topup_coalescer.top_up(
+                topic_id,
+                topic.name,
+                num_questions - len(raw_questions),
+                exclude_texts=[q["question_text"] for q in raw_questions],
+            )
+            try:
+                async with aclosing(stream):
+                    async for q in stream:
+                        ai_questions.append(q)
+            except (RuntimeError, ValueError) as exc:
+                # Bank questions (or earlier top-ups) on hand: serve those rather than fail
+                if not raw_questions and not ai_questions:
+                    raise
+                logger.warning(
+                    "AI top-up for topic %d failed, serving %d questions: %s",
+                    topic_id, len(raw_questions) + len(ai_questions), exc,
+                )
+            # Keep them for the next learner: valid, novel ones go into the bank
+            bank_ids = await bank_harvester.promote(self.db, topic_id, ai_questions)
+            for q, bank_id in zip(ai_questions, bank_ids):
+                q["bank_question_id"] = bank_id
             raw_questions.extend(ai_questions)
+            if not raw_questions:
+                raise ValueError(f"No questions available for topic {topic.name}")
+
+            # If top-ups still came up short, serve the shorter exam rather than none
+            response = await self._persist_exam(topic, len(raw_questions), raw_questions)
+            if any(bank_ids):
+                await self.db.commit()
+                await question_bank_index.refresh_topic(self.db, topic_id)
+            return response
+
+        return await self._persist_exam(topic, num_questions, raw_questions)
+
+    async def _persist_exam(
+        self, topic: GrammarTopic, num_questions: int, raw_questions: list[dict]
+    ) -> ExamSessionResponse:
+        """Insert the session and all its questions in one statement; build the response from it.
+
+        The session insert runs as a data-modifying CTE whose id feeds a multi-row
+        question insert, so the whole write is a single round trip with no re-read.
+        """
+        assert raw_questions, "an exam needs at least one question"
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        new_session = (
+            insert(ExamSession)
+            .values(
+                topic_id=topic.id,
+                topic=topic.name,
+                num_questions=num_questions,
+                total=num_questions,
+                status="in_progress",
+                created_at=created_at,
+            )
+            .returning(ExamSession.id)
+            .cte("new_session")
+        )
+        session_id = select(new_session.c.id).scalar_subquery()
 
-        # Persist exam session
-        session = ExamSession(
-            topic_id=topic_id,
+        rows = [
+            {
+                "session_id": session_id,
+                "bank_question_id": q.get("bank_question_id"),
+                "question_number": idx,
+                "question_text": q["question_text"],
+                "options": q["options"],
+                "correct_answer": q["correct_answer"],
+                # Pre-fill explanation from bank; AI questions won't have it yet
+                "explanation": q.get("explanation"),
+            }
+            for idx, q in enumerate(raw_questions, start=1)
+        ]
+        result = await self.db.execute(
+            insert(Question)
+            .values(rows)
+            .returning(Question.id, Question.session_id, Question.question_number)
+            .add_cte(new_session)
+        )
+        returned = result.all()
+        ids_by_number = {row.question_number: row.id for row in returned}
+
+        return ExamSessionResponse(
+            id=returned[0].session_id,
             topic=topic.name,
             num_questions=num_questions,
+            score=None,
             total=num_questions,
             status="in_progress",
+            created_at=created_at,
+            completed_at=None,
+            questions=[
+                QuestionResponse(
+                    id=ids_by_number[row["question_number"]],
+                    question_number=row["question_number"],
+                    question_text=row["question_text"],
+                    options=row["options"],
+                    correct_answer=row["correct_answer"],
+                    explanation=row["explanation"],
+                )
+                for row in rows
+            ],
         )
-        self.db.add(session)
-        await self.db.flush()
-
-        # Persist questions
-        for idx, q in enumerate(raw_questions, start=1):
-            question = Question(
-                session_id=session.id,
-                question_number=idx,
-                question_text=q["question_text"],
-                options=q["options"],
-                correct_answer=q["correct_answer"],
-                # Pre-fill explanation from bank; AI questions won't have it yet
-                explanation=q.get("explanation"),
-            )
-            self.db.add(question)
-
-        await self.db.flush()
-        await self.db.refresh(session)
-
-        result = await self.db.execute(
-            select(ExamSession)
-            .options(selectinload(ExamSession.questions))
-            .where(ExamSession.id == session.id)
-        )
-        return result.scalar_one()
 
     async def submit_exam(self, session_id: int, answers: dict[int, str]) -> ExamSession:
-        """Grade exam: save user answers, call OpenAI for explanations, update records."""
+        """Score exam locally against stored answers and commit; no LLM on this path."""
         result = await self.db.execute(
             select(ExamSession)
             .options(selectinload(ExamSession.questions))
@@ -108,49 +164,54 @@ class ExamService:
         if session.status == "completed":
             raise ValueError("Exam already submitted")
 
-        # Save user answers
-        for question in session.questions:
-            question.user_answer = answers.get(question.id)
-
-        # Build grading payload for OpenAI
-        questions_payload = [
-            {
-                "question_id": q.id,
-                "question_text": q.question_text,
-                "options": q.options,
-                "correct_answer": q.correct_answer,
-                "user_answer": q.user_answer or "No answer",
-            }
-            for q in session.questions
-        ]
-
-        grading_results = await ai_service.grade_answers(questions_payload)
-
-        # Map results by question_id
-        results_by_id = {r["question_id"]: r for r in grading_results}
-
+        await question_bank_index.ensure_topic(self.db, session.topic_id)
         score = 0
         for question in session.questions:
-            graded = results_by_id.get(question.id, {})
-            question.is_correct = graded.get("is_correct", False)
-            question.explanation = graded.get("explanation", "")
+            question.user_answer = answers.get(question.id)
+            question.is_correct = question.user_answer == question.correct_answer
             if question.is_correct:
                 score += 1
+            elif question.bank_question_id and question.user_answer:
+                # Precomputed "why your choice is wrong" for bank items: no LLM call needed
+                why_wrong = question_bank_index.option_explanation(
+                    session.topic_id, question.bank_question_id, question.user_answer
+                )
+                if why_wrong:
+                    question.explanation = "\n\n".join(filter(None, [question.explanation, why_wrong]))
 
-        # Update session
         session.score = score
         session.status = "completed"
         session.completed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        await AnalyticsService(self.db).record_session(session, num_answered=len(session.questions))
+
+        # Results are final from here on; explanations are filled in afterwards
+        await self.db.commit()
+        return session
 
-        await self.db.flush()
+    async def stream_explanations(self, session_id: int) -> AsyncIterator[ResolvedExplanation]:
+        """Fill missing explanations one by one, committing each as soon as it arrives.
 
-        # Reload fresh
+        Runs after scoring is committed and only ever writes `explanation`, so a slow
+        or failing provider cannot change correctness.
+        """
         result = await self.db.execute(
-            select(ExamSession)
-            .options(selectinload(ExamSession.questions))
-            .where(ExamSession.id == session_id)
+            select(Question)
+            .where(Question.session_id == session_id, Question.explanation.is_(None))
+            .order_by(Question.question_number)
         )
-        return result.scalar_one()
+        questions = {q.id: q for q in result.scalars().all()}
+
+        async for resolved in ExplanationService(self.db).resolve(list(questions.values())):
+            questions[resolved.question_id].explanation = resolved.explanation
+            await self.db.commit()
+            yield resolved
+
+    async def explain_answers(self, session_id: int) -> int:
+        """Fill every missing explanation for a session; return how many were filled."""
+        filled = 0
+        async for _ in self.stream_explanations(session_id):
+            filled += 1
+        return filled
 
     async def get_history(self, limit: int = 20, offset: int = 0) -> list[ExamSession]:
         """Fetch past sessions ordered newest first."""
@@ -182,3 +243,13 @@ class ExamService:
             .order_by(Question.question_number)
         )
         return list(result.scalars().all())
+
+
+async def explain_answers_in_background(session_factory: async_sessionmaker, session_id: int) -> None:
+    """Second submit phase, run after the response is sent, on its own DB session."""
+    async with session_factory() as db:
+        try:
+            await ExamService(db).explain_answers(session_id)
+        except Exception:
+            await db.rollback()
+            logger.exception("Background explanation failed for session %d", session_id)
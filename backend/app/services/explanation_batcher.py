@@ -0,0 +1,100 @@
+"""
+Micro-batching of LLM explanation requests across concurrent exam submits.
+
+Every explanation request waits up to a few milliseconds for others to join, then
+one combined grading request goes out for the whole batch. Results stream back per
+question, so each caller is woken as soon as its own explanation arrives instead of
+when the batch finishes. A batch is sent early once it reaches its token budget or
+item cap. At peak this turns dozens of small requests per second into a few larger
+ones, saving per-request overhead and provider rate-limit slots.
+"""
+
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.prompt_encoding import payload_tokens
+from app.services.join_window import JoinWindows
+from app.services.llm_policy import grade_with_policy
+
+logger = logging.getLogger(__name__)
+
+
+class _Batch:
+    def __init__(self):
+        # question_id -> (payload, waiters)
+        self.items: dict[int, tuple[dict, list[asyncio.Future]]] = {}
+        self.tokens = 0
+
+
+class ExplanationBatcher:
+    def __init__(
+        self,
+        window_ms: float | None = None,
+        max_tokens: int | None = None,
+        max_items: int | None = None,
+    ):
+        window = (settings.EXPLAIN_BATCH_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_tokens = max_tokens or settings.EXPLAIN_BATCH_MAX_TOKENS
+        self.max_items = max_items or settings.EXPLAIN_BATCH_MAX_ITEMS
+        # A single window: every request can share a batch
+        self._windows = JoinWindows(window, _Batch, self._send)
+        self.requests = 0
+        self.full_flushes = 0
+
+    async def explain(self, item: dict) -> str | None:
+        """The explanation for one grading payload item (keyed by question_id), or None."""
+        future = asyncio.get_running_loop().create_future()
+        self.requests += 1
+        tokens = payload_tokens(item)
+        batch = self._windows.current()
+        if batch is not None and batch.tokens + tokens > self.max_tokens:
+            self._flush_full()
+        batch = self._windows.join()
+
+        entry = batch.items.get(item["question_id"])
+        if entry is None:
+            batch.items[item["question_id"]] = (item, [future])
+            batch.tokens += tokens
+        else:
+            entry[1].append(future)
+        if len(batch.items) >= self.max_items or batch.tokens >= self.max_tokens:
+            self._flush_full()
+        return await future
+
+    def stats(self) -> dict:
+        batches = self._windows.flushes
+        return {
+            "requests": self.requests,
+            "batches": batches,
+            "full_flushes": self.full_flushes,
+            "avg_batch_size": round(self.requests / batches, 2) if batches else 0.0,
+            "in_flight": self._windows.in_flight,
+        }
+
+    def _flush_full(self) -> None:
+        self.full_flushes += self._windows.flush()
+
+    async def _send(self, batch: _Batch) -> None:
+        def deliver(result: dict) -> None:
+            entry = batch.items.get(result["question_id"])
+            for future in entry[1] if entry else ():
+                if not future.done():
+                    future.set_result(result["explanation"])
+
+        try:
+            await grade_with_policy([item for item, _ in batch.items.values()], on_result=deliver)
+        except (RuntimeError, ValueError) as exc:
+            logger.warning("Explanation batch of %d failed: %s", len(batch.items), exc)
+        except Exception:
+            logger.exception("Explanation batch of %d failed", len(batch.items))
+        finally:
+            # Questions the model never answered resolve to "no explanation"
+            for _, waiters in batch.items.values():
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(None)
+
+
+# Singleton instance
+explanation_batcher = ExplanationBatcher()
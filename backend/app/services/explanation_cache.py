@@ -0,0 +1,106 @@
+"""Content-addressed explanation cache: in-process LRU in front of a Postgres table."""
+
+import hashlib
+import json
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.explanation_cache import ExplanationCacheEntry
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def explanation_cache_key(
+    question_text: str,
+    options: dict[str, str],
+    correct_answer: str,
+    user_answer: str | None,
+) -> str:
+    """sha256 over the normalized inputs that determine an explanation.
+
+    Whitespace and case differences don't produce new keys, and option order is irrelevant.
+    """
+    payload = json.dumps(
+        [
+            _normalize(question_text),
+            {key.upper(): _normalize(value) for key, value in options.items()},
+            correct_answer.upper(),
+            (user_answer or "").upper(),
+        ],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ExplanationCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    async def get_many(self, db: AsyncSession, keys: list[str]) -> dict[str, tuple[str, str]]:
+        """Look keys up in memory, then in one query against Postgres.
+
+        Returns {key: (explanation, tier)} for hits; tier is "memory" or "db".
+        """
+        found: dict[str, tuple[str, str]] = {}
+        missing = []
+        for key in keys:
+            explanation = self._memory.get(key)
+            if explanation is None:
+                missing.append(key)
+                continue
+            self._memory.move_to_end(key)
+            found[key] = (explanation, "memory")
+            self.memory_hits += 1
+
+        if missing:
+            result = await db.execute(
+                select(ExplanationCacheEntry.key, ExplanationCacheEntry.explanation)
+                .where(ExplanationCacheEntry.key.in_(missing))
+            )
+            for key, explanation in result:
+                self._remember(key, explanation)
+                found[key] = (explanation, "db")
+                self.db_hits += 1
+            self.misses += len(missing) - sum(1 for key in missing if key in found)
+
+        return found
+
+    async def put(self, db: AsyncSession, key: str, explanation: str) -> None:
+        """Store in both tiers; the caller's transaction commits the row."""
+        self._remember(key, explanation)
+        await db.execute(
+            insert(ExplanationCacheEntry)
+            .values(key=key, explanation=explanation)
+            .on_conflict_do_nothing(index_elements=[ExplanationCacheEntry.key])
+        )
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.db_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, explanation: str) -> None:
+        self._memory[key] = explanation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# Singleton instance
+explanation_cache = ExplanationCache(settings.EXPLANATION_CACHE_SIZE)
@@ -0,0 +1,79 @@
+"""Resolve per-question explanations after an exam is scored, cheapest source first."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.question import Question
+from app.services.explanation_batcher import explanation_batcher
+from app.services.explanation_cache import explanation_cache, explanation_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedExplanation:
+    question_id: int
+    explanation: str
+    # "cache" | "llm"
+    source: str
+
+
+class ExplanationService:
+    """Yields explanations for questions that don't have one yet, as each becomes available.
+
+    Never decides correctness; `is_correct` is already final when this runs.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def resolve(self, questions: list[Question]) -> AsyncIterator[ResolvedExplanation]:
+        pending = [q for q in questions if q.explanation is None]
+        if not pending:
+            return
+
+        keys = {
+            q.id: explanation_cache_key(q.question_text, q.options, q.correct_answer, q.user_answer)
+            for q in pending
+        }
+        cached = await explanation_cache.get_many(self.db, list(keys.values()))
+        for q in pending:
+            if keys[q.id] in cached:
+                yield ResolvedExplanation(question_id=q.id, explanation=cached[keys[q.id]][0], source="cache")
+
+        misses = [q for q in pending if keys[q.id] not in cached]
+        if not misses or not settings.EXPLAIN_ON_SUBMIT:
+            return
+
+        # One request per question; the batcher merges them with those of concurrent
+        # submits into shared LLM calls, and each result still streams out as it lands
+        tasks = [asyncio.create_task(self._explain_with_llm(q)) for q in misses]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                resolved = await next_done
+                if resolved:
+                    await explanation_cache.put(self.db, keys[resolved.question_id], resolved.explanation)
+                    yield resolved
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _explain_with_llm(self, question: Question) -> ResolvedExplanation | None:
+        explanation = await explanation_batcher.explain(
+            {
+                "question_id": question.id,
+                "question_text": question.question_text,
+                "options": question.options,
+                "correct_answer": question.correct_answer,
+                "user_answer": question.user_answer or "No answer",
+            }
+        )
+        if not explanation:
+            logger.warning("No explanation for question %d", question.id)
+            return None
+        return ResolvedExplanation(question_id=question.id, explanation=explanation, source="llm")
@@ -1,54 +1,139 @@
-"""Google Gemini integration for question generation and answer grading."""
+"""Google Gemini integration for question generation, grading and insights."""
 
 import json
 import logging
-
-import google.generativeai as genai
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
-from app.core.prompts import (
-    GENERATION_SYSTEM_PROMPT,
-    GENERATION_USER_PROMPT,
-    GRADING_SYSTEM_PROMPT,
-    GRADING_USER_PROMPT,
+from app.core.prompt_encoding import (
+    generation_prompt,
+    grading_prompt,
+    insights_prompt,
+    option_explanations_prompt,
 )
+from app.services.json_stream import collect_salvaged, loads_lenient, stream_array_items
+
+if TYPE_CHECKING:
+    import google.generativeai
 
 logger = logging.getLogger(__name__)
 
 
+async def _close_stream(response) -> None:
+    """Stop a streamed response the consumer quit early, releasing its connection.
+
+    The SDK response has no public close; the transport iterator it wraps does.
+    """
+    aclose = getattr(getattr(response, "_iterator", None), "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 class GeminiService:
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
         self.model_name = settings.GEMINI_MODEL
+        self._genai = None
+        # One model per system prompt; there are only a handful of prompts
+        self._models: dict[str, "google.generativeai.GenerativeModel"] = {}
 
-    def _get_model(self, system_prompt: str) -> genai.GenerativeModel:
-        return genai.GenerativeModel(
-            model_name=self.model_name,
-            system_instruction=system_prompt,
-        )
+    @property
+    def is_configured(self) -> bool:
+        return bool(settings.GEMINI_API_KEY)
 
-    async def generate_questions(self, topic: str, num_questions: int) -> list[dict]:
-        """Call Gemini to generate TOEIC grammar questions for a topic."""
-        user_prompt = GENERATION_USER_PROMPT.format(
-            num_questions=num_questions,
-            topic=topic,
-        )
-        response = await self._call_gemini(GENERATION_SYSTEM_PROMPT, user_prompt)
-        data = self._parse_json(response)
-        questions = data.get("questions", [])
-        if not questions or len(questions) != num_questions:
-            raise ValueError(
-                f"Gemini returned {len(questions)} questions, expected {num_questions}"
+    @property
+    def genai(self) -> "google.generativeai":
+        """The SDK module, imported and configured on first use."""
+        if self._genai is None:
+            import google.generativeai as genai
+
+            genai.configure(api_key=settings.GEMINI_API_KEY)
+            self._genai = genai
+        return self._genai
+
+    def _get_model(self, system_prompt: str) -> "google.generativeai.GenerativeModel":
+        model = self._models.get(system_prompt)
+        if model is None:
+            model = self._models[system_prompt] = self.genai.GenerativeModel(
+                model_name=self.model_name,
+                system_instruction=system_prompt,
             )
-        return questions
+        return model
+
+    async def stream_questions(
+        self, topic: str, num_questions: int, with_explanations: bool = False
+    ) -> AsyncIterator[dict]:
+        """Stream up to num_questions TOEIC grammar questions for a topic from Gemini.
+
+        Each question is yielded as soon as its JSON object is complete. with_explanations
+        also asks for `explanation` and `difficulty`, as needed for bank rows.
+        """
+        system_prompt, user_prompt = generation_prompt(topic, num_questions, with_explanations)
+        produced = 0
+        chunks = self._stream_gemini(system_prompt, user_prompt)
+        async with aclosing(stream_array_items(chunks, "questions")) as items:
+            async for question in items:
+                produced += 1
+                yield question
+                if produced >= num_questions:
+                    break
+        if not produced:
+            raise ValueError(f"Gemini returned no questions, expected {num_questions}")
+
+    async def generate_questions(
+        self, topic: str, num_questions: int, with_explanations: bool = False
+    ) -> list[dict]:
+        """Collect stream_questions, keeping what arrived before a failure; callers top up the rest."""
+        return await collect_salvaged(self.stream_questions(topic, num_questions, with_explanations))
+
+    async def stream_grades(self, questions_with_answers: list[dict]) -> AsyncIterator[dict]:
+        """Grade submitted answers with Gemini, yielding each per-question result as it completes."""
+        system_prompt, user_prompt = grading_prompt(questions_with_answers)
+        produced = 0
+        chunks = self._stream_gemini(system_prompt, user_prompt)
+        async with aclosing(stream_array_items(chunks, "results")) as items:
+            async for result in items:
+                produced += 1
+                yield result
+        if not produced and questions_with_answers:
+            raise ValueError("Gemini returned no grading results")
 
     async def grade_answers(self, questions_with_answers: list[dict]) -> list[dict]:
-        """Call Gemini to grade submitted answers and produce per-question explanations."""
-        formatted = json.dumps(questions_with_answers, ensure_ascii=False, indent=2)
-        user_prompt = GRADING_USER_PROMPT.format(questions_with_answers=formatted)
-        response = await self._call_gemini(GRADING_SYSTEM_PROMPT, user_prompt)
-        data = self._parse_json(response)
-        return data.get("results", [])
+        """Collect stream_grades; questions missing from a truncated answer are left out."""
+        return await collect_salvaged(self.stream_grades(questions_with_answers))
+
+    async def generate_insights(
+        self,
+        overall_accuracy: float,
+        total_sessions: int,
+        total_questions: int,
+        topic_breakdown: str,
+    ) -> dict:
+        """Call Gemini to generate personalized coaching insights in Vietnamese."""
+        system_prompt, user_prompt = insights_prompt(
+            overall_accuracy, total_sessions, total_questions, topic_breakdown
+        )
+        response = await self._call_gemini(system_prompt, user_prompt)
+        return self._parse_json(response)
+
+    async def explain_options(
+        self,
+        question_text: str,
+        options: dict[str, str],
+        correct_answer: str,
+        explanation: str,
+    ) -> dict[str, str]:
+        """Call Gemini to explain why each wrong option of a question is wrong."""
+        system_prompt, user_prompt, wrong_options = option_explanations_prompt(
+            question_text, options, correct_answer, explanation
+        )
+        response = await self._call_gemini(system_prompt, user_prompt)
+        data = self._parse_json(response).get("option_explanations", {})
+        missing = [key for key in wrong_options if not data.get(key)]
+        if missing:
+            raise ValueError(f"Gemini returned no explanation for options {missing}")
+        return {key: data[key] for key in wrong_options}
 
     async def _call_gemini(self, system_prompt: str, user_prompt: str) -> str:
         """Make a single Gemini chat completion call with JSON mode."""
@@ -56,7 +141,7 @@ class GeminiService:
             model = self._get_model(system_prompt)
             response = await model.generate_content_async(
                 user_prompt,
-                generation_config=genai.types.GenerationConfig(
+                generation_config=self.genai.types.GenerationConfig(
                     response_mime_type="application/json",
                 ),
             )
@@ -65,14 +150,31 @@ class GeminiService:
             logger.error("Gemini API call failed: %s", exc)
             raise RuntimeError(f"Gemini API error: {exc}") from exc
 
+    async def _stream_gemini(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Make a streaming Gemini call with JSON mode; yield text deltas."""
+        try:
+            model = self._get_model(system_prompt)
+            response = await model.generate_content_async(
+                user_prompt,
+                generation_config=self.genai.types.GenerationConfig(
+                    response_mime_type="application/json",
+                ),
+                stream=True,
+            )
+            try:
+                async for chunk in response:
+                    if chunk.parts:
+                        yield chunk.text
+            finally:
+                await _close_stream(response)
+        except Exception as exc:
+            logger.error("Gemini streaming call failed: %s", exc)
+            raise RuntimeError(f"Gemini API error: {exc}") from exc
+
     def _parse_json(self, raw: str) -> dict:
-        """Parse JSON response; raise ValueError on malformed output."""
+        """Parse JSON response, repairing near-valid output; raise ValueError if unrecoverable."""
         try:
-            return json.loads(raw)
+            return loads_lenient(raw)
         except json.JSONDecodeError as exc:
             logger.error("Failed to parse Gemini JSON response: %s", raw[:200])
             raise ValueError(f"Invalid JSON from Gemini: {exc}") from exc
-
-
-# Singleton instance
-gemini_service = GeminiService()
@@ -2,41 +2,74 @@
 
 import json
 import logging
-
-from groq import AsyncGroq
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
-from app.core.prompts import (
-    GENERATION_SYSTEM_PROMPT,
-    GENERATION_USER_PROMPT,
-    GRADING_SYSTEM_PROMPT,
-    GRADING_USER_PROMPT,
-    INSIGHTS_SYSTEM_PROMPT,
-    INSIGHTS_USER_PROMPT,
+from app.core.prompt_encoding import (
+    generation_prompt,
+    grading_prompt,
+    insights_prompt,
+    option_explanations_prompt,
 )
+from app.services.json_stream import collect_salvaged, loads_lenient, stream_array_items
+
+if TYPE_CHECKING:
+    from groq import AsyncGroq
 
 logger = logging.getLogger(__name__)
 
 
 class GroqService:
     def __init__(self):
-        self.client = AsyncGroq(api_key=settings.GROQ_API_KEY)
         self.model = settings.GROQ_MODEL
+        self._client: "AsyncGroq | None" = None
 
-    async def generate_questions(self, topic: str, num_questions: int) -> list[dict]:
-        """Call Groq to generate TOEIC grammar questions for a topic."""
-        user_prompt = GENERATION_USER_PROMPT.format(
-            num_questions=num_questions,
-            topic=topic,
-        )
-        response = await self._call_groq(GENERATION_SYSTEM_PROMPT, user_prompt)
-        data = self._parse_json(response)
-        questions = data.get("questions", [])
-        if not questions or len(questions) != num_questions:
-            raise ValueError(
-                f"Groq returned {len(questions)} questions, expected {num_questions}"
+    @property
+    def is_configured(self) -> bool:
+        return bool(settings.GROQ_API_KEY)
+
+    @property
+    def client(self) -> "AsyncGroq":
+        """The SDK client, imported and constructed on first use (the groq package is slow to import)."""
+        if self._client is None:
+            from groq import AsyncGroq
+
+            # One client per process: its httpx pool keeps connections warm across calls.
+            # SDK retries stay low so the router can fail over instead of waiting.
+            self._client = AsyncGroq(
+                api_key=settings.GROQ_API_KEY,
+                timeout=settings.AI_CALL_TIMEOUT_SECONDS,
+                max_retries=1,
             )
-        return questions
+        return self._client
+
+    async def stream_questions(
+        self, topic: str, num_questions: int, with_explanations: bool = False
+    ) -> AsyncIterator[dict]:
+        """Stream up to num_questions TOEIC grammar questions for a topic from Groq.
+
+        Each question is yielded as soon as its JSON object is complete. with_explanations
+        also asks for `explanation` and `difficulty`, as needed for bank rows.
+        """
+        system_prompt, user_prompt = generation_prompt(topic, num_questions, with_explanations)
+        produced = 0
+        chunks = self._stream_groq(system_prompt, user_prompt)
+        async with aclosing(stream_array_items(chunks, "questions")) as items:
+            async for question in items:
+                produced += 1
+                yield question
+                if produced >= num_questions:
+                    break
+        if not produced:
+            raise ValueError(f"Groq returned no questions, expected {num_questions}")
+
+    async def generate_questions(
+        self, topic: str, num_questions: int, with_explanations: bool = False
+    ) -> list[dict]:
+        """Collect stream_questions, keeping what arrived before a failure; callers top up the rest."""
+        return await collect_salvaged(self.stream_questions(topic, num_questions, with_explanations))
 
     async def generate_insights(
         self,
@@ -46,22 +79,45 @@ class GroqService:
         topic_breakdown: str,
     ) -> dict:
         """Call Groq to generate personalized coaching insights in Vietnamese."""
-        user_prompt = INSIGHTS_USER_PROMPT.format(
-            overall_accuracy=overall_accuracy,
-            total_sessions=total_sessions,
-            total_questions=total_questions,
-            topic_breakdown=topic_breakdown,
+        system_prompt, user_prompt = insights_prompt(
+            overall_accuracy, total_sessions, total_questions, topic_breakdown
         )
-        response = await self._call_groq(INSIGHTS_SYSTEM_PROMPT, user_prompt)
+        response = await self._call_groq(system_prompt, user_prompt)
         return self._parse_json(response)
 
+    async def stream_grades(self, questions_with_answers: list[dict]) -> AsyncIterator[dict]:
+        """Grade submitted answers with Groq, yielding each per-question result as it completes."""
+        system_prompt, user_prompt = grading_prompt(questions_with_answers)
+        produced = 0
+        chunks = self._stream_groq(system_prompt, user_prompt)
+        async with aclosing(stream_array_items(chunks, "results")) as items:
+            async for result in items:
+                produced += 1
+                yield result
+        if not produced and questions_with_answers:
+            raise ValueError("Groq returned no grading results")
+
     async def grade_answers(self, questions_with_answers: list[dict]) -> list[dict]:
-        """Call Groq to grade submitted answers and produce per-question explanations."""
-        formatted = json.dumps(questions_with_answers, ensure_ascii=False, indent=2)
-        user_prompt = GRADING_USER_PROMPT.format(questions_with_answers=formatted)
-        response = await self._call_groq(GRADING_SYSTEM_PROMPT, user_prompt)
-        data = self._parse_json(response)
-        return data.get("results", [])
+        """Collect stream_grades; questions missing from a truncated answer are left out."""
+        return await collect_salvaged(self.stream_grades(questions_with_answers))
+
+    async def explain_options(
+        self,
+        question_text: str,
+        options: dict[str, str],
+        correct_answer: str,
+        explanation: str,
+    ) -> dict[str, str]:
+        """Call Groq to explain why each wrong option of a question is wrong."""
+        system_prompt, user_prompt, wrong_options = option_explanations_prompt(
+            question_text, options, correct_answer, explanation
+        )
+        response = await self._call_groq(system_prompt, user_prompt)
+        data = self._parse_json(response).get("option_explanations", {})
+        missing = [key for key in wrong_options if not data.get(key)]
+        if missing:
+            raise ValueError(f"Groq returned no explanation for options {missing}")
+        return {key: data[key] for key in wrong_options}
 
     async def _call_groq(self, system_prompt: str, user_prompt: str) -> str:
         """Make a single Groq chat completion call with JSON mode."""
@@ -79,14 +135,31 @@ class GroqService:
             logger.error("Groq API call failed: %s", exc)
             raise RuntimeError(f"Groq API error: {exc}") from exc
 
+    async def _stream_groq(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Make a streaming Groq chat completion call with JSON mode; yield text deltas."""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            # Closing hands the connection back to the pool when the consumer stops early
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        except Exception as exc:
+            logger.error("Groq streaming call failed: %s", exc)
+            raise RuntimeError(f"Groq API error: {exc}") from exc
+
     def _parse_json(self, raw: str) -> dict:
-        """Parse JSON response; raise ValueError on malformed output."""
+        """Parse JSON response, repairing near-valid output; raise ValueError if unrecoverable."""
         try:
-            return json.loads(raw)
+            return loads_lenient(raw)
         except json.JSONDecodeError as exc:
             logger.error("Failed to parse Groq JSON response: %s", raw[:200])
             raise ValueError(f"Invalid JSON from Groq: {exc}") from exc
-
-
-# Singleton instance
-groq_service = GroqService()
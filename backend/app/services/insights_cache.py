@@ -0,0 +1,114 @@
+"""Cache of AI coaching insights keyed by a fingerprint of the performance data."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+
+from app.core.prompt_encoding import encode_topic_rows
+from app.schemas.analytics import PerformanceInsight, PerformanceResponse
+from app.services.ai_providers import ai_service
+
+logger = logging.getLogger(__name__)
+
+
+def performance_fingerprint(perf: PerformanceResponse) -> str:
+    """Hash of everything the insight prompt is built from.
+
+    Any newly completed session changes the counts, so it changes the fingerprint:
+    cached insights invalidate themselves without explicit hooks.
+    """
+    payload = json.dumps(
+        [
+            perf.total_sessions,
+            perf.total_questions_answered,
+            perf.overall_accuracy,
+            [
+                [t.topic_id, t.sessions_completed, t.total_questions, t.total_correct, t.accuracy_pct, t.trend]
+                for t in perf.topics
+            ],
+        ]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def generate_insight(perf: PerformanceResponse) -> PerformanceInsight:
+    """Ask the LLM for coaching feedback on the given performance data."""
+    raw = await ai_service.generate_insights(
+        overall_accuracy=perf.overall_accuracy,
+        total_sessions=perf.total_sessions,
+        total_questions=perf.total_questions_answered,
+        topic_breakdown=encode_topic_rows(perf.topics),
+    )
+
+    return PerformanceInsight(
+        overall_level=raw.get("overall_level", "Trung bình"),
+        overall_accuracy=perf.overall_accuracy,
+        summary=raw.get("summary", ""),
+        weak_topics=raw.get("weak_topics", []),
+        strong_topics=raw.get("strong_topics", []),
+        recommendations=raw.get("recommendations", []),
+        study_plan=raw.get("study_plan", ""),
+    )
+
+
+class InsightsCache:
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, PerformanceInsight] = OrderedDict()
+        self._latest: PerformanceInsight | None = None
+        # One LLM call per fingerprint, however many page views arrive meanwhile
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fingerprint: str) -> PerformanceInsight | None:
+        insight = self._entries.get(fingerprint)
+        if insight is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(fingerprint)
+        self.hits += 1
+        return insight
+
+    def latest(self) -> PerformanceInsight | None:
+        """Most recently generated insight, whatever data it was generated for."""
+        return self._latest
+
+    async def refresh(self, fingerprint: str, perf: PerformanceResponse) -> PerformanceInsight:
+        task = self._in_flight.get(fingerprint)
+        if task is None:
+            task = asyncio.create_task(generate_insight(perf))
+            self._in_flight[fingerprint] = task
+            task.add_done_callback(lambda t: self._store(fingerprint, t))
+        return await asyncio.shield(task)
+
+    async def refresh_quietly(self, fingerprint: str, perf: PerformanceResponse) -> None:
+        """Background revalidation: failures are logged, the stale insight stays served."""
+        try:
+            await self.refresh(fingerprint, perf)
+        except Exception:
+            logger.exception("Background insight refresh failed")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_flight": len(self._in_flight),
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _store(self, fingerprint: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(fingerprint, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[fingerprint] = self._latest = task.result()
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Singleton instance
+insights_cache = InsightsCache()
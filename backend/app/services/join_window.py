@@ -0,0 +1,79 @@
+"""
+Short join windows: concurrent callers that arrive close together share one unit of work.
+
+The first caller for a key opens a window holding a batch object; later callers join
+the same batch until the window expires or its owner flushes it early (e.g. because it
+is full). A flushed batch is handed to the owner's coroutine, which runs as a task on
+the loop the window was opened on. Used by explanation_batcher and topup_coalescer.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Generic, TypeVar
+
+B = TypeVar("B")
+
+
+class _Window(Generic[B]):
+    __slots__ = ("batch", "loop", "timer")
+
+    def __init__(self, batch: B, loop: asyncio.AbstractEventLoop):
+        self.batch = batch
+        self.loop = loop
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class JoinWindows(Generic[B]):
+    def __init__(
+        self,
+        window_seconds: float,
+        new_batch: Callable[..., B],
+        send: Callable[[B], Coroutine[object, object, None]],
+    ):
+        self.window = window_seconds
+        self._new_batch = new_batch
+        self._send = send
+        # key -> window still accepting callers
+        self._open: dict[Hashable, _Window[B]] = {}
+        # Strong references so sent batches are not garbage collected mid-flight
+        self._sending: set[asyncio.Task] = set()
+        self.flushes = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._sending)
+
+    def current(self, key: Hashable = None) -> B | None:
+        """The batch of the open window for key, if there is one on the running loop."""
+        window = self._open.get(key)
+        if window is not None and window.loop is not asyncio.get_running_loop():
+            # Left over from an event loop that has since closed (tests, reloads)
+            del self._open[key]
+            window = None
+        return window.batch if window is not None else None
+
+    def join(self, key: Hashable = None, *args) -> B:
+        """The batch of the open window for key, opening one with new_batch(*args) if there is none."""
+        batch = self.current(key)
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            window = self._open[key] = _Window(self._new_batch(*args), loop)
+            window.timer = loop.call_later(self.window, self._expire, key, window)
+            batch = window.batch
+        return batch
+
+    def flush(self, key: Hashable = None) -> bool:
+        """Send the open window for key now; False if there was none."""
+        window = self._open.pop(key, None)
+        if window is None:
+            return False
+        window.timer.cancel()
+        self.flushes += 1
+        task = window.loop.create_task(self._send(window.batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+        return True
+
+    def _expire(self, key: Hashable, window: _Window[B]) -> None:
+        if self._open.get(key) is window:
+            self.flush(key)
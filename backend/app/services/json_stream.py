@@ -0,0 +1,171 @@
+"""Incremental extraction of array elements from a streamed JSON object."""
+
+import json
+import logging
+import re
+from collections import Counter
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from contextlib import aclosing
+
+logger = logging.getLogger(__name__)
+
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+# Process-wide counts of lenient decodes, reported under /api/metrics
+repair_counts: Counter = Counter()
+
+
+def repair_json(raw: str) -> str:
+    """Cheap local fixes for near-valid model output: markdown fences, prose around
+    the outermost object or array, and trailing commas."""
+    text = _FENCE.sub("", raw)
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if starts:
+        start = min(starts)
+        end = text.rfind("}" if text[start] == "{" else "]")
+        if end > start:
+            text = text[start:end + 1]
+    return _TRAILING_COMMA.sub(r"\1", text)
+
+
+def loads_lenient(raw: str):
+    """json.loads that tolerates raw control characters in strings and, failing that,
+    retries once on repair_json(raw). Raises json.JSONDecodeError if both fail."""
+    try:
+        return json.loads(raw, strict=False)
+    except json.JSONDecodeError:
+        repaired = repair_json(raw)
+        if repaired == raw:
+            repair_counts["unrepairable"] += 1
+            raise
+    try:
+        value = json.loads(repaired, strict=False)
+    except json.JSONDecodeError:
+        repair_counts["unrepairable"] += 1
+        raise
+    repair_counts["repaired"] += 1
+    return value
+
+
+class ArrayItemParser:
+    """Yields each object of a top-level array, e.g. `questions` in {"questions": [{...}, ...]},
+    as soon as its closing brace arrives.
+
+    Only the structure is tracked while scanning (depth, strings, escapes); each element
+    is decoded with loads_lenient once complete. An unrepairable element is skipped, and
+    whatever follows an unterminated element (a truncated response) is never yielded,
+    so the valid prefix of a broken completion is salvaged.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        # Last string closed at depth 1, and whether a ':' followed it (i.e. it is a key)
+        self._last_string: str | None = None
+        self._current_key: str | None = None
+        self._in_target = False
+        self._item_start = -1
+        self.skipped = 0
+
+    def feed(self, chunk: str) -> list[dict]:
+        self._buffer += chunk
+        items = []
+        buffer = self._buffer
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = buffer[self._string_start + 1:pos]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char == ":" and self._depth == 1:
+                self._current_key = self._last_string
+            elif char in "{[":
+                if self._depth == 1 and char == "[" and self._current_key == self.key:
+                    self._in_target = True
+                elif self._in_target and self._depth == 2 and char == "{":
+                    self._item_start = pos
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._in_target and self._depth == 2 and char == "}" and self._item_start >= 0:
+                    item = self._decode(buffer[self._item_start:pos + 1])
+                    if item is not None:
+                        items.append(item)
+                    self._item_start = -1
+                elif self._in_target and self._depth == 1:
+                    self._in_target = False
+            elif char == "," and self._depth == 1:
+                self._current_key = None
+        self._pos = len(buffer)
+        self._compact()
+        return items
+
+    def _decode(self, raw: str) -> dict | None:
+        try:
+            item = loads_lenient(raw)
+        except json.JSONDecodeError:
+            self.skipped += 1
+            logger.warning("Skipping malformed streamed %s item: %s", self.key, raw[:120])
+            return None
+        return item if isinstance(item, dict) else None
+
+    def _compact(self) -> None:
+        """Drop consumed text that no open element or string still refers to."""
+        keep_from = self._pos
+        if self._item_start >= 0:
+            keep_from = min(keep_from, self._item_start)
+        if self._in_string:
+            keep_from = min(keep_from, self._string_start)
+        if keep_from > 0:
+            self._buffer = self._buffer[keep_from:]
+            self._pos -= keep_from
+            if self._item_start >= 0:
+                self._item_start -= keep_from
+            if self._string_start >= 0:
+                self._string_start -= keep_from
+
+
+async def stream_array_items(chunks: AsyncGenerator[str, None], key: str) -> AsyncIterator[dict]:
+    """Feed text chunks through an ArrayItemParser, yielding items as they complete.
+
+    The chunk stream is closed as soon as the consumer stops; the provider chunk
+    streams (_stream_groq, _stream_gemini) close their SDK stream in turn, so the
+    HTTP response is released instead of read to the end.
+    """
+    parser = ArrayItemParser(key)
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            for item in parser.feed(chunk):
+                yield item
+
+
+async def collect_salvaged(items: AsyncIterable[dict]) -> list[dict]:
+    """Drain a stream of items; if it fails after yielding some, keep that prefix.
+
+    Raises only when the stream failed before producing anything.
+    """
+    collected: list[dict] = []
+    try:
+        async for item in items:
+            collected.append(item)
+    except (RuntimeError, ValueError) as exc:
+        if not collected:
+            raise
+        logger.warning("Stream failed after %d items, keeping them: %s", len(collected), exc)
+    return collected
@@ -0,0 +1,167 @@
+"""
+Bulkhead for outbound LLM calls: a priority-ordered concurrency limiter and a
+circuit breaker, one of each per provider (see LLMRouter).
+
+When a provider's slots are busy, callers queue by priority (lower number first,
+FIFO within a priority). The queue is bounded; when it is full a more urgent call
+evicts the least urgent waiter instead of being turned away, so provider quota
+goes to the paths learners are waiting on.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class LimiterRejected(RuntimeError):
+    """The call was not started: queue full, or evicted by a more urgent call."""
+
+
+class PriorityLimiter:
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        priority_names: dict[int, str] | None = None,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.priority_names = priority_names or {}
+        self._in_flight = 0
+        # Heap of [priority, seq, future]
+        self._waiters: list[list] = []
+        self._seq = itertools.count()
+        self.rejected = 0
+        self.evicted = 0
+        # priority -> [calls admitted, total wait seconds, max wait seconds]
+        self._waits: dict[int, list[float]] = {}
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        started = time.monotonic()
+        await self._acquire(priority)
+        self._record_wait(priority, time.monotonic() - started)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            worst = max(self._waiters, key=lambda entry: (entry[0], entry[1]))
+            if worst[0] <= priority:
+                self.rejected += 1
+                raise LimiterRejected("LLM request queue is full")
+            self._remove(worst)
+            worst[2].set_exception(LimiterRejected("Dropped from the LLM queue for a more urgent call"))
+            self.evicted += 1
+
+        future = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._seq), future]
+        heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # A slot was handed over just as we were cancelled: pass it on
+                self._release()
+            else:
+                self._remove(entry)
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Hand the slot straight to the next waiter; in-flight count is unchanged
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _remove(self, entry: list) -> None:
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+
+    def _record_wait(self, priority: int, waited: float) -> None:
+        stats = self._waits.setdefault(priority, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += waited
+        stats[2] = max(stats[2], waited)
+
+    def stats(self) -> dict:
+        depth: dict[int, int] = {}
+        for priority, _, future in self._waiters:
+            if not future.done():
+                depth[priority] = depth.get(priority, 0) + 1
+        priorities = sorted(set(self.priority_names) | set(depth) | set(self._waits))
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": sum(depth.values()),
+            "rejected": self.rejected,
+            "evicted": self.evicted,
+            "by_priority": {
+                self.priority_names.get(p, str(p)): self._priority_stats(p, depth.get(p, 0))
+                for p in priorities
+            },
+        }
+
+    def _priority_stats(self, priority: int, queued: int) -> dict:
+        admitted, total_wait, max_wait = self._waits.get(priority, (0, 0.0, 0.0))
+        return {
+            "queued": queued,
+            "admitted": int(admitted),
+            "avg_wait_ms": round(total_wait / admitted * 1000, 1) if admitted else 0.0,
+            "max_wait_ms": round(max_wait * 1000, 1),
+        }
+
+
+class CircuitBreaker:
+    """Closed -> open after `failure_threshold` consecutive failures; after `reset_timeout`
+    one probe call is let through (half-open) and its outcome closes or re-opens it."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() >= self._opened_at + self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def cancel_probe(self) -> None:
+        """The probe call never reached the provider; let the next call probe instead."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
@@ -0,0 +1,128 @@
+"""
+Retry, validation and partial-acceptance policy for LLM responses.
+
+Every item a model returns is validated on its own (app/schemas/llm.py): valid items
+are accepted, invalid ones dropped, and only what is still missing is re-requested
+after a jittered backoff. A response that is valid apart from a few items therefore
+costs one small follow-up request instead of a failed call or a full re-request.
+Near-valid JSON is repaired locally before it counts as invalid (see json_stream).
+"""
+
+import asyncio
+import logging
+import random
+from collections import Counter
+from collections.abc import Callable
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+from app.schemas.llm import GeneratedQuestion, GradedResult
+from app.services.ai_providers import ai_service
+from app.services.json_stream import repair_counts
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delay(attempt: int, base: float | None = None, cap: float | None = None) -> float:
+    """Full-jitter exponential backoff before retry number `attempt` (1-based)."""
+    base = settings.AI_RETRY_BASE_DELAY_SECONDS if base is None else base
+    cap = settings.AI_RETRY_MAX_DELAY_SECONDS if cap is None else cap
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+def validate_item(model: type[BaseModel], raw) -> dict | None:
+    """The item as a clean dict if it matches the schema, else None."""
+    try:
+        return model.model_validate(raw).model_dump(exclude_none=True)
+    except ValidationError as exc:
+        logger.debug("Rejected %s: %s", model.__name__, exc.errors()[:2])
+        return None
+
+
+def validate_question(raw) -> dict | None:
+    return validate_item(GeneratedQuestion, raw)
+
+
+class PolicyStats:
+    """Outcome counters per operation: complete, partial (some items never arrived) or failed."""
+
+    def __init__(self):
+        self._counts: dict[str, Counter] = {}
+
+    def record(self, operation: str, outcome: str, retries: int = 0, rejected: int = 0) -> None:
+        counts = self._counts.setdefault(operation, Counter())
+        counts["calls"] += 1
+        counts[outcome] += 1
+        counts["retries"] += retries
+        counts["rejected_items"] += rejected
+
+    def stats(self) -> dict:
+        report = {}
+        for operation, counts in self._counts.items():
+            calls = counts["calls"]
+            report[operation] = {
+                "calls": calls,
+                "complete": counts["complete"],
+                "partial": counts["partial"],
+                "failed": counts["failed"],
+                "success_rate": round(counts["complete"] / calls, 3) if calls else 0.0,
+                "retries": counts["retries"],
+                "rejected_items": counts["rejected_items"],
+            }
+        report["json_repair"] = dict(repair_counts)
+        return report
+
+
+async def grade_with_policy(
+    questions_with_answers: list[dict],
+    attempts: int | None = None,
+    on_result: Callable[[dict], None] | None = None,
+) -> dict[int, dict]:
+    """Grade results by question_id for as many of the questions as possible.
+
+    Valid results are kept (and passed to `on_result`) as they stream in; questions without one (missing id,
+    invalid item, failed or truncated response) are re-requested on their own, up to
+    `attempts` requests in all. Questions still missing are left out rather than
+    guessed. Raises the last provider error only if nothing at all was graded.
+    """
+    attempts = attempts or settings.AI_RETRY_ATTEMPTS
+    wanted = {q["question_id"]: q for q in questions_with_answers}
+    graded: dict[int, dict] = {}
+    rejected = requests = 0
+    last_error: Exception | None = None
+
+    while requests < attempts:
+        missing = [q for question_id, q in wanted.items() if question_id not in graded]
+        if not missing:
+            break
+        if requests:
+            await asyncio.sleep(backoff_delay(requests))
+        requests += 1
+        try:
+            async for raw in ai_service.stream_grades(missing):
+                result = validate_item(GradedResult, raw)
+                if result is None or result["question_id"] not in wanted:
+                    rejected += 1
+                elif result["question_id"] not in graded:
+                    graded[result["question_id"]] = result
+                    if on_result is not None:
+                        on_result(result)
+        except (RuntimeError, ValueError) as exc:
+            last_error = exc
+            logger.warning("Grading attempt %d failed: %s", requests, exc)
+
+    retries = max(0, requests - 1)
+    if len(graded) == len(wanted):
+        policy_stats.record("grade_answers", "complete", retries, rejected)
+    elif graded:
+        policy_stats.record("grade_answers", "partial", retries, rejected)
+    else:
+        policy_stats.record("grade_answers", "failed", retries, rejected)
+        if last_error is not None:
+            raise last_error
+    return graded
+
+
+# Singleton instance
+policy_stats = PolicyStats()
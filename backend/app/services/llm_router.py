@@ -0,0 +1,262 @@
+"""
+Latency-aware router over the configured LLM providers, with failover.
+
+Each provider keeps an EWMA of call latency and of its error rate. A call goes to
+the provider with the best score (latency inflated by recent errors) and, if that
+one errors or times out, to the next; callers only see an error when every provider
+failed. Providers are the shared instances from the provider registry, so their SDK
+clients and connection pools are reused across calls.
+
+Every provider also sits behind a bulkhead (app/services/llm_limiter.py): a
+concurrency limiter that queues calls by priority (grading first, see
+CALL_PRIORITIES) and a circuit breaker that skips a provider after repeated failures.
+The per-call deadline covers queueing and the call itself.
+
+Streaming calls (stream_questions, stream_grades) yield items as the provider
+produces them. They fail over only until the first item has been yielded; after
+that a failure ends the stream and the caller keeps what it already received.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, aclosing
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.services.ai_providers import provider_registry
+from app.services.llm_limiter import CircuitBreaker, LimiterRejected, PriorityLimiter
+
+logger = logging.getLogger(__name__)
+
+# Latency assumed for a provider that has not answered yet, so it still gets tried
+_PRIOR_LATENCY = 2.0
+
+# Lower goes first when a provider's slots are busy: learners wait on grading and exam
+# generation; insights can lag; option explanations are a batch job.
+CALL_PRIORITIES = {
+    "grade_answers": 0,
+    "stream_grades": 0,
+    "generate_questions": 1,
+    "stream_questions": 1,
+    "generate_insights": 2,
+    "explain_options": 3,
+    # Background bank refill (bank_refill_worker): never ahead of a learner's request
+    "refill_questions": 4,
+}
+# Router calls served by a differently named provider method
+_PROVIDER_METHODS = {"refill_questions": "generate_questions"}
+# Streaming variants share their batch method's priority and name in stats
+_PRIORITY_NAMES = {priority: method for method, priority in reversed(CALL_PRIORITIES.items())}
+
+
+@dataclass
+class ProviderStats:
+    latency: float | None = None  # EWMA seconds
+    error_rate: float = 0.0  # EWMA of failures, 0..1
+    calls: int = 0
+    failures: int = 0
+
+    def score(self) -> float:
+        latency = _PRIOR_LATENCY if self.latency is None else self.latency
+        # A provider failing every call scores ~20x worse than its raw latency
+        return latency / max(0.05, 1.0 - self.error_rate)
+
+
+class LLMRouter:
+    """Same interface as GroqService/GeminiService; routes each call to the healthiest provider."""
+
+    def __init__(
+        self,
+        providers: dict[str, object] | None = None,
+        timeout: float | None = None,
+        alpha: float = 0.3,
+    ):
+        if providers is None:
+            names = settings.get_ai_providers()
+            configured = [n for n in names if provider_registry.get(n).is_configured]
+            # Without any API key keep the first provider, so calls fail the usual way
+            providers = {n: provider_registry.get(n) for n in (configured or names[:1])}
+        if not providers:
+            raise ValueError("No AI providers configured")
+        self.providers = providers
+        self.timeout = settings.AI_CALL_TIMEOUT_SECONDS if timeout is None else timeout
+        self.alpha = alpha
+        self._stats = {name: ProviderStats() for name in providers}
+        self._limiters = {
+            name: PriorityLimiter(
+                settings.AI_MAX_CONCURRENT_CALLS, settings.AI_MAX_QUEUED_CALLS, _PRIORITY_NAMES
+            )
+            for name in providers
+        }
+        self._breakers = {
+            name: CircuitBreaker(settings.AI_BREAKER_FAILURE_THRESHOLD, settings.AI_BREAKER_RESET_SECONDS)
+            for name in providers
+        }
+
+    async def generate_questions(
+        self, topic: str, num_questions: int, with_explanations: bool = False
+    ) -> list[dict]:
+        return await self._route(
+            "generate_questions", topic, num_questions, with_explanations=with_explanations
+        )
+
+    def stream_questions(
+        self, topic: str, num_questions: int, with_explanations: bool = False
+    ) -> AsyncIterator[dict]:
+        return self._route_stream(
+            "stream_questions", topic, num_questions, with_explanations=with_explanations
+        )
+
+    async def refill_questions(self, topic: str, num_questions: int) -> list[dict]:
+        """generate_questions with explanations, queued behind every learner-facing call."""
+        return await self._route("refill_questions", topic, num_questions, with_explanations=True)
+
+    async def grade_answers(self, questions_with_answers: list[dict]) -> list[dict]:
+        return await self._route("grade_answers", questions_with_answers)
+
+    def stream_grades(self, questions_with_answers: list[dict]) -> AsyncIterator[dict]:
+        return self._route_stream("stream_grades", questions_with_answers)
+
+    async def generate_insights(self, **kwargs) -> dict:
+        return await self._route("generate_insights", **kwargs)
+
+    async def explain_options(
+        self,
+        question_text: str,
+        options: dict[str, str],
+        correct_answer: str,
+        explanation: str,
+    ) -> dict[str, str]:
+        return await self._route(
+            "explain_options", question_text, options, correct_answer, explanation
+        )
+
+    def ranked(self) -> list[str]:
+        """Provider names, healthiest first (ties keep the configured order)."""
+        return sorted(self.providers, key=lambda name: self._stats[name].score())
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "latency_ms": None if s.latency is None else round(s.latency * 1000),
+                "error_rate": round(s.error_rate, 3),
+                "calls": s.calls,
+                "failures": s.failures,
+                "circuit": self._breakers[name].state,
+                "limiter": self._limiters[name].stats(),
+            }
+            for name, s in self._stats.items()
+        }
+
+    async def _route(self, call: str, *args, **kwargs):
+        priority = CALL_PRIORITIES[call]
+        method = _PROVIDER_METHODS.get(call, call)
+        last_error: Exception = RuntimeError("All AI providers are unavailable (circuits open)")
+        for name in self.ranked():
+            breaker = self._breakers[name]
+            if not breaker.allow():
+                continue
+            # allow() only lets a call through a half-open circuit as its probe
+            probe = breaker.state == "half_open"
+            started = None
+            recorded = False
+            try:
+                async with asyncio.timeout(self.timeout):
+                    async with self._limiters[name].slot(priority):
+                        started = time.monotonic()
+                        result = await getattr(self.providers[name], method)(*args, **kwargs)
+            except LimiterRejected as exc:
+                # Our own back-pressure, not the provider's fault
+                last_error = exc
+            except TimeoutError:
+                last_error = RuntimeError(f"{name} timed out after {self.timeout:.0f}s")
+                recorded = self._record_outcome(name, started, failed=True)
+            except (RuntimeError, ValueError) as exc:
+                last_error = exc
+                recorded = self._record_outcome(name, started, failed=True)
+            else:
+                recorded = self._record_outcome(name, started, failed=False)
+                return result
+            finally:
+                # No verdict (rejected, queued out, cancelled): let the next call probe
+                if probe and not recorded:
+                    breaker.cancel_probe()
+
+            logger.warning("%s.%s failed (%s); trying next provider", name, method, last_error)
+        raise last_error
+
+    async def _route_stream(self, method: str, *args, **kwargs) -> AsyncIterator:
+        priority = CALL_PRIORITIES[method]
+        last_error: Exception = RuntimeError("All AI providers are unavailable (circuits open)")
+        for name in self.ranked():
+            breaker = self._breakers[name]
+            if not breaker.allow():
+                continue
+            probe = breaker.state == "half_open"
+            # The deadline only bounds our waits on the provider, never the consumer
+            # holding this generator suspended between items
+            deadline = asyncio.get_running_loop().time() + self.timeout
+            started = None
+            recorded = False
+            yielded = 0
+            try:
+                async with AsyncExitStack() as stack:
+                    async with asyncio.timeout_at(deadline):
+                        await stack.enter_async_context(self._limiters[name].slot(priority))
+                    started = time.monotonic()
+                    items = await stack.enter_async_context(
+                        aclosing(getattr(self.providers[name], method)(*args, **kwargs))
+                    )
+                    while True:
+                        try:
+                            async with asyncio.timeout_at(deadline):
+                                item = await anext(items)
+                        except StopAsyncIteration:
+                            break
+                        yielded += 1
+                        yield item
+            except LimiterRejected as exc:
+                last_error = exc
+            except TimeoutError:
+                last_error = RuntimeError(f"{name} timed out after {self.timeout:.0f}s")
+                recorded = self._record_outcome(name, started, failed=True)
+            except (RuntimeError, ValueError) as exc:
+                last_error = exc
+                recorded = self._record_outcome(name, started, failed=True)
+            except GeneratorExit:
+                # The consumer has what it needs; the provider did its job
+                recorded = self._record_outcome(name, started, failed=False)
+                raise
+            else:
+                recorded = self._record_outcome(name, started, failed=False)
+                return
+            finally:
+                if probe and not recorded:
+                    breaker.cancel_probe()
+
+            if yielded:
+                logger.warning("%s.%s failed after %d items (%s); keeping them", name, method, yielded, last_error)
+                return
+            logger.warning("%s.%s failed (%s); trying next provider", name, method, last_error)
+        raise last_error
+
+    def _record_outcome(self, name: str, started: float | None, failed: bool) -> bool:
+        """Feed a finished provider call to its breaker and stats; False if it never started."""
+        if started is None:
+            return False
+        breaker = self._breakers[name]
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        self._record(name, time.monotonic() - started, failed=failed)
+        return True
+
+    def _record(self, name: str, elapsed: float, failed: bool) -> None:
+        s = self._stats[name]
+        s.calls += 1
+        s.failures += failed
+        s.latency = elapsed if s.latency is None else self.alpha * elapsed + (1 - self.alpha) * s.latency
+        s.error_rate = self.alpha * failed + (1 - self.alpha) * s.error_rate
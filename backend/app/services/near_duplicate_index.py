@@ -0,0 +1,83 @@
+"""MinHash + LSH index for spotting paraphrased duplicate questions."""
+
+import hashlib
+import random
+import re
+from collections.abc import Hashable
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def shingles(text: str, size: int = 2) -> set[str]:
+    """Word n-grams of the lower-cased text; blanks like '_____' are dropped."""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class NearDuplicateIndex:
+    """Estimated-Jaccard lookup over MinHash signatures, bucketed with LSH bands.
+
+    With 16 bands of 4 rows, pairs at 0.6 similarity share a bucket ~90% of the time
+    (more often above that) while unrelated questions almost never do; the signature
+    comparison then applies `threshold`. Word bigrams put a one-word paraphrase of a
+    typical TOEIC sentence at about 0.6.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.6, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+            for s in shingles(text)
+        ] or [0]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+    def find_duplicate(self, text: str, signature: tuple[int, ...] | None = None) -> Hashable | None:
+        """Return the key of an indexed near-duplicate of `text`, or None."""
+        signature = signature or self.signature(text)
+        seen = set()
+        for band in self._bands(signature):
+            for key in self._buckets.get(band, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                if self._similarity(signature, self._signatures[key]) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: Hashable, text: str, signature: tuple[int, ...] | None = None) -> None:
+        signature = signature or self.signature(text)
+        self._signatures[key] = signature
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(key)
+
+    def _bands(self, signature: tuple[int, ...]):
+        for i in range(self.bands):
+            yield i, signature[i * self.rows:(i + 1) * self.rows]
+
+    @staticmethod
+    def _similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+        return sum(x == y for x, y in zip(a, b)) / len(a)
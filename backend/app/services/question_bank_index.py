@@ -0,0 +1,232 @@
+"""Process-local, read-mostly index of the question bank for O(k) exam sampling."""
+
+import asyncio
+import logging
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import BigInteger, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.question_bank import QuestionBank
+from app.services.bank_pack import DEFAULT_PACK, BankPack
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _TopicBucket:
+    # Bank row ids in ascending order, parallel to payloads
+    ids: array
+    # Question dicts built once at load time, shared by every sample
+    payloads: tuple[dict, ...]
+    # Precomputed {option: why it is wrong} per row, None until the batch job has run
+    option_explanations: tuple[dict | None, ...]
+    # (row count, max id, rows with option explanations, content checksum) seen at load time;
+    # used to detect changes, including in-place edits by seed_question_bank.py
+    signature: tuple[int, int, int, int]
+
+
+class QuestionBankIndex:
+    """Compact per-topic arrays of bank ids and payloads.
+
+    Loaded at startup, refreshed per topic when its signature (see _TopicBucket) changes.
+    Sampling never touches the database once a topic is loaded. Until the startup load
+    has finished, a prebuilt bank pack (if one was opened) can serve samples instead.
+    """
+
+    def __init__(self):
+        self._buckets: dict[int, _TopicBucket] = {}
+        self._pack: BankPack | None = None
+
+    def open_pack(self, path: Path = DEFAULT_PACK) -> bool:
+        """Map a bank pack to sample from until load() completes; False if there is none."""
+        try:
+            self._pack = BankPack(path)
+        except FileNotFoundError:
+            return False
+        except ValueError as exc:
+            logger.warning("Ignoring question bank pack: %s", exc)
+            return False
+        logger.info("Question bank pack opened: %d questions", self._pack.question_count)
+        return True
+
+    @property
+    def warming_up(self) -> bool:
+        """True while a bank pack stands in for the database-backed index."""
+        return self._pack is not None
+
+    def sample_pack(self, slug: str, k: int) -> list[dict]:
+        """Up to k random questions of a topic from the bank pack, shaped like sample()."""
+        if self._pack is None or k <= 0:
+            return []
+        return [
+            {
+                # Pack rows carry no bank id; exams store them like AI questions
+                "bank_question_id": None,
+                "question_text": q["question_text"],
+                "options": q["options"],
+                "correct_answer": q["correct_answer"],
+                "explanation": q["explanation"],
+            }
+            for q in self._pack.sample(slug, k)
+        ]
+
+    def is_loaded(self, topic_id: int) -> bool:
+        return topic_id in self._buckets
+
+    def size(self, topic_id: int) -> int:
+        bucket = self._buckets.get(topic_id)
+        return len(bucket.ids) if bucket else 0
+
+    def sample(self, topic_id: int, k: int) -> list[dict]:
+        """Return up to k random questions for a topic in O(k)."""
+        bucket = self._buckets.get(topic_id)
+        if not bucket or k <= 0:
+            return []
+        picks = random.sample(range(len(bucket.ids)), min(k, len(bucket.ids)))
+        return [dict(bucket.payloads[i]) for i in picks]
+
+    def payloads_since(self, topic_id: int, after_id: int) -> tuple[dict, ...]:
+        """Payloads of a topic's bank rows with id > after_id (rows are id-ordered)."""
+        bucket = self._buckets.get(topic_id)
+        if not bucket:
+            return ()
+        return bucket.payloads[bisect_right(bucket.ids, after_id):]
+
+    def option_explanation(self, topic_id: int, bank_question_id: int, option: str) -> str | None:
+        """Precomputed explanation of why `option` is wrong for a bank question, if any."""
+        bucket = self._buckets.get(topic_id)
+        if not bucket:
+            return None
+        pos = bisect_left(bucket.ids, bank_question_id)
+        if pos == len(bucket.ids) or bucket.ids[pos] != bank_question_id:
+            return None
+        return (bucket.option_explanations[pos] or {}).get(option)
+
+    async def load(self, db: AsyncSession) -> None:
+        """(Re)build the index for every topic in a single query, then drop the bank pack."""
+        try:
+            result = await db.execute(_bank_rows_query())
+            rows_by_topic: dict[int, list] = {}
+            for row in result:
+                rows_by_topic.setdefault(row.topic_id, []).append(row)
+            self._buckets = {topic_id: _build_bucket(rows) for topic_id, rows in rows_by_topic.items()}
+        finally:
+            # On failure topics load lazily instead, as without a pack
+            pack, self._pack = self._pack, None
+            if pack is not None:
+                pack.close()
+        logger.info(
+            "Question bank index loaded: %d topics, %d questions",
+            len(self._buckets),
+            sum(len(b.ids) for b in self._buckets.values()),
+        )
+
+    async def refresh_topic(self, db: AsyncSession, topic_id: int) -> None:
+        """Reload a single topic, e.g. after questions were added to its bank."""
+        result = await db.execute(_bank_rows_query().where(QuestionBank.topic_id == topic_id))
+        # Empty topics are cached too, so AI-only topics don't re-query on every exam
+        self._buckets[topic_id] = _build_bucket(list(result))
+
+    async def ensure_topic(self, db: AsyncSession, topic_id: int) -> None:
+        """Lazily load a topic that was not covered by the startup warm-up."""
+        if topic_id not in self._buckets:
+            await self.refresh_topic(db, topic_id)
+
+    async def refresh_changed(self, db: AsyncSession) -> list[int]:
+        """Reload only topics whose signature moved; return their ids."""
+        result = await db.execute(
+            select(
+                QuestionBank.topic_id,
+                func.count(),
+                func.max(QuestionBank.id),
+                func.count(QuestionBank.explanations_hash),
+                _content_checksum_sql(),
+            )
+            .group_by(QuestionBank.topic_id)
+        )
+        current = {row[0]: tuple(row[1:]) for row in result}
+
+        changed = [
+            topic_id for topic_id, sig in current.items()
+            if topic_id not in self._buckets or self._buckets[topic_id].signature != sig
+        ]
+        for topic_id in changed:
+            await self.refresh_topic(db, topic_id)
+        for topic_id in set(self._buckets) - set(current):
+            if self._buckets[topic_id].ids:
+                self._buckets[topic_id] = _build_bucket([])
+                changed.append(topic_id)
+        return changed
+
+    async def run_refresh_loop(self, interval_seconds: float) -> None:
+        """Poll for bank changes made by other processes (seed scripts, other workers)."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with AsyncSessionLocal() as db:
+                    changed = await self.refresh_changed(db)
+                if changed:
+                    logger.info("Question bank index refreshed topics: %s", changed)
+            except Exception:
+                logger.exception("Question bank index refresh failed")
+
+
+def _bank_rows_query():
+    return select(
+        QuestionBank.id,
+        QuestionBank.topic_id,
+        QuestionBank.question_text,
+        QuestionBank.options,
+        QuestionBank.correct_answer,
+        QuestionBank.explanation,
+        QuestionBank.option_explanations,
+        QuestionBank.explanations_hash,
+        QuestionBank.content_hash,
+    ).order_by(QuestionBank.id)
+
+
+def _content_checksum(content_hashes) -> int:
+    """Sum of the first 32 bits of each content hash; mirrors _content_checksum_sql."""
+    return sum(int(h[:8], 16) for h in content_hashes if h)
+
+
+def _content_checksum_sql():
+    # ('x' || left(content_hash, 8))::bit(32)::bigint, summed; NULL hashes contribute nothing
+    prefix = literal("x").concat(func.left(QuestionBank.content_hash, 8))
+    return func.coalesce(func.sum(cast(cast(prefix, BIT(32)), BigInteger)), 0)
+
+
+def _build_bucket(rows: list) -> _TopicBucket:
+    ids = array("q", (row.id for row in rows))
+    payloads = tuple(
+        {
+            "bank_question_id": row.id,
+            "question_text": row.question_text,
+            "options": row.options,
+            "correct_answer": row.correct_answer,
+            "explanation": row.explanation,
+        }
+        for row in rows
+    )
+    return _TopicBucket(
+        ids=ids,
+        payloads=payloads,
+        option_explanations=tuple(row.option_explanations for row in rows),
+        signature=(
+            len(ids),
+            max(ids, default=0),
+            sum(1 for row in rows if row.explanations_hash is not None),
+            _content_checksum(row.content_hash for row in rows),
+        ),
+    )
+
+
+# Singleton instance
+question_bank_index = QuestionBankIndex()
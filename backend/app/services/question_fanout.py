@@ -0,0 +1,115 @@
+"""Generate many AI questions as concurrent small streamed requests instead of one long completion."""
+
+import asyncio
+import logging
+import re
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from app.core.config import settings
+from app.services.ai_providers import ai_service
+from app.services.llm_policy import backoff_delay, policy_stats, validate_question
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+# Sentinel a chunk task queues when its stream ends cleanly
+_DONE = object()
+
+
+def _text_key(text: str) -> str:
+    """Question text with case, spacing, punctuation and blanks ignored."""
+    return " ".join(_WORD.findall(text.casefold().replace("_", " ")))
+
+
+def _chunks(count: int, size: int) -> list[int]:
+    """Split count into near-equal chunks of at most size, e.g. 12 by 5 -> [4, 4, 4]."""
+    parts = -(-count // size)
+    return [count // parts + (1 if i < count % parts else 0) for i in range(parts)]
+
+
+async def _stream_chunk(topic_name: str, n: int, out: asyncio.Queue) -> None:
+    """Forward one chunk's questions to the merge queue, then a sentinel (or the error)."""
+    try:
+        # Explanations come in the same response on purpose: bank rows need one, so this is
+        # what lets bank_harvester keep top-ups, and it costs no second LLM call. Those
+        # questions therefore skip the per-answer explanation path (SSE stream, explanation
+        # cache, batcher); only the ones the model left without an explanation go through it.
+        async with aclosing(ai_service.stream_questions(topic_name, n, with_explanations=True)) as items:
+            async for q in items:
+                await out.put(q)
+                n -= 1
+                if n <= 0:
+                    break
+    except (RuntimeError, ValueError) as exc:
+        await out.put(exc)
+    else:
+        await out.put(_DONE)
+
+
+async def stream_questions_fanout(
+    topic_name: str,
+    count: int,
+    exclude_texts: list[str] = (),
+    chunk_size: int | None = None,
+    max_rounds: int | None = None,
+) -> AsyncIterator[dict]:
+    """Yield up to `count` distinct, well-formed questions as soon as each one arrives.
+
+    Each round requests the missing remainder as concurrent streamed chunks, merged in
+    arrival order, after a jittered backoff for every round but the first. Each question
+    is validated on its own (GeneratedQuestion): questions from a chunk that fails
+    midway are kept; invalid ones and duplicates across chunks and of `exclude_texts`
+    (e.g. bank questions already in the exam) are dropped and made up in the next round.
+    Outstanding chunks are cancelled once `count` is reached. Raises the last provider
+    error only if no question at all could be generated.
+    """
+    chunk_size = chunk_size or settings.AI_GENERATION_CHUNK_SIZE
+    max_rounds = max_rounds or settings.AI_GENERATION_MAX_ROUNDS
+    seen = {_text_key(text) for text in exclude_texts}
+    accepted = rejected = rounds = 0
+    last_error: Exception | None = None
+
+    while rounds < max_rounds:
+        missing = count - accepted
+        if missing <= 0:
+            break
+        if rounds:
+            await asyncio.sleep(backoff_delay(rounds))
+        rounds += 1
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks = [
+            asyncio.create_task(_stream_chunk(topic_name, n, queue))
+            for n in _chunks(missing, chunk_size)
+        ]
+        try:
+            pending = len(tasks)
+            while pending and accepted < count:
+                item = await queue.get()
+                if item is _DONE:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    pending -= 1
+                    last_error = item
+                    logger.warning("Question chunk for %s failed: %s", topic_name, item)
+                else:
+                    question = validate_question(item)
+                    key = question and _text_key(question["question_text"])
+                    if question is None or key in seen:
+                        rejected += 1
+                        continue
+                    seen.add(key)
+                    accepted += 1
+                    yield question
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    outcome = "complete" if accepted >= count else "partial" if accepted else "failed"
+    policy_stats.record("generate_questions", outcome, rounds - 1, rejected)
+    if not accepted and last_error is not None:
+        raise last_error
+    if not accepted:
+        raise ValueError(f"No usable questions generated for {topic_name}")
+
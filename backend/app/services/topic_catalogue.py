@@ -0,0 +1,108 @@
+"""Process-local copy of the serialized topics catalogue with content-derived ETags."""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.grammar_topic import GrammarTopic
+from app.schemas.topic import TopicDetailResponse, TopicResponse, TopicSection, TopicSectionHeading
+
+logger = logging.getLogger(__name__)
+
+_topics_adapter = TypeAdapter(list[TopicResponse])
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBody:
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, body: bytes) -> "CachedBody":
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class TopicCatalogue:
+    """Holds the exact response bodies for the /api/topics endpoints.
+
+    Topics only change through the seed/summary scripts, so bodies are built once and
+    served (or validated with a 304) from memory; a slow poll picks up script edits.
+    """
+
+    def __init__(self):
+        self.listing: CachedBody | None = None
+        self.details: dict[str, CachedBody] = {}
+        # slug -> one body per `##` section of the summary
+        self.sections: dict[str, tuple[CachedBody, ...]] = {}
+
+    def is_loaded(self) -> bool:
+        return self.listing is not None
+
+    async def load(self, db: AsyncSession) -> bool:
+        """Rebuild every body; return True when any content changed.
+
+        Topics whose summary changed outside the ORM (raw SQL, rows predating the
+        rendered columns) are re-rendered and saved here.
+        """
+        result = await db.execute(select(GrammarTopic).order_by(GrammarTopic.name))
+        topics = result.scalars().all()
+        rerendered = [t.slug for t in topics if t.refresh_rendered_summary()]
+        if rerendered:
+            await db.commit()
+            logger.info("Re-rendered topic summaries: %s", rerendered)
+
+        listing = CachedBody.of(_topics_adapter.dump_json([TopicResponse.model_validate(t) for t in topics]))
+        details, sections = {}, {}
+        for topic in topics:
+            parts = [
+                TopicSection(index=i, title=s["title"], html=s["html"])
+                for i, s in enumerate(topic.summary_sections or [])
+            ]
+            detail = TopicDetailResponse(
+                id=topic.id,
+                name=topic.name,
+                slug=topic.slug,
+                description=topic.description,
+                toc=[TopicSectionHeading(index=s.index, title=s.title) for s in parts],
+                first_section=parts[0] if parts else None,
+            )
+            details[topic.slug] = CachedBody.of(detail.model_dump_json().encode())
+            sections[topic.slug] = tuple(CachedBody.of(s.model_dump_json().encode()) for s in parts)
+
+        before = self._fingerprint()
+        self.listing, self.details, self.sections = listing, details, sections
+        return self._fingerprint() != before
+
+    def _fingerprint(self) -> tuple:
+        return (
+            self.listing and self.listing.etag,
+            tuple(sorted((slug, d.etag) for slug, d in self.details.items())),
+        )
+
+    async def run_refresh_loop(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with AsyncSessionLocal() as db:
+                    if await self.load(db):
+                        logger.info("Topic catalogue changed, new listing ETag %s", self.listing.etag)
+            except Exception:
+                logger.exception("Topic catalogue refresh failed")
+
+
+# Singleton instance
+topic_catalogue = TopicCatalogue()
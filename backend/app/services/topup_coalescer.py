@@ -0,0 +1,131 @@
+"""
+Single-flight coalescing of AI question top-ups per topic.
+
+When a topic's bank is short, every exam generated for it needs AI questions. A class
+starting the same topic at once would send one identical generation per learner;
+instead, callers for a topic that arrive within a short join window share one
+generation sized to their combined demand (capped), and the questions are dealt out
+round-robin as they stream in, so each caller gets a disjoint slice. Coalescing is
+per process; every worker runs its own flights.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from app.core.config import settings
+from app.services.join_window import JoinWindows
+from app.services.question_fanout import stream_questions_fanout
+
+logger = logging.getLogger(__name__)
+
+# Queued to a waiter once its flight has nothing more for it
+_DONE = object()
+
+
+class _Waiter:
+    def __init__(self, wanted: int):
+        self.wanted = wanted
+        self.received = 0
+        self.closed = False
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def hungry(self) -> bool:
+        return not self.closed and self.received < self.wanted
+
+
+class _Flight:
+    def __init__(self, topic_name: str):
+        self.topic_name = topic_name
+        self.demand = 0
+        self.exclude: set[str] = set()
+        self.waiters: list[_Waiter] = []
+        self._turn = 0
+
+    def join(self, count: int, exclude_texts) -> _Waiter:
+        waiter = _Waiter(count)
+        self.waiters.append(waiter)
+        self.demand += count
+        self.exclude.update(exclude_texts)
+        return waiter
+
+    def next_waiter(self) -> _Waiter | None:
+        """Next caller in round-robin order that still wants questions."""
+        for _ in range(len(self.waiters)):
+            waiter = self.waiters[self._turn % len(self.waiters)]
+            self._turn += 1
+            if waiter.hungry:
+                return waiter
+        return None
+
+
+class TopUpCoalescer:
+    def __init__(self, window_ms: float | None = None, max_demand: int | None = None):
+        window = (settings.AI_TOPUP_JOIN_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_demand = max_demand or settings.AI_TOPUP_MAX_COALESCED
+        # Keyed by topic_id
+        self._windows = JoinWindows(window, _Flight, self._fly)
+        self.callers = 0
+
+    async def top_up(
+        self, topic_id: int, topic_name: str, count: int, exclude_texts: list[str] = ()
+    ) -> AsyncIterator[dict]:
+        """Yield up to `count` AI questions for the topic, none of which any other caller gets.
+
+        `exclude_texts` (e.g. the caller's bank questions) are kept out of the whole flight.
+        Raises like stream_questions_fanout when this caller ends up with no question.
+        """
+        flight = self._windows.current(topic_id)
+        if flight is not None and flight.demand + count > self.max_demand:
+            # Full: send it now and open a new one
+            self._windows.flush(topic_id)
+        self.callers += 1
+        waiter = self._windows.join(topic_id, topic_name).join(count, exclude_texts)
+
+        try:
+            while True:
+                item = await waiter.queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    if not waiter.received:
+                        raise item
+                    break
+                yield item
+            if not waiter.received:
+                raise ValueError(f"No usable questions generated for {topic_name}")
+        finally:
+            waiter.closed = True
+
+    def stats(self) -> dict:
+        flights = self._windows.flushes
+        return {
+            "callers": self.callers,
+            "flights": flights,
+            "callers_per_flight": round(self.callers / flights, 2) if flights else 0.0,
+            "running": self._windows.in_flight,
+        }
+
+    async def _fly(self, flight: _Flight) -> None:
+        outcome: object = _DONE
+        try:
+            stream = stream_questions_fanout(flight.topic_name, flight.demand, exclude_texts=list(flight.exclude))
+            async with aclosing(stream):
+                async for question in stream:
+                    waiter = flight.next_waiter()
+                    if waiter is None:
+                        break  # every caller is served or gone
+                    waiter.received += 1
+                    waiter.queue.put_nowait(question)
+        except Exception as exc:
+            logger.warning("AI top-up for %s failed: %s", flight.topic_name, exc)
+            outcome = exc
+        finally:
+            for waiter in flight.waiters:
+                waiter.queue.put_nowait(outcome)
+
+
+# Singleton instance
+topup_coalescer = TopUpCoalescer()
@@ -0,0 +1,66 @@
+"""
+Benchmark: bank warm-up from the binary pack vs. parsing the JSON data file.
+No database needed.
+
+    python -m benchmarks.bench_bank_pack [--copies 400] [--samples 10000]
+
+--copies repeats the shipped bank to simulate a larger one.
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.bank_pack import DEFAULT_DATA, BankPack, build_pack
+
+
+def _scaled(topics: dict[str, list[dict]], copies: int) -> dict[str, list[dict]]:
+    return {
+        slug: [
+            {**q, "source_key": f"{q['source_key']}-{n}", "question_text": f"{q['question_text']} (#{n})"}
+            for n in range(copies)
+            for q in questions
+        ]
+        for slug, questions in topics.items()
+    }
+
+
+def main(copies: int, samples: int) -> None:
+    topics = _scaled(json.loads(DEFAULT_DATA.read_text(encoding="utf-8"))["topics"], copies)
+    total = sum(len(q) for q in topics.values())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path, pack_path = Path(tmp) / "bank.json", Path(tmp) / "bank.pack"
+        json_path.write_text(json.dumps({"version": 1, "topics": topics}, ensure_ascii=False), encoding="utf-8")
+        pack_size = build_pack(topics, pack_path)
+
+        started = time.perf_counter()
+        json.loads(json_path.read_text(encoding="utf-8"))
+        json_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        pack = BankPack(pack_path)
+        open_ms = (time.perf_counter() - started) * 1000
+
+        slugs = pack.topics()
+        started = time.perf_counter()
+        for _ in range(samples):
+            pack.sample(random.choice(slugs), 10)
+        sample_us = (time.perf_counter() - started) / samples * 1e6
+        pack.close()
+
+        print(f"{total:,} questions; JSON {json_path.stat().st_size:,} bytes, pack {pack_size:,} bytes")
+        print(f"  JSON parse:       {json_ms:9.2f} ms")
+        print(f"  pack open (mmap): {open_ms:9.2f} ms")
+        print(f"  pack sample(10):  {sample_us:9.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--copies", type=int, default=400)
+    parser.add_argument("--samples", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.copies, args.samples)
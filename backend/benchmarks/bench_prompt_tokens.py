@@ -0,0 +1,138 @@
+"""
+Benchmark: prompt tokens per request, before and after compact prompt encoding.
+No database or API keys needed.
+
+    python -m benchmarks.bench_prompt_tokens [--batch 10]
+
+Builds each prompt type from questions in data/question_bank.json, once with the
+legacy templates and payload formatting (benchmarks/legacy_prompts.py) and once
+with app/core/prompt_encoding.py, and reports system + user prompt tokens. Counts
+are exact with tiktoken installed (cl100k_base), a heuristic estimate otherwise.
+"""
+
+import argparse
+import json
+import random
+
+from app.core import prompt_encoding
+from app.core.prompt_encoding import TOKENIZER, count_tokens, encode_topic_rows
+from app.services.bank_pack import DEFAULT_DATA
+from benchmarks import legacy_prompts as legacy
+
+
+class _Topic:
+    def __init__(self, name: str, sessions: int, accuracy: float, level: str, trend: str):
+        self.topic_name = name
+        self.sessions_completed = sessions
+        self.accuracy_pct = accuracy
+        self.level = level
+        self.trend = trend
+
+
+def _legacy_grading(items: list[dict]) -> tuple[str, str]:
+    formatted = json.dumps(items, ensure_ascii=False, indent=2)
+    return legacy.GRADING_SYSTEM_PROMPT, legacy.GRADING_USER_PROMPT.format(questions_with_answers=formatted)
+
+
+def _legacy_options(q: dict) -> tuple[str, str]:
+    wrong = [key for key in sorted(q["options"]) if key != q["correct_answer"]]
+    user = legacy.OPTION_EXPLANATIONS_USER_PROMPT.format(
+        question_text=q["question_text"],
+        options=json.dumps(q["options"], ensure_ascii=False),
+        correct_answer=q["correct_answer"],
+        explanation=q["explanation"],
+        wrong_options=", ".join(wrong),
+    )
+    return legacy.OPTION_EXPLANATIONS_SYSTEM_PROMPT, user
+
+
+def _legacy_topic_rows(topics: list[_Topic]) -> str:
+    lines = []
+    for t in topics:
+        if t.sessions_completed == 0:
+            lines.append(f"- {t.topic_name}: chưa làm bài")
+        else:
+            lines.append(
+                f"- {t.topic_name}: {t.sessions_completed} bài, "
+                f"độ chính xác {t.accuracy_pct}% ({t.level}), "
+                f"xu hướng: {t.trend}"
+            )
+    return "\n".join(lines)
+
+
+def _tokens(prompt: tuple[str, ...]) -> int:
+    return count_tokens(prompt[0]) + count_tokens(prompt[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=10, help="questions per grading request")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    topics = json.loads(DEFAULT_DATA.read_text(encoding="utf-8"))["topics"]
+    questions = [q for bank in topics.values() for q in bank]
+    picked = rng.sample(questions, min(args.batch, len(questions)))
+    grading_items = [
+        {
+            "question_id": 1000 + i,
+            "question_text": q["question_text"],
+            "options": q["options"],
+            "correct_answer": q["correct_answer"],
+            "user_answer": rng.choice(["A", "B", "C", "D", "No answer"]),
+        }
+        for i, q in enumerate(picked)
+    ]
+    sample = picked[0]
+    perf_topics = [
+        _Topic(slug.replace("-", " ").title(), rng.randint(0, 6), rng.randint(30, 95), "Khá", "improving")
+        for slug in topics
+    ]
+    insights_args = (72.5, 14, 180)
+
+    cases = {
+        "generation": (
+            (legacy.GENERATION_SYSTEM_PROMPT, legacy.GENERATION_USER_PROMPT.format(num_questions=5, topic="Tenses")),
+            prompt_encoding.generation_prompt("Tenses", 5),
+        ),
+        "bank generation": (
+            (legacy.BANK_GENERATION_SYSTEM_PROMPT, legacy.GENERATION_USER_PROMPT.format(num_questions=5, topic="Tenses")),
+            prompt_encoding.generation_prompt("Tenses", 5, with_explanations=True),
+        ),
+        f"grading ({len(grading_items)} questions)": (
+            _legacy_grading(grading_items),
+            prompt_encoding.grading_prompt(grading_items),
+        ),
+        "grading (1 question)": (
+            _legacy_grading(grading_items[:1]),
+            prompt_encoding.grading_prompt(grading_items[:1]),
+        ),
+        "option explanations": (
+            _legacy_options(sample),
+            prompt_encoding.option_explanations_prompt(
+                sample["question_text"], sample["options"], sample["correct_answer"], sample["explanation"]
+            ),
+        ),
+        "insights": (
+            (
+                legacy.INSIGHTS_SYSTEM_PROMPT,
+                legacy.INSIGHTS_USER_PROMPT.format(
+                    overall_accuracy=insights_args[0],
+                    total_sessions=insights_args[1],
+                    total_questions=insights_args[2],
+                    topic_breakdown=_legacy_topic_rows(perf_topics),
+                ),
+            ),
+            prompt_encoding.insights_prompt(*insights_args, encode_topic_rows(perf_topics)),
+        ),
+    }
+
+    print(f"Prompt tokens per request ({TOKENIZER})\n")
+    print(f"{'prompt':<28}{'before':>8}{'after':>8}{'saved':>8}")
+    for name, (before, after) in cases.items():
+        b, a = _tokens(before), _tokens(after)
+        print(f"{name:<28}{b:>8}{a:>8}{(b - a) / b:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
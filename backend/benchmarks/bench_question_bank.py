@@ -0,0 +1,130 @@
+"""
+Benchmark: exam generation latency, in-memory bank index vs. the old full-fetch path.
+Needs the PostgreSQL database from docker-compose (DATABASE_URL).
+
+For each bank size a scratch topic is filled with synthetic questions inside a
+transaction that is rolled back at the end, so nothing is left behind.
+
+    python -m benchmarks.bench_question_bank [--sizes 20 2000 200000] [--runs 200]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import func, insert, select
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.grammar_topic import GrammarTopic
+from app.models.question_bank import QuestionBank
+from app.services.exam_service import ExamService
+from app.services.question_bank_index import question_bank_index
+
+NUM_QUESTIONS = 10
+INSERT_CHUNK = 5_000
+
+
+class FullFetchExamService(ExamService):
+    """ExamService with the pre-index bank read: COUNT(*), load every row, sample."""
+
+    async def _get_bank_questions(self, topic: GrammarTopic, num_questions: int) -> list[dict]:
+        count_result = await self.db.execute(
+            select(func.count()).where(QuestionBank.topic_id == topic.id)
+        )
+        if count_result.scalar_one() == 0:
+            return []
+        result = await self.db.execute(
+            select(QuestionBank).where(QuestionBank.topic_id == topic.id)
+        )
+        bank_items = list(result.scalars().all())
+        sample = random.sample(bank_items, min(num_questions, len(bank_items)))
+        random.shuffle(sample)
+        return [
+            {
+                "question_text": q.question_text,
+                "options": q.options,
+                "correct_answer": q.correct_answer,
+                "explanation": q.explanation,
+            }
+            for q in sample
+        ]
+
+
+def _synthetic_rows(topic_id: int, count: int) -> list[dict]:
+    return [
+        {
+            "topic_id": topic_id,
+            "question_text": f"The committee ______ the proposal before the deadline. (#{i})",
+            "options": {"A": "reviewed", "B": "has reviewed", "C": "had reviewed", "D": "reviews"},
+            "correct_answer": "C",
+            "explanation": "Past perfect marks an action completed before another past action.",
+            "difficulty": "medium",
+        }
+        for i in range(count)
+    ]
+
+
+async def _time_generate(service: ExamService, topic_id: int, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await service.generate_exam(topic_id, NUM_QUESTIONS)
+        timings.append((time.perf_counter() - start) * 1000)
+        # Keep the session identity map from growing across runs
+        service.db.expunge_all()
+    return timings
+
+
+def _summarize(label: str, timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"{label:<12} p50={statistics.median(ordered):8.2f}ms  p95={p95:8.2f}ms"
+
+
+async def bench_size(size: int, runs: int) -> None:
+    async with AsyncSessionLocal() as db:
+        tag = uuid.uuid4().hex[:8]
+        topic = GrammarTopic(name=f"bench-{tag}", slug=f"bench-{tag}", description="benchmark scratch topic")
+        db.add(topic)
+        await db.flush()
+
+        rows = _synthetic_rows(topic.id, size)
+        for i in range(0, len(rows), INSERT_CHUNK):
+            await db.execute(insert(QuestionBank), rows[i:i + INSERT_CHUNK])
+
+        try:
+            # Full-fetch runs are capped: at 200k rows each one takes seconds
+            full_runs = max(3, min(runs, 2_000_000 // max(size, 1)))
+            full = await _time_generate(FullFetchExamService(db), topic.id, full_runs)
+
+            start = time.perf_counter()
+            await question_bank_index.refresh_topic(db, topic.id)
+            load_ms = (time.perf_counter() - start) * 1000
+            indexed = await _time_generate(ExamService(db), topic.id, runs)
+        finally:
+            # Nothing was committed: scratch topic, bank rows and sessions all vanish
+            await db.rollback()
+
+    print(f"\n{size:,} bank rows per topic (index load {load_ms:.1f}ms)")
+    print(_summarize("full-fetch", full), f"({full_runs} runs)")
+    print(_summarize("index", indexed), f"({runs} runs)")
+    print(f"{'speedup':<12} {statistics.median(full) / statistics.median(indexed):.1f}x at p50")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 2_000, 200_000])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"generate_exam latency, {NUM_QUESTIONS} questions per exam")
+    for size in args.sizes:
+        await bench_size(size, args.runs)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
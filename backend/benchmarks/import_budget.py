@@ -0,0 +1,73 @@
+"""
+Import-time budget report for app.main (cold start of a worker or container).
+
+Runs `python -X importtime -c "import app.main"` in fresh interpreters and reports
+the total and the slowest top-level packages. Exits non-zero when the median total
+exceeds --budget-ms, so it can run in CI. No database needed.
+
+    python -m benchmarks.import_budget [--module app.main] [--runs 5] [--top 15] [--budget-ms 1500]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(module: str) -> tuple[int, dict[str, int]]:
+    """One cold import; return (total us, {top-level package: self time us})."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    by_package: dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        by_package[name.split(".")[0]] += self_us
+        if name == module and len(indent) == 1:
+            total = cumulative_us
+    return total, by_package
+
+
+def main(module: str, runs: int, top: int, budget_ms: float) -> int:
+    totals = []
+    packages: dict[str, list[int]] = defaultdict(list)
+    for _ in range(runs):
+        total, by_package = measure(module)
+        totals.append(total)
+        for name, us in by_package.items():
+            packages[name].append(us)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"import {module}: median {median_ms:.1f} ms over {runs} runs (budget {budget_ms:.0f} ms)")
+    ranked = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, samples in ranked[:top]:
+        print(f"  {statistics.median(samples) / 1000:8.1f} ms  {name}")
+
+    if median_ms > budget_ms:
+        print("Over budget.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time budget report.")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    args = parser.parse_args()
+    sys.exit(main(args.module, args.runs, args.top, args.budget_ms))
@@ -0,0 +1,105 @@
+"""
+Batch job: precompute "why this option is wrong" explanations for every question_bank
+item and every wrong option, so submit can explain bank questions without an LLM call.
+Run after seed_question_bank.py.
+
+- Bounded concurrency against the configured provider (--concurrency)
+- Resumable: each item is committed as soon as it is explained, so a rerun picks up
+  where an interrupted one stopped
+- Incremental: items whose content hash matches explanations_hash are skipped
+
+    python precompute_explanations.py [--concurrency 4] [--topic tenses] [--force]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+
+from sqlalchemy import select, update
+
+from app.core.database import AsyncSessionLocal
+from app.models.grammar_topic import GrammarTopic
+from app.models.question_bank import QuestionBank
+from app.services.ai_providers import ai_service
+
+# Bump when OPTION_EXPLANATIONS_*_PROMPT changes so every item is regenerated
+PROMPT_VERSION = 1
+
+
+def content_hash(item) -> str:
+    """Hash of everything the generated explanations depend on."""
+    payload = json.dumps(
+        [PROMPT_VERSION, item.question_text, item.options, item.correct_answer, item.explanation],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def explain_item(item, digest: str, semaphore: asyncio.Semaphore) -> bool:
+    async with semaphore:
+        try:
+            option_explanations = await ai_service.explain_options(
+                item.question_text, item.options, item.correct_answer, item.explanation
+            )
+        except (RuntimeError, ValueError) as exc:
+            print(f"  FAIL #{item.id}: {exc}")
+            return False
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(QuestionBank)
+            .where(QuestionBank.id == item.id)
+            .values(option_explanations=option_explanations, explanations_hash=digest)
+        )
+        await db.commit()
+    return True
+
+
+async def precompute(concurrency: int, topic_slug: str | None, force: bool) -> None:
+    query = select(
+        QuestionBank.id,
+        QuestionBank.question_text,
+        QuestionBank.options,
+        QuestionBank.correct_answer,
+        QuestionBank.explanation,
+        QuestionBank.explanations_hash,
+    ).order_by(QuestionBank.id)
+    if topic_slug:
+        query = query.join(GrammarTopic).where(GrammarTopic.slug == topic_slug)
+
+    async with AsyncSessionLocal() as db:
+        items = list(await db.execute(query))
+
+    todo = []
+    for item in items:
+        digest = content_hash(item)
+        if force or item.explanations_hash != digest:
+            todo.append((item, digest))
+
+    print(f"{len(items)} bank questions, {len(items) - len(todo)} up to date, {len(todo)} to explain")
+    if not todo:
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = [asyncio.create_task(explain_item(item, digest, semaphore)) for item, digest in todo]
+    done = failed = 0
+    for next_done in asyncio.as_completed(tasks):
+        if await next_done:
+            done += 1
+        else:
+            failed += 1
+        if (done + failed) % 20 == 0:
+            print(f"  progress: {done + failed}/{len(todo)}")
+
+    print(f"\nDone. Explained {done} questions, {failed} failed (rerun to retry).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute wrong-option explanations for the question bank.")
+    parser.add_argument("--concurrency", type=int, default=4, help="max in-flight LLM calls")
+    parser.add_argument("--topic", help="only this topic slug")
+    parser.add_argument("--force", action="store_true", help="regenerate even unchanged items")
+    args = parser.parse_args()
+    asyncio.run(precompute(args.concurrency, args.topic, args.force))
@@ -0,0 +1,21 @@
+"""
+Rebuild the topic_performance rollup from full exam history.
+Run once after the f6a7b8c9d0e1 migration, or whenever the rollup needs repairing.
+Normal operation keeps it current from submit_exam.
+"""
+
+import asyncio
+
+from app.core.database import AsyncSessionLocal
+from app.services.analytics_service import AnalyticsService
+
+
+async def rebuild():
+    async with AsyncSessionLocal() as db:
+        topics = await AnalyticsService(db).rebuild_rollup()
+        await db.commit()
+        print(f"Rebuilt performance rollup for {topics} topics.")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
@@ -0,0 +1,90 @@
+"""
+Sync GrammarTopic.summary with the markdown files in content/topics/<slug>.md.
+
+Files are hashed and compared with each topic's stored summary_hash, so only
+changed topics are loaded and rewritten, all in one transaction. Assigning the
+summary re-renders its HTML sections (see GrammarTopic._render_summary).
+Safe to run on every deploy.
+
+    python sync_topic_summaries.py [--dir content/topics] [--dry-run]
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.grammar_topic import GrammarTopic
+from app.core.summary_renderer import summary_hash
+
+CONTENT_DIR = Path(__file__).parent / "content" / "topics"
+
+
+@dataclass
+class SyncReport:
+    changed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    # Files whose slug matches no topic (run seed.py first)
+    unknown: list[str] = field(default_factory=list)
+    # Topics without a file; their summary is left as is
+    missing: list[str] = field(default_factory=list)
+
+
+def read_summaries(directory: Path) -> dict[str, str]:
+    """{slug: summary markdown} for every <slug>.md in the directory."""
+    return {
+        path.stem: path.read_text(encoding="utf-8").strip()
+        for path in sorted(directory.glob("*.md"))
+    }
+
+
+async def sync_topic_summaries(
+    db: AsyncSession, directory: Path = CONTENT_DIR, dry_run: bool = False
+) -> SyncReport:
+    summaries = read_summaries(directory)
+    result = await db.execute(select(GrammarTopic.slug, GrammarTopic.summary_hash))
+    stored = dict(result.all())
+
+    report = SyncReport(
+        unknown=sorted(set(summaries) - set(stored)),
+        missing=sorted(set(stored) - set(summaries)),
+    )
+    for slug, summary in summaries.items():
+        if slug not in stored:
+            continue
+        if stored[slug] == summary_hash(summary):
+            report.unchanged.append(slug)
+        else:
+            report.changed.append(slug)
+
+    if report.changed and not dry_run:
+        result = await db.execute(select(GrammarTopic).where(GrammarTopic.slug.in_(report.changed)))
+        for topic in result.scalars():
+            topic.summary = summaries[topic.slug]
+        await db.commit()
+    return report
+
+
+async def main(directory: Path, dry_run: bool) -> None:
+    async with AsyncSessionLocal() as db:
+        report = await sync_topic_summaries(db, directory, dry_run)
+
+    verb = "Would update" if dry_run else "Updated"
+    print(f"{verb} {len(report.changed)} topic(s): {', '.join(report.changed) or '-'}")
+    print(f"Unchanged: {len(report.unchanged)}")
+    for slug in report.unknown:
+        print(f"  WARN: no topic for {slug}.md, skipping")
+    for slug in report.missing:
+        print(f"  WARN: no summary file for topic '{slug}'")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync topic summaries from markdown files.")
+    parser.add_argument("--dir", type=Path, default=CONTENT_DIR, help="directory of <slug>.md files")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    args = parser.parse_args()
+    asyncio.run(main(args.dir, args.dry_run))
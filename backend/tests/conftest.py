@@ -3,9 +3,10 @@ Shared test fixtures.
 Uses the real PostgreSQL database (running in Docker).
 - NullPool engine: each request gets a fresh connection (avoids asyncpg pool conflicts)
 - Session-scoped setup for efficiency; cleanup via docker exec at the end
-- OpenAI calls mocked for deterministic, cost-free tests
+- LLM calls mocked for deterministic, cost-free tests
 """
 
+import asyncio
 import logging
 import subprocess
 import pytest
@@ -13,10 +14,11 @@ import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.pool import NullPool
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, patch
 
 from app.main import app
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.core.config import settings
 
 # ---------------------------------------------------------------------------
@@ -78,6 +80,7 @@ async def client():
                 raise
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: test_session_factory
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
         yield c
@@ -89,19 +92,26 @@ async def client():
 
 @pytest.fixture
 def mock_generate():
-    """Patch generate_questions to return 5 deterministic questions."""
+    """Patch generate_questions and stream_questions to produce 5 deterministic questions."""
+    async def _stream(topic: str, num_questions: int, with_explanations: bool = False):
+        for q in MOCK_QUESTIONS_5[:num_questions]:
+            yield q
+
     with patch(
-        "app.services.exam_service.openai_service.generate_questions",
+        "app.services.ai_providers.ai_service.generate_questions",
         new_callable=AsyncMock,
         return_value=MOCK_QUESTIONS_5,
-    ) as m:
+    ) as m, patch(
+        "app.services.ai_providers.ai_service.stream_questions",
+        side_effect=_stream,
+    ):
         yield m
 
 
 @pytest.fixture
 def mock_grade():
-    """Patch grade_answers to return all-correct results."""
-    async def _grade(questions_with_answers: list[dict]) -> list[dict]:
+    """Patch grade_answers and stream_grades to return all-correct results."""
+    def _results(questions_with_answers: list[dict]) -> list[dict]:
         return [
             {
                 "question_id": q["question_id"],
@@ -111,8 +121,73 @@ def mock_grade():
             for q in questions_with_answers
         ]
 
+    async def _grade(questions_with_answers: list[dict]) -> list[dict]:
+        return _results(questions_with_answers)
+
+    async def _stream(questions_with_answers: list[dict]):
+        for result in _results(questions_with_answers):
+            yield result
+
     with patch(
-        "app.services.exam_service.openai_service.grade_answers",
+        "app.services.ai_providers.ai_service.grade_answers",
         side_effect=_grade,
-    ) as m:
+    ) as m, patch(
+        "app.services.ai_providers.ai_service.stream_grades",
+        side_effect=_stream,
+    ):
         yield m
+
+
+# ---------------------------------------------------------------------------
+# Fake provider streams for unit tests (no database needed)
+# ---------------------------------------------------------------------------
+
+
+def _make_question(text: str) -> dict:
+    return {
+        "question_text": text,
+        "options": {"A": "a", "B": "b", "C": "c", "D": "d"},
+        "correct_answer": "A",
+        "explanation": "Because.",
+    }
+
+
+@pytest.fixture
+def make_question():
+    """Factory for a valid generated question with the given text."""
+    return _make_question
+
+
+@pytest.fixture
+def counting_stream():
+    """Fake stream_questions yielding n numbered questions per call; `.calls` records each n."""
+    calls = []
+
+    async def fake(topic: str, n: int, with_explanations: bool = False):
+        calls.append(n)
+        call = len(calls)
+        for i in range(n):
+            yield _make_question(f"Question {call}-{i}")
+
+    fake.calls = calls
+    return fake
+
+
+@pytest.fixture
+def run_with_streams():
+    """asyncio.run(make_coro()) with fake provider streams patched in and retry backoff skipped."""
+    def run(make_coro, questions=None, grades=None):
+        with ExitStack() as stack:
+            stack.enter_context(patch("app.services.question_fanout.backoff_delay", return_value=0))
+            stack.enter_context(patch("app.services.llm_policy.backoff_delay", return_value=0))
+            if questions is not None:
+                stack.enter_context(
+                    patch("app.services.ai_providers.ai_service.stream_questions", side_effect=questions)
+                )
+            if grades is not None:
+                stack.enter_context(
+                    patch("app.services.ai_providers.ai_service.stream_grades", side_effect=grades)
+                )
+            return asyncio.run(make_coro())
+
+    return run
@@ -0,0 +1,37 @@
+"""Tests for GET /api/analytics/performance."""
+
+import pytest
+
+
+async def _topic_stats(client, topic_id: int) -> dict:
+    resp = await client.get("/api/analytics/performance")
+    assert resp.status_code == 200
+    return next(t for t in resp.json()["topics"] if t["topic_id"] == topic_id)
+
+
+@pytest.mark.asyncio
+async def test_performance_lists_every_topic(client):
+    resp = await client.get("/api/analytics/performance")
+    assert resp.status_code == 200
+    assert len(resp.json()["topics"]) == 12
+
+
+@pytest.mark.asyncio
+async def test_submit_updates_rollup(client, mock_generate, mock_grade):
+    topic_id = (await client.get("/api/topics")).json()[0]["id"]
+    before = await _topic_stats(client, topic_id)
+
+    session = (await client.post(
+        "/api/exams/generate", json={"topic_id": topic_id, "num_questions": 5}
+    )).json()
+    answers = {str(q["id"]): "A" for q in session["questions"]}
+    submitted = (await client.post(
+        f"/api/exams/{session['id']}/submit", json={"answers": answers}
+    )).json()
+
+    after = await _topic_stats(client, topic_id)
+    assert after["sessions_completed"] == before["sessions_completed"] + 1
+    assert after["total_questions"] == before["total_questions"] + 5
+    assert after["total_correct"] == before["total_correct"] + submitted["score"]
+    assert after["recent_scores"][-1] == round(submitted["score"] / 5 * 100, 1)
+    assert len(after["recent_scores"]) <= 5
@@ -0,0 +1,84 @@
+"""Tests for validating and de-duplicating AI-generated questions before they enter the bank."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.bank_harvester import BankHarvester, to_bank_row
+from app.services.near_duplicate_index import NearDuplicateIndex
+
+VALID = {
+    "question_text": " The report _____ yesterday. ",
+    "options": {"A": "was sent", "B": "sends", "C": "sending", "D": "has sent"},
+    "correct_answer": "A",
+    "explanation": "Passive past for a finished action.",
+    "difficulty": "easy",
+}
+
+
+def test_valid_question_becomes_bank_row():
+    row = to_bank_row(3, VALID)
+    assert row["topic_id"] == 3
+    assert row["question_text"] == "The report _____ yesterday."
+    assert row["difficulty"] == "easy"
+
+
+def test_unknown_difficulty_defaults_to_medium():
+    assert to_bank_row(3, {**VALID, "difficulty": "extreme"})["difficulty"] == "medium"
+
+
+def test_invalid_questions_are_rejected():
+    assert to_bank_row(3, {**VALID, "correct_answer": "E"}) is None
+    assert to_bank_row(3, {**VALID, "options": {"A": "x", "B": "y", "C": "z"}}) is None
+    assert to_bank_row(3, {**VALID, "explanation": ""}) is None
+    assert to_bank_row(3, {k: v for k, v in VALID.items() if k != "question_text"}) is None
+
+
+def test_paraphrase_is_a_near_duplicate():
+    index = NearDuplicateIndex()
+    index.add(1, "The annual report ______ by the accounting team every December.")
+    index.add(2, "By the time the manager arrived, the team ______ the presentation.")
+    assert index.find_duplicate("Every December, the annual report ______ by the accounting team.") == 1
+    assert index.find_duplicate("the annual  report ____ by the accounting team each december") == 1
+
+
+def test_different_question_is_not_a_duplicate():
+    index = NearDuplicateIndex()
+    index.add(1, "The annual report ______ by the accounting team every December.")
+    assert index.find_duplicate("Sales ______ steadily since we launched the new product line.") is None
+
+
+def _promote(harvester, questions, ids=None, committed=()):
+    """Run promote against a fake session; `committed` plays the bank rows already indexed."""
+    db = MagicMock()
+    if ids is None:
+        db.execute = AsyncMock(side_effect=RuntimeError("rolled back"))
+    else:
+        db.execute = AsyncMock(return_value=MagicMock(scalars=lambda: iter(ids)))
+    with (
+        patch("app.services.bank_harvester.question_bank_index.ensure_topic", AsyncMock()),
+        patch("app.services.bank_harvester.question_bank_index.payloads_since", return_value=committed),
+    ):
+        return asyncio.run(harvester.promote(db, 3, questions))
+
+
+def test_near_duplicates_within_a_batch_are_dropped():
+    first = {**VALID, "question_text": "The annual report ______ by the accounting team every December."}
+    paraphrase = {**VALID, "question_text": "Every December, the annual report ______ by the accounting team."}
+    other = {**VALID, "question_text": "Sales ______ steadily since we launched the new product line."}
+    assert _promote(BankHarvester(), [first, paraphrase, other], ids=[10, 11]) == [10, None, 11]
+
+
+def test_rolled_back_batch_leaves_shared_index_untouched():
+    harvester = BankHarvester()
+    with pytest.raises(RuntimeError):
+        _promote(harvester, [VALID])
+    assert len(harvester._indexes[3][0]) == 0
+    # The same question is still novel on the next try, and only enters the shared
+    # index once committed rows come back through the bank index
+    assert _promote(harvester, [VALID], ids=[10]) == [10]
+    assert len(harvester._indexes[3][0]) == 0
+    committed = ({"bank_question_id": 10, "question_text": VALID["question_text"]},)
+    assert _promote(harvester, [VALID], ids=[], committed=committed) == [None]
+    assert len(harvester._indexes[3][0]) == 1
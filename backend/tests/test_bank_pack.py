@@ -0,0 +1,48 @@
+"""Tests for the binary question bank pack (no database needed)."""
+
+import pytest
+
+from app.services.bank_pack import BankPack, build_pack
+
+QUESTION = {
+    "source_key": "tenses-001",
+    "question_text": "Doanh số ______ since March.",
+    "options": {"A": "rose", "B": "has risen", "C": "rises", "D": "rising"},
+    "correct_answer": "B",
+    "explanation": "'Since' signals present perfect.",
+    "difficulty": "medium",
+}
+
+
+def test_round_trip(tmp_path):
+    topics = {
+        "tenses": [QUESTION, {**QUESTION, "source_key": "tenses-002", "difficulty": "hard"}],
+        "articles": [],
+    }
+    path = tmp_path / "bank.pack"
+    build_pack(topics, path)
+
+    with BankPack(path) as pack:
+        assert pack.topics() == ["tenses", "articles"]
+        assert pack.count("tenses") == 2
+        assert pack.count("articles") == 0
+        assert pack.count("unknown") == 0
+        assert pack.question("tenses", 0) == QUESTION
+        assert pack.question("tenses", 1)["difficulty"] == "hard"
+        assert len(pack.sample("tenses", 5)) == 2
+        with pytest.raises(IndexError):
+            pack.question("tenses", 2)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bank.pack"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        BankPack(path)
+
+
+def test_rejects_truncated_files(tmp_path):
+    path = tmp_path / "bank.pack"
+    path.write_bytes(b"QBPK\x01\x00")
+    with pytest.raises(ValueError):
+        BankPack(path)
@@ -0,0 +1,117 @@
+"""Tests for the background bank refill worker: watermark, pacing and backoff (no database needed)."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.bank_refill_worker import BankRefillWorker
+
+
+def _worker(**overrides) -> BankRefillWorker:
+    params = dict(low_watermark=40, batch_size=10, scan_interval=300.0, min_call_interval=5.0, max_backoff=60.0)
+    return BankRefillWorker(**{**params, **overrides})
+
+
+def _session(rows=()):
+    """Stand-in for AsyncSessionLocal whose sessions return `rows` from execute."""
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=rows)
+    db.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    return session
+
+
+def test_only_topics_below_watermark_are_refilled():
+    worker = _worker()
+    rows = [(1, "Tenses", 5), (2, "Articles", 39), (3, "Modal verbs", 40)]
+    with (
+        patch("app.services.bank_refill_worker.AsyncSessionLocal", _session(rows)),
+        patch.object(worker, "_refill_topic", AsyncMock(return_value=3)) as refill,
+    ):
+        assert asyncio.run(worker.run_once()) == 6
+    assert [c.args for c in refill.call_args_list] == [(1, "Tenses", 5), (2, "Articles", 39)]
+
+
+def test_refill_asks_for_at_most_the_gap_to_the_watermark():
+    worker = _worker(min_call_interval=0)
+    refill = AsyncMock(return_value=[{}] * 4)
+    with (
+        patch("app.services.bank_refill_worker.AsyncSessionLocal", _session()),
+        patch("app.services.bank_refill_worker.ai_service.refill_questions", refill),
+        patch("app.services.bank_refill_worker.bank_harvester.promote", AsyncMock(return_value=[7, None, 8, 9])),
+        patch("app.services.bank_refill_worker.question_bank_index.refresh_topic", AsyncMock()),
+    ):
+        assert asyncio.run(worker._refill_topic(1, "Tenses", 36)) == 3
+    assert refill.call_args.args == ("Tenses", 4)
+
+
+def test_failed_topic_backs_off_and_is_skipped():
+    worker = _worker()
+    clock = MagicMock(monotonic=MagicMock(return_value=0.0))
+    with (
+        patch("app.services.bank_refill_worker.time", clock),
+        patch("app.services.bank_refill_worker.random.uniform", side_effect=lambda low, high: high),
+    ):
+        # Delay doubles per consecutive failure (5s * 2**n), capped at max_backoff
+        worker._fail(1, RuntimeError("rate limited"))
+        assert worker._backoff[1] == (1, 10.0)
+        worker._fail(1, RuntimeError("rate limited"))
+        assert worker._backoff[1] == (2, 20.0)
+        for _ in range(10):
+            worker._fail(1, RuntimeError("rate limited"))
+        assert worker._backoff[1] == (12, 60.0)
+
+        rows = [(1, "Tenses", 5), (2, "Articles", 5)]
+        with (
+            patch("app.services.bank_refill_worker.AsyncSessionLocal", _session(rows)),
+            patch.object(worker, "_refill_topic", AsyncMock(return_value=1)) as refill,
+        ):
+            asyncio.run(worker.run_once())
+    assert [c.args[0] for c in refill.call_args_list] == [2]
+
+
+def test_generation_error_and_empty_harvest_count_as_failures():
+    worker = _worker(min_call_interval=0)
+    with patch("app.services.bank_refill_worker.ai_service.refill_questions", AsyncMock(side_effect=RuntimeError)):
+        assert asyncio.run(worker._refill_topic(1, "Tenses", 0)) == 0
+    with (
+        patch("app.services.bank_refill_worker.AsyncSessionLocal", _session()),
+        patch("app.services.bank_refill_worker.ai_service.refill_questions", AsyncMock(return_value=[{}])),
+        patch("app.services.bank_refill_worker.bank_harvester.promote", AsyncMock(return_value=[None])),
+        patch("app.services.bank_refill_worker.question_bank_index.refresh_topic", AsyncMock()),
+    ):
+        assert asyncio.run(worker._refill_topic(1, "Tenses", 0)) == 0
+    assert worker._backoff[1][0] == 2
+
+
+def test_success_clears_backoff():
+    worker = _worker(min_call_interval=0)
+    worker._backoff[1] = (3, 0.0)
+    with (
+        patch("app.services.bank_refill_worker.AsyncSessionLocal", _session()),
+        patch("app.services.bank_refill_worker.ai_service.refill_questions", AsyncMock(return_value=[{}])),
+        patch("app.services.bank_refill_worker.bank_harvester.promote", AsyncMock(return_value=[5])),
+        patch("app.services.bank_refill_worker.question_bank_index.refresh_topic", AsyncMock()),
+    ):
+        assert asyncio.run(worker._refill_topic(1, "Tenses", 0)) == 1
+    assert 1 not in worker._backoff
+
+
+def test_calls_are_paced_by_min_call_interval():
+    worker = _worker(min_call_interval=5.0)
+    sleep = AsyncMock()
+    with (
+        patch("app.services.bank_refill_worker.asyncio.sleep", sleep),
+        patch(
+            "app.services.bank_refill_worker.time",
+            MagicMock(monotonic=MagicMock(side_effect=[100.0, 100.0, 102.0, 105.0])),
+        ),
+    ):
+        asyncio.run(worker._pace())
+        asyncio.run(worker._pace())
+    # The first call goes straight out; the second waits out the rest of the interval
+    assert [c.args[0] for c in sleep.call_args_list] == [3.0]
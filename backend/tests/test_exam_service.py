@@ -0,0 +1,78 @@
+"""Unit tests for ExamService paths that can run without the database."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.exam_service import ExamService
+
+
+def _question(question_id: int, explanation: str | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=question_id,
+        bank_question_id=100 + question_id,
+        correct_answer="A",
+        explanation=explanation,
+        user_answer=None,
+        is_correct=None,
+    )
+
+
+def _submit(questions: list, answers: dict[int, str]):
+    session = SimpleNamespace(status="in_progress", topic_id=1, questions=questions)
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=session)))
+    db.commit = AsyncMock()
+    with (
+        patch("app.services.exam_service.question_bank_index.ensure_topic", AsyncMock()),
+        patch(
+            "app.services.exam_service.question_bank_index.option_explanation",
+            return_value="B is the wrong tense.",
+        ),
+        patch("app.services.exam_service.AnalyticsService") as analytics,
+    ):
+        analytics.return_value.record_session = AsyncMock()
+        return asyncio.run(ExamService(db).submit_exam(1, answers))
+
+
+def test_why_wrong_is_appended_to_the_explanation():
+    session = _submit([_question(1, "Present perfect with 'since'.")], {1: "B"})
+    assert session.questions[0].explanation == "Present perfect with 'since'.\n\nB is the wrong tense."
+
+
+def test_why_wrong_without_explanation_does_not_store_none():
+    session = _submit([_question(1, None)], {1: "B"})
+    assert session.questions[0].explanation == "B is the wrong tense."
+
+
+def _generate(bank: list[dict], top_up):
+    db = MagicMock()
+    db.get = AsyncMock(return_value=SimpleNamespace(id=1, name="Tenses", slug="tenses"))
+    service = ExamService(db)
+    with (
+        patch.object(service, "_get_bank_questions", AsyncMock(return_value=list(bank))),
+        patch.object(service, "_persist_exam", AsyncMock(return_value="exam")) as persist,
+        patch("app.services.exam_service.topup_coalescer.top_up", side_effect=top_up),
+        patch("app.services.exam_service.bank_harvester.promote", AsyncMock(return_value=[])),
+    ):
+        return asyncio.run(service.generate_exam(1, 5)), persist
+
+
+async def _failing_top_up(*args, **kwargs):
+    raise RuntimeError("Groq API error: down")
+    yield
+
+
+def test_failed_top_up_serves_the_shorter_exam():
+    bank = [{"question_text": f"Bank {i}"} for i in range(2)]
+    response, persist = _generate(bank, _failing_top_up)
+    assert response == "exam"
+    topic, num_questions, questions = persist.call_args.args
+    assert num_questions == 2 and questions == bank
+
+
+def test_failed_top_up_with_empty_bank_raises():
+    with pytest.raises(RuntimeError):
+        _generate([], _failing_top_up)
@@ -24,6 +24,12 @@ async def _generate_exam(client, mock_generate, num_questions: int = 5) -> dict:
     return resp.json()
 
 
+async def _correct_answers(client, session_id: int) -> dict[str, str]:
+    """Read the answer key through the session detail endpoint."""
+    resp = await client.get(f"/api/exams/{session_id}")
+    return {str(q["id"]): q["correct_answer"] for q in resp.json()["questions"]}
+
+
 # ---------------------------------------------------------------------------
 # Generate
 # ---------------------------------------------------------------------------
@@ -91,6 +97,60 @@ async def test_submit_exam_returns_completed_session(client, mock_generate, mock
     assert data["completed_at"] is not None
 
 
+@pytest.mark.asyncio
+async def test_submit_exam_scores_locally(client, mock_generate):
+    """Score comes from stored answers, even when the LLM reports the opposite."""
+    session = await _generate_exam(client, mock_generate)
+    session_id = session["id"]
+    answers = await _correct_answers(client, session_id)
+
+    async def all_wrong(questions_with_answers):
+        for q in questions_with_answers:
+            yield {"question_id": q["question_id"], "is_correct": False, "explanation": "Wrong!"}
+
+    with patch("app.services.ai_providers.ai_service.stream_grades", side_effect=all_wrong):
+        resp = await client.post(f"/api/exams/{session_id}/submit", json={"answers": answers})
+    assert resp.status_code == 200
+    assert resp.json()["score"] == 5
+    assert all(q["is_correct"] for q in resp.json()["questions"])
+
+
+@pytest.mark.asyncio
+async def test_submit_exam_survives_provider_outage(client, mock_generate):
+    session = await _generate_exam(client, mock_generate)
+    session_id = session["id"]
+    answers = await _correct_answers(client, session_id)
+
+    with patch(
+        "app.services.ai_providers.ai_service.stream_grades",
+        side_effect=RuntimeError("Groq API error: timeout"),
+    ), patch("app.services.llm_policy.backoff_delay", return_value=0):
+        resp = await client.post(f"/api/exams/{session_id}/submit", json={"answers": answers})
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "completed"
+    assert resp.json()["score"] == 5
+
+
+@pytest.mark.asyncio
+async def test_submit_exam_stream_emits_score_first(client, mock_generate, mock_grade):
+    session = await _generate_exam(client, mock_generate)
+    session_id = session["id"]
+    answers = {str(q["id"]): "A" for q in session["questions"]}
+
+    resp = await client.post(f"/api/exams/{session_id}/submit/stream", json={"answers": answers})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        line.removeprefix("event: ")
+        for line in resp.text.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert events[0] == "score"
+    assert events[-1] == "done"
+    assert set(events[1:-1]) <= {"explanation"}
+
+
 @pytest.mark.asyncio
 async def test_submit_exam_reveals_correct_answers(client, mock_generate, mock_grade):
     session = await _generate_exam(client, mock_generate)
@@ -184,20 +244,12 @@ async def test_get_exam_not_found(client):
 
 @pytest.mark.asyncio
 async def test_review_returns_only_wrong_answers(client, mock_generate):
-    """With all-correct mock grading, review should return empty list."""
+    """Answering every question correctly leaves nothing to review."""
     session = await _generate_exam(client, mock_generate)
     session_id = session["id"]
-    answers = {str(q["id"]): "A" for q in session["questions"]}
-
-    # Submit with all-correct mock
-    async def all_correct(questions_with_answers):
-        return [
-            {"question_id": q["question_id"], "is_correct": True, "explanation": "Correct!"}
-            for q in questions_with_answers
-        ]
+    answers = await _correct_answers(client, session_id)
 
-    with patch("app.services.exam_service.openai_service.grade_answers", side_effect=all_correct):
-        await client.post(f"/api/exams/{session_id}/submit", json={"answers": answers})
+    await client.post(f"/api/exams/{session_id}/submit", json={"answers": answers})
 
     resp = await client.get(f"/api/exams/{session_id}/review")
     assert resp.status_code == 200
@@ -206,19 +258,13 @@ async def test_review_returns_only_wrong_answers(client, mock_generate):
 
 @pytest.mark.asyncio
 async def test_review_returns_wrong_questions(client, mock_generate):
-    """With all-wrong mock grading, review should return all questions."""
+    """Answering every question wrongly puts all of them up for review."""
     session = await _generate_exam(client, mock_generate)
     session_id = session["id"]
-    answers = {str(q["id"]): "B" for q in session["questions"]}
-
-    async def all_wrong(questions_with_answers):
-        return [
-            {"question_id": q["question_id"], "is_correct": False, "explanation": "Wrong!"}
-            for q in questions_with_answers
-        ]
+    correct = await _correct_answers(client, session_id)
+    answers = {qid: "A" if ans != "A" else "B" for qid, ans in correct.items()}
 
-    with patch("app.services.exam_service.openai_service.grade_answers", side_effect=all_wrong):
-        await client.post(f"/api/exams/{session_id}/submit", json={"answers": answers})
+    await client.post(f"/api/exams/{session_id}/submit", json={"answers": answers})
 
     resp = await client.get(f"/api/exams/{session_id}/review")
     assert resp.status_code == 200
@@ -0,0 +1,79 @@
+"""Tests for micro-batching of explanation requests (no database needed)."""
+
+import asyncio
+
+import pytest
+
+from app.core.prompt_encoding import payload_tokens
+from app.services.explanation_batcher import ExplanationBatcher
+
+
+def _item(question_id: int) -> dict:
+    return {
+        "question_id": question_id,
+        "question_text": "She ______ here since 2019.",
+        "options": {"A": "has lived", "B": "lives", "C": "is living", "D": "lived"},
+        "correct_answer": "A",
+        "user_answer": "B",
+    }
+
+
+@pytest.fixture
+def run(run_with_streams):
+    def run(batcher, fake, question_ids):
+        async def go():
+            return await asyncio.gather(*(batcher.explain(_item(i)) for i in question_ids))
+
+        return run_with_streams(go, grades=fake)
+
+    return run
+
+
+def test_concurrent_requests_share_one_call(run):
+    calls = []
+
+    async def fake(questions):
+        calls.append([q["question_id"] for q in questions])
+        for q in questions:
+            yield {"question_id": q["question_id"], "explanation": f"why {q['question_id']}"}
+
+    batcher = ExplanationBatcher(window_ms=5, max_tokens=10_000, max_items=50)
+    assert run(batcher, fake, [1, 2, 3]) == ["why 1", "why 2", "why 3"]
+    assert calls == [[1, 2, 3]]
+    assert batcher.stats()["avg_batch_size"] == 3.0
+
+
+def test_batch_is_sent_early_at_item_cap(run):
+    calls = []
+
+    async def fake(questions):
+        calls.append(len(questions))
+        for q in questions:
+            yield {"question_id": q["question_id"], "explanation": "ok"}
+
+    batcher = ExplanationBatcher(window_ms=1000, max_tokens=10_000, max_items=2)
+    assert run(batcher, fake, [1, 2, 3, 4]) == ["ok"] * 4
+    assert calls == [2, 2]
+    assert batcher.stats()["full_flushes"] == 2
+
+
+def test_token_budget_splits_batches(run):
+    calls = []
+
+    async def fake(questions):
+        calls.append(len(questions))
+        for q in questions:
+            yield {"question_id": q["question_id"], "explanation": "ok"}
+
+    # Only two items fit a batch
+    batcher = ExplanationBatcher(window_ms=5, max_tokens=2 * payload_tokens(_item(1)) + 1, max_items=50)
+    run(batcher, fake, [1, 2, 3])
+    assert calls == [2, 1]
+
+
+def test_unanswered_questions_resolve_to_none(run):
+    async def fake(questions):
+        yield {"question_id": 1, "explanation": "ok"}
+
+    batcher = ExplanationBatcher(window_ms=5, max_tokens=10_000, max_items=50)
+    assert run(batcher, fake, [1, 2]) == ["ok", None]
@@ -0,0 +1,30 @@
+"""Tests for explanation cache keys and the in-memory LRU tier (no database needed)."""
+
+import pytest
+
+from app.services.explanation_cache import ExplanationCache, explanation_cache_key
+
+OPTIONS = {"A": "completed", "B": "has completed", "C": "had completed", "D": "completes"}
+
+
+def test_key_ignores_whitespace_case_and_option_order():
+    key = explanation_cache_key("The manager _____ the report.", OPTIONS, "C", "A")
+    reordered = dict(reversed(list(OPTIONS.items())))
+    assert key == explanation_cache_key("  the MANAGER _____  the report. ", reordered, "c", "a")
+
+
+def test_key_depends_on_user_answer():
+    assert explanation_cache_key("Q", OPTIONS, "C", "A") != explanation_cache_key("Q", OPTIONS, "C", "B")
+    assert explanation_cache_key("Q", OPTIONS, "C", None) != explanation_cache_key("Q", OPTIONS, "C", "A")
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used():
+    cache = ExplanationCache(max_entries=2)
+    cache._remember("a", "A")
+    cache._remember("b", "B")
+    # Touch "a" so "b" becomes the eviction candidate
+    assert await cache.get_many(None, ["a"]) == {"a": ("A", "memory")}
+    cache._remember("c", "C")
+    assert list(cache._memory) == ["a", "c"]
+    assert cache.stats()["memory_hits"] == 1
@@ -0,0 +1,58 @@
+"""Tests for the fingerprint-keyed AI insights cache (no database needed)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.schemas.analytics import PerformanceResponse, TopicPerformance
+from app.services.insights_cache import InsightsCache, performance_fingerprint
+
+
+def _perf(sessions: int = 2, correct: int = 15) -> PerformanceResponse:
+    topic = TopicPerformance(
+        topic_id=1,
+        topic_name="Tenses",
+        slug="tenses",
+        sessions_completed=sessions,
+        total_questions=20,
+        total_correct=correct,
+        accuracy_pct=correct / 20 * 100,
+        avg_score_pct=correct / 20 * 100,
+        level="moderate",
+        trend="stable",
+        recent_scores=[75.0],
+    )
+    return PerformanceResponse(
+        topics=[topic],
+        total_sessions=sessions,
+        total_questions_answered=20,
+        overall_accuracy=correct / 20 * 100,
+        has_data=True,
+    )
+
+
+def test_fingerprint_changes_when_a_session_completes():
+    assert performance_fingerprint(_perf()) == performance_fingerprint(_perf())
+    assert performance_fingerprint(_perf()) != performance_fingerprint(_perf(sessions=3))
+    assert performance_fingerprint(_perf()) != performance_fingerprint(_perf(correct=16))
+
+
+def test_concurrent_refreshes_share_one_llm_call():
+    cache = InsightsCache()
+    perf = _perf()
+    fingerprint = performance_fingerprint(perf)
+
+    async def run():
+        with patch(
+            "app.services.insights_cache.ai_service.generate_insights",
+            new_callable=AsyncMock,
+            return_value={"overall_level": "Khá", "summary": "ok"},
+        ) as mock_llm:
+            results = await asyncio.gather(*(cache.refresh(fingerprint, perf) for _ in range(5)))
+            await asyncio.sleep(0)
+        return mock_llm.await_count, results
+
+    calls, results = asyncio.run(run())
+    assert calls == 1
+    assert all(r.overall_level == "Khá" for r in results)
+    assert cache.get(fingerprint).summary == "ok"
+    assert cache.latest().summary == "ok"
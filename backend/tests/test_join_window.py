@@ -0,0 +1,62 @@
+"""Tests for the shared join-window helper (no database needed)."""
+
+import asyncio
+
+from app.services.join_window import JoinWindows
+
+
+def _windows(sent: list, window_seconds: float = 0.005) -> JoinWindows:
+    async def send(batch: list) -> None:
+        sent.append(list(batch))
+
+    return JoinWindows(window_seconds, list, send)
+
+
+def test_callers_within_the_window_share_a_batch():
+    sent = []
+    windows = _windows(sent)
+
+    async def go():
+        windows.join("a").append(1)
+        windows.join("a").append(2)
+        windows.join("b").append(3)
+        await asyncio.sleep(0.02)
+
+    asyncio.run(go())
+    assert sorted(sent) == [[1, 2], [3]]
+    assert windows.flushes == 2
+
+
+def test_flush_sends_early_and_opens_a_fresh_window():
+    sent = []
+    windows = _windows(sent, window_seconds=10)
+
+    async def go():
+        windows.join().append(1)
+        assert windows.flush()
+        assert not windows.flush()
+        assert windows.current() is None
+        windows.join().append(2)
+        windows.flush()
+        await asyncio.sleep(0)
+
+    asyncio.run(go())
+    assert sent == [[1], [2]]
+
+
+def test_window_from_a_closed_loop_is_dropped():
+    sent = []
+    windows = _windows(sent, window_seconds=10)
+
+    async def open_window():
+        windows.join().append(1)
+
+    async def reuse():
+        assert windows.current() is None
+        windows.join().append(2)
+        windows.flush()
+        await asyncio.sleep(0)
+
+    asyncio.run(open_window())
+    asyncio.run(reuse())
+    assert sent == [[2]]
@@ -0,0 +1,69 @@
+"""Tests for incremental parsing of streamed JSON arrays (no database needed)."""
+
+import asyncio
+import json
+
+from app.services.json_stream import ArrayItemParser, collect_salvaged, loads_lenient, stream_array_items
+
+PAYLOAD = json.dumps({
+    "note": "a string with {braces}, [brackets] and \"questions\"",
+    "questions": [
+        {"question_text": "She ______ here since 2019.", "options": {"A": "has lived"}},
+        {"question_text": 'Escaped " quote } inside', "tags": ["x", {"y": 1}]},
+    ],
+    "results": [{"question_id": 9}],
+})
+
+
+def _feed_in_pieces(parser: ArrayItemParser, text: str, size: int) -> list[dict]:
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return items
+
+
+def test_yields_items_of_the_requested_key_only():
+    expected = json.loads(PAYLOAD)["questions"]
+    for size in (1, 3, 7, len(PAYLOAD)):
+        assert _feed_in_pieces(ArrayItemParser("questions"), PAYLOAD, size) == expected
+
+
+def test_item_is_yielded_as_soon_as_it_closes():
+    parser = ArrayItemParser("questions")
+    assert parser.feed('{"questions": [{"n": 1}') == [{"n": 1}]
+    assert parser.feed(', {"n": 2') == []
+    assert parser.feed('}, ') == [{"n": 2}]
+
+
+def test_truncated_response_keeps_valid_prefix():
+    truncated = PAYLOAD[:PAYLOAD.index("Escaped")]
+    items = _feed_in_pieces(ArrayItemParser("questions"), truncated, 5)
+    assert [q["question_text"] for q in items] == ["She ______ here since 2019."]
+
+
+def test_malformed_item_is_skipped():
+    parser = ArrayItemParser("results")
+    items = parser.feed('{"results": [{"id": 1}, {"id": 2 "x": 1}, {"id": 3}]}')
+    assert items == [{"id": 1}, {"id": 3}]
+    assert parser.skipped == 1
+
+
+def test_near_valid_item_is_repaired():
+    parser = ArrayItemParser("results")
+    items = parser.feed('{"results": [{"id": 1, "tags": ["a",],}, {"note": "line\nbreak"}]}')
+    assert items == [{"id": 1, "tags": ["a"]}, {"note": "line\nbreak"}]
+    assert parser.skipped == 0
+
+
+def test_loads_lenient_strips_fences_and_prose():
+    raw = 'Here you go:\n```json\n{"option_explanations": {"A": "x",},}\n```'
+    assert loads_lenient(raw) == {"option_explanations": {"A": "x"}}
+
+
+def test_collect_salvaged_keeps_prefix_of_failed_stream():
+    async def chunks():
+        yield '{"results": [{"id": 1}, '
+        raise RuntimeError("connection reset")
+
+    items = asyncio.run(collect_salvaged(stream_array_items(chunks(), "results")))
+    assert items == [{"id": 1}]
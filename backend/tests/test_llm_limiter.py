@@ -0,0 +1,135 @@
+"""Tests for the LLM bulkhead: priority limiter and circuit breaker (no database needed)."""
+
+import asyncio
+
+import pytest
+
+from app.services.llm_limiter import CircuitBreaker, LimiterRejected, PriorityLimiter
+
+
+def test_waiters_are_served_by_priority():
+    async def run():
+        limiter = PriorityLimiter(max_concurrent=1, max_queue=10)
+        order = []
+        gate = asyncio.Event()
+
+        async def call(priority, label):
+            async with limiter.slot(priority):
+                order.append(label)
+                await gate.wait()
+
+        holder = asyncio.create_task(call(0, "holder"))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(call(2, "insights")),
+            asyncio.create_task(call(1, "generate")),
+            asyncio.create_task(call(0, "grade")),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.stats()["queue_depth"] == 3
+        gate.set()
+        await asyncio.gather(holder, *waiters)
+        return order
+
+    assert asyncio.run(run()) == ["holder", "grade", "generate", "insights"]
+
+
+def test_full_queue_evicts_less_urgent_waiter():
+    async def run():
+        limiter = PriorityLimiter(max_concurrent=1, max_queue=1)
+        gate = asyncio.Event()
+
+        async def call(priority):
+            async with limiter.slot(priority):
+                await gate.wait()
+
+        holder = asyncio.create_task(call(0))
+        await asyncio.sleep(0)
+        low = asyncio.create_task(call(3))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(call(0))
+        await asyncio.sleep(0)
+        with pytest.raises(LimiterRejected):
+            await low
+        with pytest.raises(LimiterRejected):
+            await call(3)
+        gate.set()
+        await asyncio.gather(holder, high)
+        return limiter.stats()
+
+    stats = asyncio.run(run())
+    assert stats["evicted"] == 1
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
+
+
+def test_cancelled_waiter_leaves_queue():
+    async def run():
+        limiter = PriorityLimiter(max_concurrent=1, max_queue=5)
+        gate = asyncio.Event()
+
+        async def call():
+            async with limiter.slot(0):
+                await gate.wait()
+
+        holder = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await call()
+        assert limiter.stats()["queue_depth"] == 0
+        gate.set()
+        await holder
+        return limiter.stats()["in_flight"]
+
+    assert asyncio.run(run()) == 0
+
+
+def test_breaker_opens_then_probes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    # reset_timeout=0: immediately eligible for a single probe
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_open_breaker_blocks_calls():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+
+
+def test_evicted_then_cancelled_waiter_does_not_release_a_slot():
+    async def run():
+        limiter = PriorityLimiter(max_concurrent=1, max_queue=1)
+        gate = asyncio.Event()
+        inside = []
+
+        async def call(priority, label):
+            async with limiter.slot(priority):
+                inside.append(label)
+                await gate.wait()
+                inside.remove(label)
+
+        holder = asyncio.create_task(call(0, "holder"))
+        await asyncio.sleep(0)
+        low = asyncio.create_task(call(3, "low"))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(call(0, "high"))
+        await asyncio.sleep(0)
+        # Evicted, then cancelled before it gets to see the rejection
+        low.cancel()
+        await asyncio.gather(low, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert inside == ["holder"]
+        assert limiter.stats()["in_flight"] == 1
+        gate.set()
+        await asyncio.gather(holder, high)
+        return limiter.stats()["in_flight"]
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,74 @@
+"""Tests for LLM response validation, partial acceptance and retries (no database needed)."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.llm_policy import PolicyStats, backoff_delay, grade_with_policy, validate_question
+
+PAYLOAD = [{"question_id": i, "user_answer": "A"} for i in (1, 2, 3)]
+
+
+def _grade(fake, attempts=3):
+    stats = PolicyStats()
+    with (
+        patch("app.services.llm_policy.ai_service.stream_grades", side_effect=fake),
+        patch("app.services.llm_policy.backoff_delay", return_value=0),
+        patch("app.services.llm_policy.policy_stats", stats),
+    ):
+        return asyncio.run(grade_with_policy(PAYLOAD, attempts=attempts)), stats.stats()["grade_answers"]
+
+
+def test_backoff_is_jittered_and_capped():
+    delays = [backoff_delay(5, base=0.25, cap=2.0) for _ in range(50)]
+    assert all(0 <= d <= 2.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_validate_question_normalizes_and_rejects():
+    question = {
+        "question_text": "She ______ here.",
+        "options": {"A": "a", "B": "b", "C": "c", "D": "d"},
+        "correct_answer": "b.",
+        "difficulty": "tricky",
+    }
+    assert validate_question(question) == {**question, "correct_answer": "B", "difficulty": "medium"}
+    assert validate_question({**question, "options": {"A": "a", "B": "b"}}) is None
+    assert validate_question({**question, "correct_answer": "E"}) is None
+
+
+def test_only_missing_results_are_re_requested():
+    requested = []
+
+    async def fake(questions):
+        requested.append([q["question_id"] for q in questions])
+        for q in questions:
+            if q["question_id"] == 2 and len(requested) == 1:
+                yield {"question_id": 2, "explanation": ""}  # invalid: empty explanation
+            else:
+                yield {"question_id": q["question_id"], "explanation": "ok"}
+
+    graded, stats = _grade(fake)
+    assert sorted(graded) == [1, 2, 3]
+    assert requested == [[1, 2, 3], [2]]
+    assert stats["complete"] == 1 and stats["retries"] == 1 and stats["rejected_items"] == 1
+
+
+def test_results_before_a_failure_are_kept():
+    async def fake(questions):
+        yield {"question_id": questions[0]["question_id"], "explanation": "ok"}
+        raise RuntimeError("Groq API error: reset")
+
+    graded, stats = _grade(fake, attempts=2)
+    assert sorted(graded) == [1, 2]
+    assert stats["partial"] == 1 and stats["success_rate"] == 0.0
+
+
+def test_raises_when_nothing_graded():
+    async def fake(questions):
+        raise RuntimeError("Groq API error: down")
+        yield
+
+    with pytest.raises(RuntimeError):
+        _grade(fake)
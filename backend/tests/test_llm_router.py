@@ -0,0 +1,139 @@
+"""Tests for the latency-aware LLM router (no database or API keys needed)."""
+
+import asyncio
+
+import pytest
+
+from app.services.llm_limiter import CircuitBreaker
+from app.services.llm_router import LLMRouter
+
+
+class FakeProvider:
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def grade_answers(self, questions_with_answers):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [{"question_id": 1, "explanation": "ok"}]
+
+    async def stream_grades(self, questions_with_answers):
+        self.calls += 1
+        for question_id in (1, 2):
+            await asyncio.sleep(self.delay)
+            if self.error and question_id == 2:
+                raise self.error
+            yield {"question_id": question_id, "explanation": "ok"}
+
+
+def test_fails_over_to_next_provider():
+    broken, healthy = FakeProvider(error=RuntimeError("503")), FakeProvider()
+    router = LLMRouter({"a": broken, "b": healthy})
+    assert asyncio.run(router.grade_answers([])) == [{"question_id": 1, "explanation": "ok"}]
+    assert broken.calls == healthy.calls == 1
+    # The failure demotes the broken provider for the next call
+    assert router.ranked() == ["b", "a"]
+
+
+def test_timeout_counts_as_failure():
+    slow, fast = FakeProvider(delay=1.0), FakeProvider()
+    router = LLMRouter({"slow": slow, "fast": fast}, timeout=0.05)
+    asyncio.run(router.grade_answers([]))
+    assert router.stats()["slow"]["failures"] == 1
+    assert router.stats()["fast"]["failures"] == 0
+
+
+def test_prefers_lower_latency():
+    router = LLMRouter({"a": FakeProvider(delay=0.05), "b": FakeProvider(delay=0.0)})
+    router._record("a", 0.05, failed=False)
+    router._record("b", 0.01, failed=False)
+    assert router.ranked() == ["b", "a"]
+
+
+def test_raises_last_error_when_all_fail():
+    router = LLMRouter({
+        "a": FakeProvider(error=RuntimeError("down")),
+        "b": FakeProvider(error=ValueError("bad json")),
+    })
+    with pytest.raises((RuntimeError, ValueError)):
+        asyncio.run(router.grade_answers([]))
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+def test_stream_keeps_items_when_provider_fails_midway():
+    broken, healthy = FakeProvider(error=RuntimeError("reset")), FakeProvider()
+    router = LLMRouter({"a": broken, "b": healthy})
+    results = asyncio.run(_collect(router.stream_grades([])))
+    # No failover once an item has been handed out; the prefix is kept
+    assert [r["question_id"] for r in results] == [1]
+    assert healthy.calls == 0
+    assert router.stats()["a"]["failures"] == 1
+
+
+def test_stream_early_close_releases_slot():
+    router = LLMRouter({"a": FakeProvider()})
+
+    async def first_only():
+        stream = router.stream_grades([])
+        first = await anext(stream)
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(first_only())["question_id"] == 1
+    assert router.stats()["a"]["limiter"]["in_flight"] == 0
+    assert router.stats()["a"]["failures"] == 0
+
+
+def test_cancelled_probe_releases_half_open_circuit():
+    router = LLMRouter({"a": FakeProvider(delay=1.0)})
+    breaker = router._breakers["a"] = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    async def cancel_probe():
+        probe = asyncio.create_task(router.grade_answers([]))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+
+    asyncio.run(cancel_probe())
+    assert breaker.state == "half_open"
+    # The next call may probe again instead of the provider being skipped forever
+    assert breaker.allow() is True
+
+
+def test_cancelled_stream_probe_releases_half_open_circuit():
+    router = LLMRouter({"a": FakeProvider(delay=1.0)})
+    breaker = router._breakers["a"] = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    async def cancel_probe():
+        probe = asyncio.create_task(_collect(router.stream_grades([])))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+
+    asyncio.run(cancel_probe())
+    assert breaker.allow() is True
+
+
+def test_refill_runs_as_lowest_priority_generation():
+    calls = []
+
+    class Provider:
+        async def generate_questions(self, topic, num_questions, with_explanations=False):
+            calls.append((topic, num_questions, with_explanations))
+            return []
+
+    router = LLMRouter({"a": Provider()})
+    asyncio.run(router.refill_questions("Tenses", 5))
+    assert calls == [("Tenses", 5, True)]
+    by_priority = router.stats()["a"]["limiter"]["by_priority"]
+    assert list(by_priority)[-1] == "refill_questions"
+    assert by_priority["refill_questions"]["admitted"] == 1
@@ -0,0 +1,45 @@
+"""Tests for compact prompt encoding (no database needed)."""
+
+import json
+
+from app.core.prompt_encoding import (
+    count_tokens,
+    encode_grading_row,
+    encode_options,
+    grading_prompt,
+    option_explanations_prompt,
+)
+
+ITEM = {
+    "question_id": 7,
+    "question_text": "The report | was ______\nby Friday.",
+    "options": {"B": "finish", "A": "finished", "C": "finishing; done", "D": "finishes"},
+    "correct_answer": "A",
+    "user_answer": "No answer",
+}
+
+
+def test_options_are_positional_and_sanitized():
+    assert encode_options(ITEM["options"]) == "finished;finish;finishing, done;finishes"
+
+
+def test_grading_row_keeps_only_what_the_model_needs():
+    assert encode_grading_row(ITEM) == "7|The report was ______ by Friday.|finished;finish;finishing, done;finishes|A|-"
+    assert encode_grading_row({**ITEM, "user_answer": "C"}).endswith("|A|C")
+
+
+def test_grading_prompt_has_one_row_per_question():
+    _, user = grading_prompt([ITEM, {**ITEM, "question_id": 8}])
+    rows = user.splitlines()[1:]
+    assert [row.split("|")[0] for row in rows] == ["7", "8"]
+
+
+def test_option_explanations_prompt_lists_wrong_options():
+    _, user, wrong = option_explanations_prompt("Q ______.", ITEM["options"], "A", "Past simple.")
+    assert wrong == ["B", "C", "D"]
+    assert "Explain: B,C,D" in user
+
+
+def test_compact_grading_is_smaller_than_indented_json():
+    legacy = json.dumps([ITEM] * 10, ensure_ascii=False, indent=2)
+    assert count_tokens(grading_prompt([ITEM] * 10)[1]) < count_tokens(legacy) / 2
@@ -0,0 +1,87 @@
+"""Tests that provider streams are closed when the consumer stops early (no API keys needed)."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.gemini_service import GeminiService
+from app.services.groq_service import GroqService
+
+QUESTIONS = json.dumps({"questions": [
+    {"question_text": f"Question {i} ______.", "options": {"A": "a", "B": "b", "C": "c", "D": "d"},
+     "correct_answer": "A"}
+    for i in range(3)
+]})
+
+
+def _pieces(text: str, size: int = 16) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class _FakeGroqStream:
+    """Mimics groq.AsyncStream: async iterable, async context manager, close()."""
+
+    def __init__(self, text: str):
+        self.chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+            for piece in _pieces(text)
+        ]
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class _FakeGeminiIterator:
+    def __init__(self, text: str):
+        self._pieces = iter(_pieces(text))
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            piece = next(self._pieces)
+        except StopIteration:
+            raise StopAsyncIteration
+        return SimpleNamespace(parts=[piece], text=piece)
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_groq_stream_is_closed_when_consumer_stops_early():
+    fake = _FakeGroqStream(QUESTIONS)
+    service = GroqService()
+    service._client = MagicMock()
+    service._client.chat.completions.create = AsyncMock(return_value=fake)
+
+    questions = asyncio.run(service.generate_questions("Tenses", 1))
+    assert [q["question_text"] for q in questions] == ["Question 0 ______."]
+    assert fake.closed
+
+
+def test_gemini_stream_is_closed_when_consumer_stops_early():
+    iterator = _FakeGeminiIterator(QUESTIONS)
+    # Like AsyncGenerateContentResponse: iterates over the transport iterator it wraps
+    response = type("Response", (), {"_iterator": iterator, "__aiter__": lambda self: iterator})()
+    service = GeminiService()
+    service._genai = MagicMock()
+    model = MagicMock(generate_content_async=AsyncMock(return_value=response))
+    service._models = MagicMock(get=MagicMock(return_value=model))
+
+    questions = asyncio.run(service.generate_questions("Tenses", 1))
+    assert len(questions) == 1
+    assert iterator.closed
@@ -0,0 +1,115 @@
+"""Tests for the in-memory question bank index (no database needed)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.bank_pack import build_pack
+from app.services.question_bank_index import QuestionBankIndex, _build_bucket
+
+
+def _rows(topic_id: int, count: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=i,
+            topic_id=topic_id,
+            question_text=f"Question {i}",
+            options={"A": "a", "B": "b", "C": "c", "D": "d"},
+            correct_answer="A",
+            explanation=f"Explanation {i}",
+            option_explanations={"B": f"B is wrong in {i}"},
+            explanations_hash="h",
+            content_hash=f"{i:08x}" + "0" * 56,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _index_with(topic_id: int, count: int) -> QuestionBankIndex:
+    index = QuestionBankIndex()
+    index._buckets[topic_id] = _build_bucket(_rows(topic_id, count))
+    return index
+
+
+def test_sample_returns_distinct_questions():
+    index = _index_with(1, 50)
+    sample = index.sample(1, 10)
+    assert len(sample) == 10
+    assert len({q["question_text"] for q in sample}) == 10
+
+
+def test_sample_caps_at_bank_size():
+    index = _index_with(1, 3)
+    assert len(index.sample(1, 10)) == 3
+
+
+def test_sample_unknown_topic_is_empty():
+    index = _index_with(1, 3)
+    assert index.sample(2, 5) == []
+
+
+def test_sample_returns_copies():
+    index = _index_with(1, 1)
+    index.sample(1, 1)[0]["explanation"] = "mutated"
+    assert index.sample(1, 1)[0]["explanation"] == "Explanation 1"
+
+
+def test_empty_bucket_signature():
+    bucket = _build_bucket([])
+    assert len(bucket.ids) == 0
+    assert bucket.signature == (0, 0, 0, 0)
+
+
+def test_signature_tracks_content_edits():
+    rows = _rows(1, 3)
+    before = _build_bucket(rows).signature
+    rows[1].content_hash = "ffffffff" + "0" * 56
+    assert _build_bucket(rows).signature != before
+
+
+def test_option_explanation_lookup():
+    index = _index_with(1, 20)
+    assert index.option_explanation(1, 7, "B") == "B is wrong in 7"
+    assert index.option_explanation(1, 7, "C") is None
+    assert index.option_explanation(1, 99, "B") is None
+    assert index.option_explanation(2, 7, "B") is None
+
+
+def test_pack_serves_samples_until_load(tmp_path):
+    path = tmp_path / "bank.pack"
+    build_pack({"tenses": [{
+        "source_key": "tenses-001",
+        "question_text": "Sales ______ since March.",
+        "options": {"A": "rose", "B": "have risen", "C": "rise", "D": "rising"},
+        "correct_answer": "B",
+        "explanation": "'Since' signals present perfect.",
+        "difficulty": "medium",
+    }]}, path)
+    index = QuestionBankIndex()
+    assert not index.open_pack(tmp_path / "missing.pack")
+    assert index.open_pack(path) and index.warming_up
+    [question] = index.sample_pack("tenses", 5)
+    assert question["bank_question_id"] is None
+    assert question["correct_answer"] == "B"
+    assert index.sample_pack("articles", 5) == []
+
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=_rows(1, 3))
+    asyncio.run(index.load(db))
+    assert not index.warming_up
+    assert index.sample_pack("tenses", 5) == []
+    assert index.size(1) == 3
+
+
+def test_failed_load_still_drops_pack(tmp_path):
+    path = tmp_path / "bank.pack"
+    build_pack({"tenses": []}, path)
+    index = QuestionBankIndex()
+    assert index.open_pack(path)
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=ConnectionError("database down"))
+    with pytest.raises(ConnectionError):
+        asyncio.run(index.load(db))
+    assert not index.warming_up
@@ -0,0 +1,101 @@
+"""Tests for chunked, concurrent, streamed AI question generation (no database needed)."""
+
+import asyncio
+
+import pytest
+
+from app.services.question_fanout import _chunks, stream_questions_fanout
+
+
+@pytest.fixture
+def run(run_with_streams):
+    def run(fake, count, **kwargs):
+        async def collect():
+            stream = stream_questions_fanout("Tenses", count, chunk_size=5, max_rounds=2, **kwargs)
+            return [q async for q in stream]
+
+        return run_with_streams(collect, questions=fake)
+
+    return run
+
+
+def test_chunks_are_near_equal():
+    assert _chunks(20, 5) == [5, 5, 5, 5]
+    assert _chunks(12, 5) == [4, 4, 4]
+    assert _chunks(3, 5) == [3]
+
+
+def test_requests_run_concurrently_and_fill_count(run, counting_stream):
+    questions = run(counting_stream, 20)
+    assert counting_stream.calls == [5, 5, 5, 5]
+    assert len(questions) == 20
+
+
+def test_failed_chunk_is_topped_up(run, make_question):
+    calls = []
+
+    async def fake(topic, n, with_explanations=False):
+        calls.append(n)
+        call = len(calls)
+        if call == 2:
+            raise RuntimeError("Groq API error: 503")
+        for i in range(n):
+            yield make_question(f"Question {call}-{i}")
+
+    questions = run(fake, 10)
+    assert len(questions) == 10
+    # Second round only asks for the chunk that failed
+    assert calls == [5, 5, 5]
+
+
+def test_duplicates_across_chunks_and_exam_are_removed(run, make_question):
+    async def fake(topic, n, with_explanations=False):
+        yield make_question("The report ______ yesterday.")
+        yield make_question("Bank question ______ here.")
+
+    questions = run(fake, 4, exclude_texts=["bank question ____ here"])
+    assert [q["question_text"] for q in questions] == ["The report ______ yesterday."]
+
+
+def test_total_failure_raises_provider_error(run):
+    async def fake(topic, n, with_explanations=False):
+        raise RuntimeError("Groq API error: down")
+        yield
+
+    with pytest.raises(RuntimeError):
+        run(fake, 5)
+
+
+def test_chunk_failing_midway_keeps_its_questions(run, make_question):
+    calls = []
+
+    async def fake(topic, n, with_explanations=False):
+        calls.append(n)
+        call = len(calls)
+        yield make_question(f"Question {call}-0")
+        if call == 1:
+            raise RuntimeError("Groq API error: connection reset")
+        for i in range(1, n):
+            yield make_question(f"Question {call}-{i}")
+
+    questions = run(fake, 5)
+    assert len(questions) == 5
+    assert questions[0]["question_text"] == "Question 1-0"
+    # The top-up round only asks for the four lost to the broken stream
+    assert calls == [5, 4]
+
+
+def test_stops_outstanding_chunks_once_count_is_reached(run, make_question):
+    closed = []
+
+    async def fake(topic, n, with_explanations=False):
+        try:
+            for i in range(n + 3):
+                yield make_question(f"Question {n}-{i}")
+                await asyncio.sleep(0)
+        finally:
+            closed.append(n)
+
+    questions = run(fake, 5)
+    assert len(questions) == 5
+    assert closed == [5]
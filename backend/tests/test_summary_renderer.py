@@ -0,0 +1,58 @@
+"""Tests for server-side summary rendering (no database needed)."""
+
+from app.models.grammar_topic import GrammarTopic
+from app.core.summary_renderer import render_markdown, render_summary
+
+TABLE = """| Mạo từ | Khi nào dùng |
+|--------|-------------|
+| **a** | phụ âm |
+| **an** | nguyên âm |"""
+
+
+def test_custom_boxes():
+    html = render_markdown(":::tip\nUse **the** here.\n:::")
+    assert html == '<div class="tip-box"><strong>💡 Mẹo:</strong> Use <strong>the</strong> here.</div>'
+    assert 'class="example-box"' in render_markdown(":::example\n- I met a girl.\n:::")
+    assert 'class="warning-box"' in render_markdown(":::warning\nCareful.\n:::")
+
+
+def test_table_header_and_separator():
+    html = render_markdown(TABLE)
+    assert html.startswith('<div class="table-wrapper"><table><thead><tr><th>Mạo từ</th>')
+    assert "<td><strong>an</strong></td><td>nguyên âm</td>" in html
+    assert "---" not in html
+
+
+def test_headings_lists_and_paragraphs():
+    html = render_markdown("## Title\n\nSome *text* and `code`.\n\n- one\n- two")
+    assert html.splitlines() == [
+        "<h2>Title</h2>",
+        "<p>Some <em>text</em> and <code>code</code>.</p>",
+        "<ul><li>one</li>",
+        "<li>two</li></ul>",
+    ]
+
+
+def test_render_summary_per_section():
+    sections = render_summary("## A\n\nFirst.\n\n## B\n\nSecond.", "Topic")
+    assert [s["title"] for s in sections] == ["A", "B"]
+    assert sections[1]["html"] == "<h2>B</h2>\n<p>Second.</p>"
+
+
+def test_topic_renders_only_when_summary_changes():
+    topic = GrammarTopic(name="Articles", slug="articles", description="", summary="## A\n\nText.")
+    first_hash = topic.summary_hash
+    assert topic.summary_sections[0]["title"] == "A"
+    assert topic.refresh_rendered_summary() is False
+
+    topic.summary = "## B\n\nOther."
+    assert topic.summary_hash != first_hash
+    assert topic.summary_sections[0]["title"] == "B"
+
+
+def test_clearing_summary_clears_rendered_sections():
+    topic = GrammarTopic(name="Articles", slug="articles", description="", summary="## A\n\nText.")
+    topic.summary = None
+    assert topic.summary_sections is None
+    assert topic.summary_hash is None
+    assert topic.refresh_rendered_summary() is False
@@ -0,0 +1,42 @@
+"""Tests for splitting topic summaries into sections (no database needed)."""
+
+from app.core.topic_sections import split_sections
+
+SUMMARY = """## Articles
+
+> Intro line.
+
+---
+
+## 1. A / AN
+
+Text about a/an.
+
+### Subheading stays inside
+
+```
+## not a heading
+```
+
+## 2. THE
+
+Text about the."""
+
+
+def test_split_on_level_two_headings():
+    sections = split_sections(SUMMARY, "Fallback")
+    assert [s.title for s in sections] == ["Articles", "1. A / AN", "2. THE"]
+    assert [s.index for s in sections] == [0, 1, 2]
+    assert sections[1].markdown.startswith("## 1. A / AN")
+    assert "### Subheading stays inside" in sections[1].markdown
+    assert "## not a heading" in sections[1].markdown
+
+
+def test_leading_text_uses_fallback_title():
+    sections = split_sections("Preamble.\n\n## First\n\nBody", "Topic name")
+    assert [s.title for s in sections] == ["Topic name", "First"]
+
+
+def test_empty_summary_has_no_sections():
+    assert split_sections(None, "x") == []
+    assert split_sections("  \n", "x") == []
@@ -26,3 +26,44 @@ async def test_list_topics_ordered_by_name(client):
     resp = await client.get("/api/topics")
     names = [t["name"] for t in resp.json()]
     assert names == sorted(names)
+
+
+@pytest.mark.asyncio
+async def test_list_topics_sends_etag(client):
+    resp = await client.get("/api/topics")
+    assert resp.headers["etag"].startswith('"')
+    assert resp.headers["cache-control"] == "public, no-cache"
+
+
+@pytest.mark.asyncio
+async def test_list_topics_not_modified(client):
+    etag = (await client.get("/api/topics")).headers["etag"]
+    resp = await client.get("/api/topics", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_list_topics_omits_summary(client):
+    topic = (await client.get("/api/topics")).json()[0]
+    assert "summary" not in topic
+
+
+@pytest.mark.asyncio
+async def test_topic_detail_has_toc_and_sections(client):
+    slug = (await client.get("/api/topics")).json()[0]["slug"]
+    resp = await client.get(f"/api/topics/{slug}")
+    assert resp.status_code == 200
+    detail = resp.json()
+    assert detail["slug"] == slug
+    for entry in detail["toc"]:
+        section = await client.get(f"/api/topics/{slug}/sections/{entry['index']}")
+        assert section.status_code == 200
+        assert section.json()["title"] == entry["title"]
+
+
+@pytest.mark.asyncio
+async def test_topic_detail_unknown_slug(client):
+    assert (await client.get("/api/topics/no-such-topic")).status_code == 404
+    assert (await client.get("/api/topics/no-such-topic/sections/0")).status_code == 404
@@ -0,0 +1,70 @@
+"""Tests for single-flight coalescing of AI top-ups (no database needed)."""
+
+import asyncio
+
+import pytest
+
+from app.services.topup_coalescer import TopUpCoalescer
+
+
+@pytest.fixture
+def run(run_with_streams):
+    def run(coalescer, fake, demands, topic_ids=None):
+        async def one(topic_id, count):
+            return [q["question_text"] async for q in coalescer.top_up(topic_id, "Tenses", count)]
+
+        async def go():
+            return await asyncio.gather(
+                *(one(topic_id, count) for topic_id, count in zip(topic_ids or [1] * len(demands), demands)),
+                return_exceptions=True,
+            )
+
+        return run_with_streams(go, questions=fake)
+
+    return run
+
+
+def test_concurrent_callers_share_one_generation_with_disjoint_slices(run, counting_stream):
+    coalescer = TopUpCoalescer(window_ms=10, max_demand=100)
+    results = run(coalescer, counting_stream, [3, 3, 4])
+
+    assert [len(r) for r in results] == [3, 3, 4]
+    served = [text for r in results for text in r]
+    assert len(set(served)) == 10
+    # One flight sized to the combined demand (split into chunks by the fan-out)
+    assert sum(counting_stream.calls) == 10
+    assert coalescer.stats()["flights"] == 1
+
+
+def test_topics_do_not_share_flights(run, counting_stream):
+    coalescer = TopUpCoalescer(window_ms=10, max_demand=100)
+    run(coalescer, counting_stream, [2, 2], topic_ids=[1, 2])
+    assert coalescer.stats()["flights"] == 2
+
+
+def test_demand_cap_starts_a_new_flight(run, counting_stream):
+    coalescer = TopUpCoalescer(window_ms=10, max_demand=5)
+    results = run(coalescer, counting_stream, [3, 3])
+    assert [len(r) for r in results] == [3, 3]
+    assert coalescer.stats()["flights"] == 2
+
+
+def test_short_generation_is_dealt_round_robin(run, make_question):
+    async def fake(topic, n, with_explanations=False):
+        for i in range(3):
+            yield make_question(f"Only {i}")
+
+    coalescer = TopUpCoalescer(window_ms=10, max_demand=100)
+    results = run(coalescer, fake, [2, 2])
+    # Both callers get a share of what was generated
+    assert sorted(len(r) for r in results) == [1, 2]
+
+
+def test_failure_reaches_every_caller(run):
+    async def fake(topic, n, with_explanations=False):
+        raise RuntimeError("Groq API error: down")
+        yield
+
+    coalescer = TopUpCoalescer(window_ms=10, max_demand=100)
+    results = run(coalescer, fake, [2, 2])
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -2,7 +2,17 @@
  * Axios API client: all calls go to /api (proxied to FastAPI on port 8000)
  */
 import axios, { type AxiosError } from 'axios'
-import type { Topic, ExamSession, ExamHistoryItem, Question, PerformanceResponse, PerformanceInsight } from '@/types'
+import type {
+  Topic,
+  TopicDetail,
+  TopicSection,
+  ExamSession,
+  ExamHistoryItem,
+  ExplanationEvent,
+  Question,
+  PerformanceResponse,
+  PerformanceInsight,
+} from '@/types'
 
 const http = axios.create({
   baseURL: '/api',
@@ -35,12 +45,65 @@ http.interceptors.response.use(
   },
 )
 
+export interface SubmitStreamHandlers {
+  onScore: (session: ExamSession) => void
+  onExplanation: (event: ExplanationEvent) => void
+}
+
+/**
+ * POST + Server-Sent Events: EventSource only supports GET, so the stream is read with fetch.
+ * Resolves when the server sends `done` (or closes the stream).
+ */
+async function submitExamStream(
+  sessionId: number,
+  answers: Record<number, string>,
+  handlers: SubmitStreamHandlers,
+): Promise<void> {
+  const response = await fetch(`/api/exams/${sessionId}/submit/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ answers }),
+  })
+  if (!response.ok || !response.body) {
+    const body = await response.json().catch(() => ({}))
+    const detail = typeof body.detail === 'string' ? body.detail : null
+    throw new Error(detail ?? `Lỗi ${response.status}: Đã xảy ra lỗi không xác định.`)
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffer = ''
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) return
+    buffer += value
+    // Events are separated by a blank line
+    let boundary: number
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const raw = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      const event = raw.match(/^event: (.+)$/m)?.[1]
+      const data = raw.match(/^data: (.+)$/m)?.[1] ?? '{}'
+      if (event === 'score') handlers.onScore(JSON.parse(data) as ExamSession)
+      else if (event === 'explanation') handlers.onExplanation(JSON.parse(data) as ExplanationEvent)
+      else if (event === 'done') return
+    }
+  }
+}
+
 export const api = {
   // Topics
   getTopics(): Promise<Topic[]> {
     return http.get<Topic[]>('/topics').then((r) => r.data)
   },
 
+  getTopic(slug: string): Promise<TopicDetail> {
+    return http.get<TopicDetail>(`/topics/${slug}`).then((r) => r.data)
+  },
+
+  getTopicSection(slug: string, index: number): Promise<TopicSection> {
+    return http.get<TopicSection>(`/topics/${slug}/sections/${index}`).then((r) => r.data)
+  },
+
   // Exams
   generateExam(topicId: number, numQuestions: number): Promise<ExamSession> {
     return http
@@ -54,6 +117,8 @@ export const api = {
       .then((r) => r.data)
   },
 
+  submitExamStream,
+
   getHistory(): Promise<ExamHistoryItem[]> {
     return http.get<ExamHistoryItem[]>('/exams/history').then((r) => r.data)
   },
@@ -5,7 +5,7 @@
 import { defineStore } from 'pinia'
 import { ref } from 'vue'
 import { api } from '@/services/api'
-import type { ExamSession, Topic, ExamHistoryItem, Question } from '@/types'
+import type { ExamSession, Topic, ExamHistoryItem, ExplanationEvent, Question } from '@/types'
 
 export const useExamStore = defineStore(
   'exam',
@@ -17,6 +17,8 @@ export const useExamStore = defineStore(
     const history = ref<ExamHistoryItem[]>([])
     const reviewQuestions = ref<Question[]>([])
     const loading = ref(false)
+    // True while explanations are still streaming in after the score arrived
+    const explaining = ref(false)
     const error = ref<string | null>(null)
 
     // Actions
@@ -52,12 +54,29 @@ export const useExamStore = defineStore(
       userAnswers.value[questionId] = answer
     }
 
+    /**
+     * Resolves as soon as the score arrives; explanations keep streaming into
+     * currentSession afterwards while `explaining` is true.
+     */
     async function submitExam(sessionId: number): Promise<boolean> {
       loading.value = true
       error.value = null
+      explaining.value = true
       try {
-        const result = await api.submitExam(sessionId, userAnswers.value)
-        currentSession.value = result
+        await new Promise<void>((resolve, reject) => {
+          api
+            .submitExamStream(sessionId, userAnswers.value, {
+              onScore: (session) => {
+                currentSession.value = session
+                resolve()
+              },
+              onExplanation: applyExplanation,
+            })
+            .then(resolve, reject)
+            .finally(() => {
+              explaining.value = false
+            })
+        })
         return true
       } catch (e: unknown) {
         error.value = getErrorMessage(e)
@@ -67,6 +86,11 @@ export const useExamStore = defineStore(
       }
     }
 
+    function applyExplanation(event: ExplanationEvent) {
+      const question = currentSession.value?.questions.find((q) => q.id === event.question_id)
+      if (question) question.explanation = event.explanation
+    }
+
     async function fetchHistory() {
       loading.value = true
       error.value = null
@@ -114,6 +138,7 @@ export const useExamStore = defineStore(
       history,
       reviewQuestions,
       loading,
+      explaining,
       error,
       fetchTopics,
       startExam,
@@ -3,7 +3,21 @@ export interface Topic {
   name: string
   slug: string
   description: string
-  summary?: string | null
+}
+
+export interface TopicSectionHeading {
+  index: number
+  title: string
+}
+
+export interface TopicSection extends TopicSectionHeading {
+  // Rendered on the server from the summary markdown
+  html: string
+}
+
+export interface TopicDetail extends Topic {
+  toc: TopicSectionHeading[]
+  first_section: TopicSection | null
 }
 
 export interface Question {
@@ -29,6 +43,12 @@ export interface ExamSession {
   questions: Question[]
 }
 
+export interface ExplanationEvent {
+  question_id: number
+  explanation: string
+  source: 'cache' | 'llm'
+}
+
 export interface TopicPerformance {
   topic_id: number
   topic_name: string